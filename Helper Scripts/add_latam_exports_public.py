@@ -13,6 +13,7 @@ import argparse
 import json
 import os
 import sys
+from pathlib import Path
 
 try:
     import boto3
@@ -22,6 +23,8 @@ except ImportError:
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_DIR = os.path.dirname(BASE_DIR)
+sys.path.insert(0, REPO_DIR)
+from ugc_tools.env import load_env_default  # noqa: E402
 
 BUCKET = "latam-ai.filmmaker"
 
@@ -32,35 +35,10 @@ PUBLIC_PREFIXES = [
 ]
 
 
-def load_env_from_dotenv() -> None:
-    """Load .env into os.environ (AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, etc.)."""
-    candidates = [
-        os.path.join(REPO_DIR, ".env"),
-        os.path.join(os.path.dirname(REPO_DIR), ".env"),
-        os.path.join(os.getcwd(), ".env"),
-    ]
-    for path in candidates:
-        if not os.path.exists(path):
-            continue
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
-                        continue
-                    key, value = line.split("=", 1)
-                    key, value = key.strip(), value.strip().strip('"').strip("'")
-                    if key and key not in os.environ:
-                        os.environ[key] = value
-        except OSError:
-            pass
-        break
-
-
 def main():
     from botocore.exceptions import ClientError, NoCredentialsError
 
-    load_env_from_dotenv()
+    load_env_default(Path(REPO_DIR))
 
     parser = argparse.ArgumentParser(description="Add public read to LATAM S3 prefixes")
     parser.add_argument("--outputs-only", action="store_true", help="Only add LATAM/Outputs/")
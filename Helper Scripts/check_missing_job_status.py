@@ -2,10 +2,16 @@
 """Check RunPod job status for the 14 missing user outputs."""
 
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import requests
 
-REPO = Path("/Users/marianotinti/Desktop/UGC EDITOR/Edit-Pipeline")
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+from ugc_tools.env import load_env_from_candidates  # noqa: E402
+from ugc_tools.http_retry import make_client  # noqa: E402
 
 # Job IDs from the last resubmit (with NFD-encoded URLs)
 JOB_IDS = {
@@ -25,19 +31,12 @@ JOB_IDS = {
     "57_tarjeta_prepaga-MLA-female": "10e0e811-beaf-4f3e-a65d-cbd036286b50-u1",
 }
 
-
-def load_env(env_path: Path) -> None:
-    if not env_path.exists():
-        return
-    for line in env_path.read_text().splitlines():
-        if not line.strip() or line.strip().startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+# One keep-alive connection pool shared by every status poll.
+SESSION = make_client(pool_size=16, http2=False)
 
 
 def main() -> None:
-    load_env(REPO / ".env")
+    load_env_from_candidates([REPO / ".env"])
     api_key = os.getenv("RUNPOD_API_KEY")
     endpoint_id = "h55ft9cy7fyi1d"
 
@@ -45,12 +44,18 @@ def main() -> None:
         raise SystemExit("RUNPOD_API_KEY not set in .env")
 
     base = f"https://api.runpod.ai/v2/{endpoint_id}"
-    headers = {"Authorization": f"Bearer {api_key}"}
+    SESSION.headers["Authorization"] = f"Bearer {api_key}"
 
     print(f"Checking {len(JOB_IDS)} jobs on endpoint {endpoint_id}\n")
 
-    for name, job_id in JOB_IDS.items():
-        resp = requests.get(f"{base}/status/{job_id}", headers=headers, timeout=30)
+    def poll(item: tuple[str, str]) -> tuple[str, requests.Response]:
+        name, job_id = item
+        return name, SESSION.get(f"{base}/status/{job_id}", timeout=30)
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(poll, JOB_IDS.items()))
+
+    for name, resp in results:
         if resp.status_code == 200:
             data = resp.json()
             status = data.get("status", "UNKNOWN")
@@ -1,17 +1,26 @@
 #!/usr/bin/env python3
 """Check status of MLM jobs on RunPod."""
+import asyncio
 import os
+import sys
 import glob
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import httpx
+    import h2  # noqa: F401  (required by httpx for http2=True)
+except ImportError:
+    httpx = None
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from ugc_tools.env import load_env_from_candidates  # noqa: E402
+from ugc_tools.http_retry import make_client  # noqa: E402
 
 # Load env
-env_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env")
-with open(env_path, 'r') as f:
-    for line in f:
-        line = line.strip()
-        if line and '=' in line and not line.startswith('#'):
-            key, value = line.split('=', 1)
-            os.environ[key.strip()] = value.strip().strip('"')
+load_env_from_candidates([Path(REPO_DIR) / ".env"])
 
 API_KEY = os.environ.get('RUNPOD_API_KEY')
 ENDPOINT_ID = 'h55ft9cy7fyi1d'
@@ -27,21 +36,58 @@ with open(job_files[-1], 'r') as f:
 
 print(f'Checking {len(job_ids)} MLM jobs...\n')
 
-headers = {'Authorization': f'Bearer {API_KEY}'}
-statuses = {}
-failed_jobs = []
+# One keep-alive connection pool shared by every status poll.
+SESSION = make_client(pool_size=16, http2=False)
+SESSION.headers['Authorization'] = f'Bearer {API_KEY}'
 
-for job_id in job_ids:
+
+def poll(job_id):
+    """Return (status, error) for one job; runs on a worker thread."""
     url = f'https://api.runpod.ai/v2/{ENDPOINT_ID}/status/{job_id}'
     try:
-        r = requests.get(url, headers=headers, timeout=10)
+        r = SESSION.get(url, timeout=10)
         data = r.json()
-        status = data.get('status', 'UNKNOWN')
-        statuses[status] = statuses.get(status, 0) + 1
-        if status == 'FAILED':
-            failed_jobs.append((job_id, data.get('error', 'Unknown error')))
-    except Exception as e:
-        statuses['ERROR'] = statuses.get('ERROR', 0) + 1
+        return data.get('status', 'UNKNOWN'), data.get('error', 'Unknown error')
+    except Exception:
+        return 'ERROR', None
+
+
+async def poll_async(client, job_id):
+    """Async counterpart of poll(); requests share one multiplexed HTTP/2 connection."""
+    try:
+        r = await client.get(f'/status/{job_id}')
+        data = r.json()
+        return data.get('status', 'UNKNOWN'), data.get('error', 'Unknown error')
+    except Exception:
+        return 'ERROR', None
+
+
+async def poll_all_async(job_ids):
+    async with httpx.AsyncClient(
+        base_url=f'https://api.runpod.ai/v2/{ENDPOINT_ID}',
+        http2=True,
+        headers={'Authorization': f'Bearer {API_KEY}'},
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        timeout=30,
+    ) as client:
+        return await asyncio.gather(*(poll_async(client, job_id) for job_id in job_ids))
+
+
+# HTTP/2 AsyncClient when httpx and h2 are installed (optional, as in
+# ugc_tools.http_retry); otherwise the thread pool over the shared Session.
+if httpx is not None:
+    results = asyncio.run(poll_all_async(job_ids))
+else:
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(poll, job_ids))
+
+# Aggregate on the main thread once all workers have joined.
+statuses = {}
+failed_jobs = []
+for job_id, (status, error) in zip(job_ids, results):
+    statuses[status] = statuses.get(status, 0) + 1
+    if status == 'FAILED':
+        failed_jobs.append((job_id, error))
 
 print('=' * 40)
 print('MLM JOBS STATUS')
@@ -1,19 +1,40 @@
 #!/usr/bin/env python3
 """Check for recent MLM outputs in S3."""
 import os
+import sys
 import boto3
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from ugc_tools.env import load_env_from_candidates  # noqa: E402
 
 # Load env
-env_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env")
-with open(env_path, 'r') as f:
-    for line in f:
-        line = line.strip()
-        if line and '=' in line and not line.startswith('#'):
-            key, value = line.split('=', 1)
-            os.environ[key.strip()] = value.strip().strip('"')
+load_env_from_candidates([Path(REPO_DIR) / ".env"])
 
 s3 = boto3.client('s3', region_name='us-east-2')
+BUCKET = 'meli-ai.filmmaker'
+
+# Prefixes that can hold MLM outputs. Jobs submitted with an output folder land
+# under MP-Users/MLM_Outputs/; jobs without one fall back to the handler's
+# default outputs/{job_id}/, which is shared with other markets and therefore
+# still needs the name-based filter. MLM_S3_PREFIXES (comma-separated) replaces
+# the list; those prefixes are filtered by name as well.
+MLM_PREFIXES = {
+    'MP-Users/MLM_Outputs/': False,
+    'outputs/': True,
+}
+if os.environ.get('MLM_S3_PREFIXES'):
+    MLM_PREFIXES = {p.strip(): True for p in os.environ['MLM_S3_PREFIXES'].split(',') if p.strip()}
+
+RECENT_HOURS = 4
+
+# Output keys are named by job id / product, not by date, so S3 cannot skip old
+# keys via StartAfter; compare against a single precomputed cutoff instead.
+now = datetime.now(timezone.utc)
+cutoff = now - timedelta(hours=RECENT_HOURS)
 
 # List recent outputs
 paginator = s3.get_paginator('list_objects_v2')
@@ -22,23 +43,36 @@ all_mlm = []
 
 print("Scanning S3 for MLM outputs...\n")
 
-for page in paginator.paginate(Bucket='meli-ai.filmmaker'):
-    for obj in page.get('Contents', []):
-        key = obj['Key']
-        if not key.endswith('.mp4'):
-            continue
-            
-        last_modified = obj['LastModified']
-        age_hours = (datetime.now(timezone.utc) - last_modified).total_seconds() / 3600
-        
-        # Check for our MLM outputs by the naming pattern we used
-        if '_edited' in key or 'MLM' in key:
+
+def scan(prefix, needs_filter):
+    pages = paginator.paginate(Bucket=BUCKET, Prefix=prefix, PaginationConfig={'PageSize': 1000})
+    for page in pages:
+        for obj in page.get('Contents', []):
+            key = obj['Key']
+            if not key.endswith('.mp4'):
+                continue
+
+            # Check for our MLM outputs by the naming pattern we used
+            if needs_filter and not ('_edited' in key or 'MLM' in key):
+                continue
+
+            last_modified = obj['LastModified']
+            age_hours = (now - last_modified).total_seconds() / 3600
             all_mlm.append((key, obj['Size'], age_hours, last_modified))
-            if age_hours < 4:  # Last 4 hours
+            if last_modified > cutoff:
                 recent_mlm.append((key, obj['Size'], age_hours))
 
+
+for prefix, needs_filter in MLM_PREFIXES.items():
+    scan(prefix, needs_filter)
+
+# Outputs written somewhere else would otherwise be reported as missing.
+if not all_mlm:
+    print("Nothing under the known prefixes; scanning the whole bucket...\n")
+    scan('', True)
+
 print(f"Total MLM-related videos: {len(all_mlm)}")
-print(f"Recent (last 4h): {len(recent_mlm)}")
+print(f"Recent (last {RECENT_HOURS}h): {len(recent_mlm)}")
 
 if recent_mlm:
     print("\n=== RECENT MLM OUTPUTS ===")
@@ -2,46 +2,46 @@
 """Check missing outputs in S3 for user jobs."""
 import csv
 import re
-import subprocess
 from pathlib import Path
 
+import boto3
+
 CSV_PATH = Path("USERS FILES FOR EDIT, MLA APPROVED.s3.csv")
-OUTPUT_PREFIX = "s3://meli-ai.filmmaker/MP-Users/Outputs 02-2026/"
+OUTPUT_BUCKET = "meli-ai.filmmaker"
+OUTPUT_PREFIX = "MP-Users/Outputs 02-2026/"
+S3_REGION = "us-east-2"
+
+_SCENE1_PARENT = re.compile(r"/([^/]+)/[^/]+_scene_1_lipsync\.mp4")
 
 
 def list_existing() -> set[str]:
-    result = subprocess.run(
-        ["aws", "s3", "ls", OUTPUT_PREFIX],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    existing = set()
-    for line in result.stdout.splitlines():
-        parts = line.split()
-        if len(parts) >= 4:
-            key = parts[3]
-            if key.endswith("_MELI_EDIT.mp4"):
-                existing.add(key)
-    return existing
-
-
-def expected_outputs() -> list[str]:
-    expected = []
+    s3 = boto3.client("s3", region_name=S3_REGION)
+    paginator = s3.get_paginator("list_objects_v2")
+    # Delimiter keeps the listing to direct children of the prefix, like `aws s3 ls`.
+    return {
+        obj["Key"].split("/")[-1]
+        for page in paginator.paginate(Bucket=OUTPUT_BUCKET, Prefix=OUTPUT_PREFIX, Delimiter="/")
+        for obj in page.get("Contents", [])
+        if obj["Key"].endswith("_MELI_EDIT.mp4")
+    }
+
+
+def expected_outputs() -> set[str]:
+    expected = set()
     with CSV_PATH.open(newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
             scene1 = (row.get("scene_1_lipsync") or "").strip()
-            m = re.search(r"/([^/]+)/[^/]+_scene_1_lipsync\.mp4", scene1)
+            m = _SCENE1_PARENT.search(scene1)
             parent = m.group(1) if m else "UNKNOWN"
-            expected.append(f"{parent}_MELI_EDIT.mp4")
+            expected.add(f"{parent}_MELI_EDIT.mp4")
     return expected
 
 
 def main() -> None:
     existing = list_existing()
     expected = expected_outputs()
-    missing = [name for name in expected if name not in existing]
+    missing = sorted(expected - existing)
 
     print(f"Expected: {len(expected)}")
     print(f"Existing: {len(existing)}")
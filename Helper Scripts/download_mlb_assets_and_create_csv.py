@@ -4,84 +4,109 @@ Download MLB assets (B-rolls and Endcards) from Google Drive and upload to S3,
 then create a proper CSV with S3 URLs.
 """
 import csv
+import json
 import os
 import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from urllib.parse import quote
+from urllib.parse import quote, unquote
 
 import boto3
 import requests
+from boto3.s3.transfer import TransferConfig
+from requests.adapters import HTTPAdapter
 
 BASE_DIR = Path(__file__).resolve().parent
 REPO_DIR = BASE_DIR.parent
+sys.path.insert(0, str(REPO_DIR))
+
+from ugc_tools.env import load_env_from_candidates  # noqa: E402
+
 INPUT_CSV = REPO_DIR / "Files for Edit - MLB_Approved.csv"
 OUTPUT_CSV = REPO_DIR / "Files for Edit - MLB_Approved.s3.csv"
 TMP_DIR = REPO_DIR / "assets/IGNOREASSETS/users_assets_upload_tmp"
+# Drive ID -> S3 URL results from previous runs; delete the file to invalidate.
+DRIVE_CACHE_PATH = REPO_DIR / ".drive_s3_cache.mlb.json"
+DRIVE_CACHE_TTL_SECONDS = 24 * 60 * 60
 
 S3_BUCKET = "meli-ai.filmmaker"
 S3_PREFIX = "MP-Users/Assets"
 S3_REGION = "us-east-2"
 
+_DRIVE_FILE_D = re.compile(r"/file/d/([^/]+)")
+_DRIVE_ID_PARAM = re.compile(r"[?&]id=([^&]+)")
+_FNAME_STAR = re.compile(r"filename\*=UTF-8''([^;]+)")
+_FNAME_QUOTED = re.compile(r'filename="([^"]+)"')
+_FNAME_BARE = re.compile(r"filename=([^;]+)")
+
+MAX_WORKERS = 8
+# Multipart, multi-threaded uploads for large B-roll/Endcard .mov files.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
+# One lock per S3 key: keys come from the Drive filename, so two Drive IDs
+# can resolve to the same key and must not upload it concurrently.
+_KEY_LOCKS: dict[str, threading.Lock] = {}
+_KEY_LOCKS_GUARD = threading.Lock()
+
+# Shared across download threads so Drive connections are kept alive.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+# (connect, read) seconds; the read timeout applies per chunk, not per file.
+DRIVE_TIMEOUT = (10, 300)
+
 
 def load_env_from_dotenv() -> None:
-    candidates = [
+    load_env_from_candidates([
         REPO_DIR / ".env",
         REPO_DIR.parent / ".env",
-    ]
-    for path in candidates:
-        if not path.exists():
-            continue
-        with path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
-                if key and key not in os.environ:
-                    os.environ[key] = value
-        break
+    ])
 
 
 def extract_drive_file_id(url: str) -> str | None:
     if not url or "drive.google.com" not in url:
         return None
-    m = re.search(r"/file/d/([^/]+)", url)
+    m = _DRIVE_FILE_D.search(url)
     if m:
         return m.group(1)
-    m = re.search(r"[?&]id=([^&]+)", url)
+    m = _DRIVE_ID_PARAM.search(url)
     if m:
         return m.group(1)
     return None
 
 
-def _download_response(file_id: str) -> requests.Response:
+def _download_response(file_id: str, session: requests.Session = SESSION) -> requests.Response:
     url = f"https://drive.google.com/uc?export=download&id={file_id}"
-    session = requests.Session()
-    response = session.get(url, stream=True, allow_redirects=True)
+    response = session.get(url, stream=True, allow_redirects=True, timeout=DRIVE_TIMEOUT)
     if "text/html" in response.headers.get("Content-Type", ""):
         for key, value in response.cookies.items():
             if key.startswith("download_warning"):
                 url = f"https://drive.google.com/uc?export=download&confirm={value}&id={file_id}"
-                response = session.get(url, stream=True, allow_redirects=True)
+                response = session.get(url, stream=True, allow_redirects=True, timeout=DRIVE_TIMEOUT)
                 break
         else:
             url = f"https://drive.google.com/uc?export=download&confirm=t&id={file_id}"
-            response = session.get(url, stream=True, allow_redirects=True)
+            response = session.get(url, stream=True, allow_redirects=True, timeout=DRIVE_TIMEOUT)
     return response
 
 
 def extract_filename(response: requests.Response, fallback_id: str) -> str:
     content_disp = response.headers.get("Content-Disposition", "")
     if content_disp:
-        match = re.search(r"filename\*=UTF-8''([^;]+)", content_disp)
+        match = _FNAME_STAR.search(content_disp)
         if match:
-            return requests.utils.unquote(match.group(1))
-        match = re.search(r"filename=\"([^\"]+)\"", content_disp)
+            return unquote(match.group(1))
+        match = _FNAME_QUOTED.search(content_disp)
         if match:
             return match.group(1)
-        match = re.search(r"filename=([^;]+)", content_disp)
+        match = _FNAME_BARE.search(content_disp)
         if match:
             return match.group(1).strip().strip('"')
     content_type = response.headers.get("Content-Type", "")
@@ -90,14 +115,19 @@ def extract_filename(response: requests.Response, fallback_id: str) -> str:
     return f"{fallback_id}.mov"
 
 
-def download_drive_file(file_id: str, dest_dir: Path) -> Path:
-    response = _download_response(file_id)
+def _check_drive_response(response: requests.Response) -> None:
     if response.status_code != 200:
         raise RuntimeError(f"Download failed: status {response.status_code}")
     content_type = response.headers.get("Content-Type", "")
     if "text/html" in content_type:
         raise RuntimeError("Download failed: got HTML (not public?)")
+
+
+def download_drive_file(file_id: str, dest_dir: Path) -> Path:
+    response = _download_response(file_id)
+    _check_drive_response(response)
     filename = extract_filename(response, file_id)
+    dest_dir.mkdir(parents=True, exist_ok=True)
     dest_path = dest_dir / filename
     with dest_path.open("wb") as f:
         for chunk in response.iter_content(chunk_size=1024 * 1024):
@@ -114,28 +144,115 @@ def s3_http_url(key: str) -> str:
     return f"https://s3.{S3_REGION}.amazonaws.com/{S3_BUCKET}/{encoded_key}"
 
 
-def upload_to_s3(local_path: Path, s3_client) -> str:
-    key = f"{S3_PREFIX}/{local_path.name}"
+def load_drive_cache() -> dict[str, dict]:
+    """Return unexpired drive_id -> {"url", "fetched_at"} entries, or {} if missing."""
     try:
-        s3_client.head_object(Bucket=S3_BUCKET, Key=key)
-        return s3_http_url(key)
-    except Exception:
-        pass
-    if local_path.suffix.lower() == ".mov":
-        content_type = "video/quicktime"
-    elif local_path.suffix.lower() == ".mp4":
-        content_type = "video/mp4"
-    else:
-        content_type = "application/octet-stream"
-    s3_client.upload_file(
-        str(local_path),
-        S3_BUCKET,
-        key,
-        ExtraArgs={"ContentType": content_type},
-    )
+        cache = json.loads(DRIVE_CACHE_PATH.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    if "entries" not in cache:
+        # Older single-timestamp format: every entry shares the file's age
+        cache = {"entries": {
+            drive_id: {"url": url, "fetched_at": cache.get("fetched_at", 0)}
+            for drive_id, url in cache.get("map", {}).items()
+        }}
+    now = time.time()
+    return {
+        drive_id: entry
+        for drive_id, entry in cache["entries"].items()
+        if entry.get("url") and now - entry.get("fetched_at", 0) < DRIVE_CACHE_TTL_SECONDS
+    }
+
+
+def save_drive_cache(cached: dict[str, dict], fetched: dict[str, str]) -> None:
+    """Write carried-over entries with their original timestamp; only `fetched` is restamped."""
+    now = time.time()
+    entries = dict(cached)
+    entries.update({drive_id: {"url": url, "fetched_at": now} for drive_id, url in fetched.items() if url})
+    DRIVE_CACHE_PATH.write_text(json.dumps({"entries": entries}, indent=2), encoding="utf-8")
+
+
+def list_existing_keys(s3_client) -> set[str]:
+    """List every key under S3_PREFIX once so existence checks stay in-process."""
+    paginator = s3_client.get_paginator("list_objects_v2")
+    return {
+        obj["Key"]
+        for page in paginator.paginate(Bucket=S3_BUCKET, Prefix=S3_PREFIX)
+        for obj in page.get("Contents", [])
+    }
+
+
+def content_type_for(filename: str) -> str:
+    suffix = Path(filename).suffix.lower()
+    if suffix == ".mov":
+        return "video/quicktime"
+    if suffix == ".mp4":
+        return "video/mp4"
+    return "application/octet-stream"
+
+
+def _key_lock(key: str) -> threading.Lock:
+    with _KEY_LOCKS_GUARD:
+        return _KEY_LOCKS.setdefault(key, threading.Lock())
+
+
+def upload_to_s3(local_path: Path, s3_client, existing_keys: set[str]) -> str:
+    key = f"{S3_PREFIX}/{local_path.name}"
+    with _key_lock(key):
+        if key in existing_keys:
+            return s3_http_url(key)
+        s3_client.upload_file(
+            str(local_path),
+            S3_BUCKET,
+            key,
+            ExtraArgs={"ContentType": content_type_for(local_path.name)},
+            Config=TRANSFER_CONFIG,
+        )
+        existing_keys.add(key)
     return s3_http_url(key)
 
 
+def stream_drive_to_s3(file_id: str, s3_client, existing_keys: set[str]) -> str:
+    """Pipe a Google Drive download straight into a multipart S3 upload.
+
+    The S3 key comes from the response headers, so nothing touches disk. A
+    Drive ID whose filename is already uploaded (or being uploaded by another
+    worker) reuses that object, as the sequential head_object check did.
+    """
+    response = _download_response(file_id)
+    _check_drive_response(response)
+    filename = extract_filename(response, file_id)
+    key = f"{S3_PREFIX}/{filename}"
+    with _key_lock(key):
+        if key in existing_keys:
+            response.close()
+            return s3_http_url(key)
+        response.raw.decode_content = True
+        s3_client.upload_fileobj(
+            response.raw,
+            S3_BUCKET,
+            key,
+            ExtraArgs={"ContentType": content_type_for(filename)},
+            Config=TRANSFER_CONFIG,
+        )
+        if s3_client.head_object(Bucket=S3_BUCKET, Key=key)["ContentLength"] == 0:
+            s3_client.delete_object(Bucket=S3_BUCKET, Key=key)
+            raise RuntimeError("Download failed: empty file")
+        existing_keys.add(key)
+    return s3_http_url(key)
+
+
+def process_drive_file(drive_id: str, s3_client, existing_keys: set[str]) -> str:
+    try:
+        return stream_drive_to_s3(drive_id, s3_client, existing_keys)
+    except Exception as e:
+        print(f"  Streaming upload failed for {drive_id} ({e}), retrying via {TMP_DIR}")
+    # Per-ID directory: two Drive IDs may share a filename
+    local_path = download_drive_file(drive_id, TMP_DIR / drive_id)
+    print(f"  ✓ Downloaded to {local_path}")
+    return upload_to_s3(local_path, s3_client, existing_keys)
+
+
 def pick_first(row: dict, keys: list[str]) -> str:
     for key in keys:
         value = (row.get(key) or "").strip()
@@ -151,8 +268,8 @@ def resolve_s3_from_value(value: str, drive_map: dict[str, str]) -> str:
     if value.startswith("s3://") or value.startswith("https://s3"):
         return value
     drive_id = extract_drive_file_id(value)
-    if drive_id and drive_id in drive_map:
-        return drive_map[drive_id]
+    if drive_id:
+        return drive_map.get(drive_id, "")
     filename = os.path.basename(value)
     key = f"{S3_PREFIX}/{filename}"
     return s3_http_url(key)
@@ -173,61 +290,90 @@ def main() -> None:
         aws_secret_access_key=os.environ.get("AWS_SECRET_ACCESS_KEY"),
     )
 
+    # First pass only collects Drive ids; rows are re-read below instead of
+    # being held in memory while downloads run.
+    drive_map: dict[str, str] = {}
+    unique_drive_ids: list[str] = []
+    seen_drive_ids: set[str] = set()
+    row_count = 0
     with INPUT_CSV.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+        for row in csv.DictReader(f):
+            row_count += 1
+            for col in ("Broll", "BRoll", "Endcard"):
+                url = (row.get(col) or "").strip()
+                drive_id = extract_drive_file_id(url)
+                if drive_id and drive_id not in seen_drive_ids:
+                    seen_drive_ids.add(drive_id)
+                    unique_drive_ids.append(drive_id)
 
-    print(f"Read {len(rows)} rows from {INPUT_CSV}")
-
-    drive_map: dict[str, str] = {}
-    unique_drive_ids = []
-    for row in rows:
-        for col in ("Broll", "BRoll", "Endcard"):
-            url = (row.get(col) or "").strip()
-            drive_id = extract_drive_file_id(url)
-            if drive_id and drive_id not in drive_map:
-                drive_map[drive_id] = ""
-                unique_drive_ids.append(drive_id)
+    print(f"Read {row_count} rows from {INPUT_CSV}")
 
     print(f"Found {len(unique_drive_ids)} unique Google Drive files")
 
-    for idx, drive_id in enumerate(unique_drive_ids, 1):
-        print(f"[{idx}/{len(unique_drive_ids)}] Downloading {drive_id}...")
-        try:
-            local_path = download_drive_file(drive_id, TMP_DIR)
-            print(f"  ✓ Downloaded to {local_path}")
-            s3_url = upload_to_s3(local_path, s3_client)
+    cached = load_drive_cache()
+    pending = []
+    for drive_id in unique_drive_ids:
+        if drive_id in cached:
+            drive_map[drive_id] = cached[drive_id]["url"]
+        else:
+            pending.append(drive_id)
+    if cached:
+        print(f"Cached from previous run: {len(unique_drive_ids) - len(pending)}")
+
+    # Download/upload concurrently; drive_map is only mutated on the main thread.
+    existing_keys = list_existing_keys(s3_client) if pending else set()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = {
+            pool.submit(process_drive_file, drive_id, s3_client, existing_keys): drive_id
+            for drive_id in pending
+        }
+        for idx, future in enumerate(as_completed(futures), 1):
+            drive_id = futures[future]
+            try:
+                s3_url = future.result()
+            except Exception as e:
+                print(f"[{idx}/{len(pending)}] ✗ Failed {drive_id}: {e}")
+                continue
             drive_map[drive_id] = s3_url
-            print(f"  ✓ Uploaded: {s3_url}")
-        except Exception as e:
-            print(f"  ✗ Failed: {e}")
+            print(f"[{idx}/{len(pending)}] ✓ Uploaded {drive_id}: {s3_url}")
+
+    save_drive_cache(cached, {d: u for d, u in drive_map.items() if d not in cached})
+
+    # Many rows share the same B-roll/Endcard URL; resolve each distinct value once.
+    resolved: dict[str, str] = {}
+
+    def resolve(value: str) -> str:
+        if value not in resolved:
+            resolved[value] = resolve_s3_from_value(value, drive_map)
+        return resolved[value]
 
     output_rows = []
-    for row in rows:
-        product = pick_first(row, ["Product", "product"])
-        geo = pick_first(row, ["GEO", "Geo", "geo"])
-        gender = pick_first(row, ["Gender", "gender"])
-        scene1 = pick_first(row, ["scene_1_lipsync", "Scene_1", "scene_1"])
-        scene2 = pick_first(row, ["scene_2_lipsync", "Scene_2", "scene_2"])
-        scene3 = pick_first(row, ["scene_3_lipsync", "Scene_3", "scene_3"])
-        broll = pick_first(row, ["Broll", "BRoll"])
-        endcard = pick_first(row, ["Endcard"])
-
-        broll_s3 = resolve_s3_from_value(broll, drive_map)
-        endcard_s3 = resolve_s3_from_value(endcard, drive_map)
-
-        output_rows.append({
-            "Product": product,
-            "GEO": geo,
-            "Gender": gender,
-            "scene_1_lipsync": scene1,
-            "scene_2_lipsync": scene2,
-            "scene_3_lipsync": scene3,
-            "Broll": broll,
-            "Endcard": endcard,
-            "BROLL S3": broll_s3,
-            "ENDCARD S3": endcard_s3,
-        })
+    with INPUT_CSV.open(newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            product = pick_first(row, ["Product", "product"])
+            geo = pick_first(row, ["GEO", "Geo", "geo"])
+            gender = pick_first(row, ["Gender", "gender"])
+            scene1 = pick_first(row, ["scene_1_lipsync", "Scene_1", "scene_1"])
+            scene2 = pick_first(row, ["scene_2_lipsync", "Scene_2", "scene_2"])
+            scene3 = pick_first(row, ["scene_3_lipsync", "Scene_3", "scene_3"])
+            broll = pick_first(row, ["Broll", "BRoll"])
+            endcard = pick_first(row, ["Endcard"])
+
+            broll_s3 = resolve(broll)
+            endcard_s3 = resolve(endcard)
+
+            output_rows.append({
+                "Product": product,
+                "GEO": geo,
+                "Gender": gender,
+                "scene_1_lipsync": scene1,
+                "scene_2_lipsync": scene2,
+                "scene_3_lipsync": scene3,
+                "Broll": broll,
+                "Endcard": endcard,
+                "BROLL S3": broll_s3,
+                "ENDCARD S3": endcard_s3,
+            })
 
     output_rows.sort(key=lambda r: (r["Product"].lower(), r["Gender"].lower(), r["scene_1_lipsync"]))
 
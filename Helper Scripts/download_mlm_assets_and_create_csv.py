@@ -4,42 +4,58 @@ Download MLM assets (B-rolls and Endcards) from Google Drive and upload to S3,
 then create a proper CSV with S3 URLs.
 """
 import csv
+import json
 import os
 import re
+import sys
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from urllib.parse import quote
 
 import boto3
 import requests
+from boto3.s3.transfer import TransferConfig
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_DIR = os.path.dirname(BASE_DIR)
+sys.path.insert(0, REPO_DIR)
+
+from ugc_tools.env import load_env_from_candidates  # noqa: E402
+from ugc_tools.http_retry import make_client  # noqa: E402
+
 INPUT_CSV = os.path.join(REPO_DIR, "Files for Edit - MLM_Approved.csv")
 OUTPUT_CSV = os.path.join(REPO_DIR, "Files for Edit - MLM_Approved.s3.csv")
+# Drive ID -> S3 URL results from previous runs; delete the file to invalidate.
+DRIVE_CACHE_PATH = os.path.join(REPO_DIR, ".drive_s3_cache.mlm.json")
+DRIVE_CACHE_TTL_SECONDS = 24 * 60 * 60
 
 S3_BUCKET = "meli-ai.filmmaker"
 S3_PREFIX = "MP-Users/Assets"
 S3_REGION = "us-east-2"
 
+_DRIVE_FILE_D = re.compile(r"/file/d/([^/]+)")
+_DRIVE_ID_PARAM = re.compile(r"[?&]id=([^&]+)")
+
+MAX_WORKERS = 8
+# Multipart, multi-threaded uploads for large B-roll/Endcard .mov files.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
+# Shared across download threads so Drive connections are kept alive.
+SESSION = make_client(pool_size=16, http2=False)
+
 
 def load_env_from_dotenv() -> None:
-    candidates = [
-        os.path.join(REPO_DIR, ".env"),
-        os.path.join(os.path.dirname(REPO_DIR), ".env"),
-    ]
-    for path in candidates:
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
-                        continue
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and key not in os.environ:
-                        os.environ[key] = value
-            break
+    load_env_from_candidates([
+        Path(REPO_DIR) / ".env",
+        Path(REPO_DIR).parent / ".env",
+    ])
 
 
 def extract_drive_file_id(url: str) -> str | None:
@@ -47,23 +63,19 @@ def extract_drive_file_id(url: str) -> str | None:
     if not url or "drive.google.com" not in url:
         return None
     # Format: https://drive.google.com/file/d/FILE_ID/view...
-    m = re.search(r"/file/d/([^/]+)", url)
+    m = _DRIVE_FILE_D.search(url)
     if m:
         return m.group(1)
     # Format: https://drive.google.com/open?id=FILE_ID
-    m = re.search(r"[?&]id=([^&]+)", url)
+    m = _DRIVE_ID_PARAM.search(url)
     if m:
         return m.group(1)
     return None
 
 
-def download_from_google_drive(file_id: str, dest_path: str) -> bool:
-    """Download a file from Google Drive using direct download URL."""
+def _download_response(file_id: str, session: requests.Session = SESSION) -> requests.Response:
+    """Open a streaming Google Drive download, following the large-file confirm page."""
     url = f"https://drive.google.com/uc?export=download&id={file_id}"
-    
-    session = requests.Session()
-    
-    print(f"  Downloading from Google Drive: {file_id}")
     response = session.get(url, stream=True, allow_redirects=True)
     
     # Check if we got a confirmation page (for large files)
@@ -76,7 +88,10 @@ def download_from_google_drive(file_id: str, dest_path: str) -> bool:
         else:
             url = f"https://drive.google.com/uc?export=download&confirm=t&id={file_id}"
             response = session.get(url, stream=True, allow_redirects=True)
-    
+    return response
+
+
+def _check_drive_response(response: requests.Response) -> bool:
     if response.status_code != 200:
         print(f"  ERROR: Failed to download, status {response.status_code}")
         return False
@@ -85,9 +100,18 @@ def download_from_google_drive(file_id: str, dest_path: str) -> bool:
     if "text/html" in content_type:
         print(f"  ERROR: Got HTML instead of video - file may not be publicly shared")
         return False
+    return True
+
+
+def download_from_google_drive(file_id: str, dest_path: str) -> bool:
+    """Download a file from Google Drive using direct download URL."""
+    print(f"  Downloading from Google Drive: {file_id}")
+    response = _download_response(file_id)
+    if not _check_drive_response(response):
+        return False
     
     with open(dest_path, "wb") as f:
-        for chunk in response.iter_content(chunk_size=8192):
+        for chunk in response.iter_content(chunk_size=1024 * 1024):
             if chunk:
                 f.write(chunk)
     
@@ -96,36 +120,154 @@ def download_from_google_drive(file_id: str, dest_path: str) -> bool:
     return file_size > 0
 
 
+def s3_http_url(s3_key: str) -> str:
+    encoded_key = quote(s3_key, safe="/")
+    return f"https://s3.{S3_REGION}.amazonaws.com/{S3_BUCKET}/{encoded_key}"
+
+
+def content_type_for(path: str) -> str:
+    if path.endswith(".mov"):
+        return "video/quicktime"
+    if path.endswith(".mp4"):
+        return "video/mp4"
+    return "application/octet-stream"
+
+
 def upload_to_s3(local_path: str, s3_key: str, s3_client) -> str:
     """Upload a file to S3 and return the HTTPS URL."""
     print(f"  Uploading to S3: {s3_key}")
     
-    if local_path.endswith(".mov"):
-        content_type = "video/quicktime"
-    elif local_path.endswith(".mp4"):
-        content_type = "video/mp4"
-    else:
-        content_type = "application/octet-stream"
-    
     s3_client.upload_file(
         local_path,
         S3_BUCKET,
         s3_key,
-        ExtraArgs={"ContentType": content_type}
+        ExtraArgs={"ContentType": content_type_for(local_path)},
+        Config=TRANSFER_CONFIG,
     )
+    return s3_http_url(s3_key)
+
+
+def stream_drive_to_s3(file_id: str, s3_key: str, s3_client) -> str | None:
+    """Pipe a Google Drive download straight into a multipart S3 upload.
+
+    Avoids writing the asset to disk and reading it back. Returns the HTTPS
+    URL, or None if Drive did not serve the file.
+    """
+    print(f"  Streaming from Google Drive to S3: {file_id} -> {s3_key}")
+    response = _download_response(file_id)
+    if not _check_drive_response(response):
+        return None
     
-    encoded_key = quote(s3_key, safe="/")
-    return f"https://s3.{S3_REGION}.amazonaws.com/{S3_BUCKET}/{encoded_key}"
+    response.raw.decode_content = True
+    s3_client.upload_fileobj(
+        response.raw,
+        S3_BUCKET,
+        s3_key,
+        ExtraArgs={"ContentType": content_type_for(s3_key)},
+        Config=TRANSFER_CONFIG,
+    )
+    
+    size = s3_client.head_object(Bucket=S3_BUCKET, Key=s3_key)["ContentLength"]
+    if size == 0:
+        s3_client.delete_object(Bucket=S3_BUCKET, Key=s3_key)
+        print("  ERROR: Streamed an empty file")
+        return None
+    print(f"  Streamed: {size / 1024 / 1024:.1f} MB")
+    return s3_http_url(s3_key)
 
 
-def check_s3_exists(s3_key: str, s3_client) -> str | None:
-    """Check if a key exists in S3, return HTTPS URL if it does."""
+def load_drive_cache() -> dict[str, dict]:
+    """Return unexpired drive_id -> {"url", "fetched_at"} entries, or {} if missing."""
     try:
-        s3_client.head_object(Bucket=S3_BUCKET, Key=s3_key)
-        encoded_key = quote(s3_key, safe="/")
-        return f"https://s3.{S3_REGION}.amazonaws.com/{S3_BUCKET}/{encoded_key}"
-    except:
+        with open(DRIVE_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    if "entries" not in cache:
+        # Older single-timestamp format: every entry shares the file's age
+        cache = {"entries": {
+            drive_id: {"url": url, "fetched_at": cache.get("fetched_at", 0)}
+            for drive_id, url in cache.get("map", {}).items()
+        }}
+    now = time.time()
+    return {
+        drive_id: entry
+        for drive_id, entry in cache["entries"].items()
+        if entry.get("url") and now - entry.get("fetched_at", 0) < DRIVE_CACHE_TTL_SECONDS
+    }
+
+
+def save_drive_cache(cached: dict[str, dict], fetched: dict[str, str]) -> None:
+    """Write carried-over entries with their original timestamp; only `fetched` is restamped."""
+    now = time.time()
+    entries = dict(cached)
+    entries.update({drive_id: {"url": url, "fetched_at": now} for drive_id, url in fetched.items() if url})
+    with open(DRIVE_CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump({"entries": entries}, f, indent=2)
+
+
+def list_existing_keys(s3_client) -> set[str]:
+    """List every key under S3_PREFIX once so existence checks stay in-process."""
+    paginator = s3_client.get_paginator("list_objects_v2")
+    return {
+        obj["Key"]
+        for page in paginator.paginate(Bucket=S3_BUCKET, Prefix=S3_PREFIX)
+        for obj in page.get("Contents", [])
+    }
+
+
+def check_s3_exists(s3_key: str, existing_keys: set[str]) -> str | None:
+    """Check if a key exists in S3, return HTTPS URL if it does."""
+    if s3_key not in existing_keys:
         return None
+    return s3_http_url(s3_key)
+
+
+def asset_s3_key(asset_type: str, product_hint: str) -> str:
+    """S3 key for an asset; named by product, so different Drive IDs can share one."""
+    ext = ".mov"  # Default extension
+    if asset_type == "broll":
+        return f"{S3_PREFIX}/MLM- {product_hint} Broll{ext}"
+    return f"{S3_PREFIX}/MLM- {product_hint} Endcard{ext}"
+
+
+def process_asset(
+    drive_id: str,
+    asset_type: str,
+    product_hint: str,
+    tmp_dir: str,
+    s3_client,
+    existing_keys: set[str],
+) -> str | None:
+    """Make one Drive asset available in S3 and return its HTTPS URL."""
+    ext = ".mov"
+    s3_key = asset_s3_key(asset_type, product_hint)
+    s3_name = os.path.basename(s3_key)
+
+    print(f"\n{asset_type.upper()}: {drive_id} ({product_hint})")
+
+    # Check if already in S3
+    existing_url = check_s3_exists(s3_key, existing_keys)
+    if existing_url:
+        print(f"  ✓ Already in S3: {s3_name}")
+        return existing_url
+
+    # Stream from Google Drive into S3; fall back to a temp file if the
+    # streamed upload itself fails.
+    try:
+        s3_url = stream_drive_to_s3(drive_id, s3_key, s3_client)
+    except Exception as e:
+        print(f"  Streaming upload failed ({e}), retrying via temp file")
+        local_path = os.path.join(tmp_dir, f"{drive_id}{ext}")
+        s3_url = None
+        if download_from_google_drive(drive_id, local_path):
+            s3_url = upload_to_s3(local_path, s3_key, s3_client)
+    if s3_url:
+        existing_keys.add(s3_key)
+        print(f"  ✓ Uploaded: {s3_name}")
+        return s3_url
+    print("  ✗ Failed to download")
+    return None
 
 
 def main():
@@ -138,105 +280,123 @@ def main():
         aws_secret_access_key=os.environ.get("AWS_SECRET_ACCESS_KEY"),
     )
     
+    # Collect unique assets by Google Drive ID (first pass over the CSV;
+    # rows are streamed again when writing the output instead of buffered).
+    asset_types: dict[str, str] = {}
+    product_hints: dict[str, str] = {}
+    s3_urls: dict[str, str] = {}
+    row_count = 0
+    
     with open(INPUT_CSV, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    
-    print(f"Read {len(rows)} rows from {INPUT_CSV}")
-    
-    # Collect unique assets by Google Drive ID
-    # Map: drive_id -> (asset_type, product_hint, s3_url)
-    unique_assets = {}
-    
-    for row in rows:
-        product = row.get("Product", "").strip()
-        broll_url = (row.get("BRoll") or row.get("Broll") or "").strip()
-        endcard_url = (row.get("Endcard") or "").strip()
-        
-        broll_id = extract_drive_file_id(broll_url)
-        endcard_id = extract_drive_file_id(endcard_url)
-        
-        if broll_id and broll_id not in unique_assets:
-            unique_assets[broll_id] = ("broll", product, None)
-        
-        if endcard_id and endcard_id not in unique_assets:
-            unique_assets[endcard_id] = ("endcard", product, None)
-    
-    print(f"\nUnique assets to process: {len(unique_assets)}")
-    
-    # Process each unique asset
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        for drive_id, (asset_type, product_hint, _) in list(unique_assets.items()):
-            ext = ".mov"  # Default extension
-            if asset_type == "broll":
-                s3_name = f"MLM- {product_hint} Broll{ext}"
-            else:
-                s3_name = f"MLM- {product_hint} Endcard{ext}"
+        for row in csv.DictReader(f):
+            row_count += 1
+            product = row.get("Product", "").strip()
+            broll_url = (row.get("BRoll") or row.get("Broll") or "").strip()
+            endcard_url = (row.get("Endcard") or "").strip()
             
-            s3_key = f"{S3_PREFIX}/{s3_name}"
+            broll_id = extract_drive_file_id(broll_url)
+            endcard_id = extract_drive_file_id(endcard_url)
             
-            print(f"\n{asset_type.upper()}: {drive_id} ({product_hint})")
+            if broll_id and broll_id not in asset_types:
+                asset_types[broll_id] = "broll"
+                product_hints[broll_id] = product
             
-            # Check if already in S3
-            existing_url = check_s3_exists(s3_key, s3_client)
-            if existing_url:
-                unique_assets[drive_id] = (asset_type, product_hint, existing_url)
-                print(f"  ✓ Already in S3: {s3_name}")
-                continue
-            
-            # Download from Google Drive
-            local_path = os.path.join(tmp_dir, f"{drive_id}{ext}")
-            if download_from_google_drive(drive_id, local_path):
-                s3_url = upload_to_s3(local_path, s3_key, s3_client)
-                unique_assets[drive_id] = (asset_type, product_hint, s3_url)
-                print(f"  ✓ Uploaded: {s3_name}")
-            else:
-                print(f"  ✗ Failed to download")
+            if endcard_id and endcard_id not in asset_types:
+                asset_types[endcard_id] = "endcard"
+                product_hints[endcard_id] = product
+    
+    print(f"Read {row_count} rows from {INPUT_CSV}")
+    print(f"\nUnique assets to process: {len(asset_types)}")
+    
+    cached = load_drive_cache()
+    pending = []
+    for drive_id in asset_types:
+        if drive_id in cached:
+            s3_urls[drive_id] = cached[drive_id]["url"]
+        else:
+            pending.append(drive_id)
+    if cached:
+        print(f"Cached from previous run: {len(asset_types) - len(pending)}")
+    
+    # Drive IDs that map to the same S3 key are uploaded once (by the first
+    # ID, as a sequential run would) so no two workers write the same key.
+    by_key: dict[str, list[str]] = {}
+    for drive_id in pending:
+        by_key.setdefault(asset_s3_key(asset_types[drive_id], product_hints[drive_id]), []).append(drive_id)
+    
+    # Process unique keys concurrently; results are only written back to
+    # s3_urls from the main thread.
+    existing_keys = list_existing_keys(s3_client) if pending else set()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            futures = {
+                pool.submit(
+                    process_asset,
+                    drive_id,
+                    asset_types[drive_id],
+                    product_hints[drive_id],
+                    tmp_dir,
+                    s3_client,
+                    existing_keys,
+                ): drive_ids
+                for drive_ids in by_key.values()
+                for drive_id in drive_ids[:1]
+            }
+            for future in as_completed(futures):
+                drive_ids = futures[future]
+                try:
+                    s3_url = future.result()
+                except Exception as e:
+                    print(f"  ✗ Failed {drive_ids[0]}: {e}")
+                    continue
+                if s3_url:
+                    for drive_id in drive_ids:
+                        s3_urls[drive_id] = s3_url
+    
+    save_drive_cache(cached, {d: u for d, u in s3_urls.items() if d not in cached})
     
     # Generate output CSV
     print("\n--- Generating Output CSV ---")
     
-    output_rows = []
-    for row in rows:
-        broll_url = (row.get("BRoll") or row.get("Broll") or "").strip()
-        endcard_url = (row.get("Endcard") or "").strip()
-        
-        broll_id = extract_drive_file_id(broll_url)
-        endcard_id = extract_drive_file_id(endcard_url)
-        
-        broll_s3 = unique_assets.get(broll_id, (None, None, None))[2] or ""
-        endcard_s3 = unique_assets.get(endcard_id, (None, None, None))[2] or ""
-        
-        output_row = {
-            "Product": row.get("Product", ""),
-            "GEO": row.get("GEO", ""),
-            "Gender": row.get("Gender", ""),
-            "scene_1_lipsync": row.get("scene_1_lipsync", ""),
-            "scene_2_lipsync": row.get("scene_2_lipsync", ""),
-            "scene_3_lipsync": row.get("scene_3_lipsync", ""),
-            "Broll": broll_url,
-            "Endcard": endcard_url,
-            "BROLL S3": broll_s3,
-            "ENDCARD S3": endcard_s3,
-        }
-        output_rows.append(output_row)
-    
     fieldnames = ["Product", "GEO", "Gender", "scene_1_lipsync", "scene_2_lipsync", "scene_3_lipsync", "Broll", "Endcard", "BROLL S3", "ENDCARD S3"]
-    with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+    rows_written = 0
+    with open(INPUT_CSV, newline="", encoding="utf-8") as fi, open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as fo:
+        writer = csv.DictWriter(fo, fieldnames=fieldnames)
         writer.writeheader()
-        writer.writerows(output_rows)
+        for row in csv.DictReader(fi):
+            broll_url = (row.get("BRoll") or row.get("Broll") or "").strip()
+            endcard_url = (row.get("Endcard") or "").strip()
+            
+            broll_id = extract_drive_file_id(broll_url)
+            endcard_id = extract_drive_file_id(endcard_url)
+            
+            broll_s3 = s3_urls.get(broll_id, "")
+            endcard_s3 = s3_urls.get(endcard_id, "")
+            
+            writer.writerow({
+                "Product": row.get("Product", ""),
+                "GEO": row.get("GEO", ""),
+                "Gender": row.get("Gender", ""),
+                "scene_1_lipsync": row.get("scene_1_lipsync", ""),
+                "scene_2_lipsync": row.get("scene_2_lipsync", ""),
+                "scene_3_lipsync": row.get("scene_3_lipsync", ""),
+                "Broll": broll_url,
+                "Endcard": endcard_url,
+                "BROLL S3": broll_s3,
+                "ENDCARD S3": endcard_s3,
+            })
+            rows_written += 1
     
     print(f"\n✓ Output CSV written: {OUTPUT_CSV}")
-    print(f"  Total rows: {len(output_rows)}")
+    print(f"  Total rows: {rows_written}")
     
     # Summary
     print("\n--- Summary ---")
-    missing = [(k, v) for k, v in unique_assets.items() if not v[2]]
+    missing = [drive_id for drive_id in asset_types if drive_id not in s3_urls]
     if missing:
         print(f"⚠ Missing assets ({len(missing)}):")
-        for drive_id, (asset_type, product, _) in missing:
-            print(f"  - {asset_type}: {drive_id} ({product})")
+        for drive_id in missing:
+            print(f"  - {asset_types[drive_id]}: {drive_id} ({product_hints[drive_id]})")
     else:
         print("✓ All assets available in S3!")
 
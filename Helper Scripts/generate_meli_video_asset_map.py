@@ -8,7 +8,7 @@ Output columns include the source video file plus the mapped asset links.
 import argparse
 import csv
 import os
-from typing import Dict, Tuple
+from typing import Dict, Iterator, Tuple
 
 from meli_assets_mapper import (
     AssetLinks,
@@ -18,29 +18,32 @@ from meli_assets_mapper import (
 )
 
 
-def iter_video_rows(report_csv: str):
-    with open(report_csv, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            folder = (row.get("Parent Folder") or "").strip()
-            filename = (row.get("Filename") or "").strip()
-            file_type = (row.get("Type") or "").strip().lower()
-            url = (row.get("Public URL") or "").strip()
-            finished = (row.get("Finished") or "").strip()
+_REPORT_COLUMNS = ("Parent Folder", "Filename", "Type", "Public URL", "Finished")
+
+
+def iter_video_rows(report_csv: str) -> Iterator[Tuple[str, str, str, str]]:
+    """Yield (folder, filename, url, finished) for every non-TAP video row."""
+    with open(report_csv, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # Resolve column positions once; a missing column reads as "" like DictReader.
+        idx = [header.index(name) if name in header else -1 for name in _REPORT_COLUMNS]
+        folder_i, filename_i, type_i, url_i, finished_i = idx
 
+        def cell(row, i):
+            return row[i].strip() if 0 <= i < len(row) else ""
+
+        for row in reader:
+            folder = cell(row, folder_i)
+            filename = cell(row, filename_i)
             if not folder or not filename:
                 continue
             if "_tap" in folder.lower():
                 continue
-            if file_type != "video":
+            if cell(row, type_i).lower() != "video":
                 continue
 
-            yield {
-                "folder": folder,
-                "filename": filename,
-                "url": url,
-                "finished": finished,
-            }
+            yield folder, filename, cell(row, url_i), cell(row, finished_i)
 
 
 def main() -> None:
@@ -95,8 +98,7 @@ def main() -> None:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
 
-        for row in iter_video_rows(report_csv):
-            folder = row["folder"]
+        for folder, filename, url, finished in iter_video_rows(report_csv):
 
             result = get_assets_for_project(
                 folder,
@@ -115,9 +117,9 @@ def main() -> None:
             writer.writerow(
                 {
                     "Parent Folder": folder,
-                    "Filename": row["filename"],
-                    "Video URL": row["url"],
-                    "Finished": row["finished"],
+                    "Filename": filename,
+                    "Video URL": url,
+                    "Finished": finished,
                     "Project ID": getattr(metadata, "project_id", ""),
                     "Value Prop Raw": getattr(metadata, "value_prop_raw", ""),
                     "Value Prop Normalized": getattr(metadata, "value_prop_normalized", ""),
@@ -1,88 +1,62 @@
 #!/usr/bin/env python3
 """Resubmit only missing MELI edit outputs for users CSV."""
 import csv
-import copy
 import json
 import os
 import re
-import subprocess
 import sys
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Any
 
+import boto3
 import requests
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_DIR = os.path.dirname(BASE_DIR)
+sys.path.insert(0, REPO_DIR)
+from ugc_tools.env import load_env_default  # noqa: E402
+from ugc_tools.run_log import RunLog  # noqa: E402
+from ugc_tools.s3_tools import DEFAULT_REGION, list_existing_keys  # noqa: E402
 CSV_PATH = os.path.join(REPO_DIR, "USERS FILES FOR EDIT, MLA APPROVED.s3.csv")
 CASES_PATH = os.path.join(REPO_DIR, "presets", "meli_cases.json")
 LOG_PATH = os.path.join(REPO_DIR, "users_meli_resubmit.log")
 OUTPUT_PREFIX = "s3://meli-ai.filmmaker/MP-Users/Outputs 02-2026/"
 
 
-def load_env_from_dotenv() -> None:
-    candidates = [
-        os.path.join(REPO_DIR, ".env"),
-        os.path.join(os.path.dirname(REPO_DIR), ".env"),
-        os.path.join(os.getcwd(), ".env"),
-    ]
-    for path in candidates:
-        if not os.path.exists(path):
-            continue
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
-                        continue
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and key not in os.environ:
-                        os.environ[key] = value
-        except OSError:
-            pass
-        break
-
-
-def log(message: str) -> None:
-    text = str(message)
-    print(text)
-    try:
-        with open(LOG_PATH, "a", encoding="utf-8") as lf:
-            lf.write(text + "\n")
-    except OSError:
-        pass
+log = RunLog(LOG_PATH)
+
+
+_SCENE1_PARENT_RE = re.compile(r"/([^/]+)/[^/]+_scene_1_lipsync\.mp4")
+_GENERIC_PARENT_RE = re.compile(r"/([^/]+)/[^/]+\.mp4")
 
 
 def parse_parent_from_scene_url(url: str) -> str:
     if not url:
         return "UNKNOWN"
-    m = re.search(r"/([^/]+)/[^/]+_scene_1_lipsync\.mp4", url)
+    m = _SCENE1_PARENT_RE.search(url)
     if m:
         return m.group(1)
-    m = re.search(r"/([^/]+)/[^/]+\.mp4", url)
+    m = _GENERIC_PARENT_RE.search(url)
     if m:
         return m.group(1)
     return "UNKNOWN"
 
 
 def list_existing_outputs() -> set[str]:
-    result = subprocess.run(
-        ["aws", "s3", "ls", OUTPUT_PREFIX],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
+    # One paged boto3 listing instead of spawning the aws CLI; also keeps
+    # filenames with spaces intact, which `aws s3 ls` column splitting did not.
+    bucket, _, prefix = OUTPUT_PREFIX[len("s3://"):].partition("/")
+    s3 = boto3.client("s3", region_name=os.environ.get("AWS_REGION", DEFAULT_REGION))
     existing = set()
-    for line in result.stdout.splitlines():
-        parts = line.split()
-        if len(parts) >= 4:
-            key = parts[3]
-            if key.endswith("_MELI_EDIT.mp4"):
-                existing.add(key)
+    for key in list_existing_keys(s3, bucket, prefix):
+        name = key[len(prefix):]
+        if "/" not in name and name.endswith("_MELI_EDIT.mp4"):
+            existing.add(name)
     return existing
 
 
+@lru_cache(maxsize=4096)
 def _normalize_url(url: str) -> str:
     from urllib.parse import quote
     url = (url or "").strip()
@@ -130,9 +104,7 @@ def build_payload(
 
     parent = parse_parent_from_scene_url(scene1)
 
-    style = copy.deepcopy(base_style)
-    style.setdefault("endcard", {})
-    style["endcard"]["url"] = endcard_url
+    style = {**base_style, "endcard": {**(base_style.get("endcard") or {}), "url": endcard_url}}
 
     clips = []
     if default_introcard_url:
@@ -170,7 +142,7 @@ def main() -> None:
     if not os.path.exists(CASES_PATH):
         raise SystemExit(f"Cases config not found: {CASES_PATH}")
 
-    load_env_from_dotenv()
+    load_env_default(Path(REPO_DIR))
 
     api_key = os.environ.get("RUNPOD_API_KEY")
     endpoint_id = os.environ.get("RUNPOD_ENDPOINT_ID", "h55ft9cy7fyi1d")
@@ -187,11 +159,7 @@ def main() -> None:
 
     output_folder = "MP-Users/Outputs 02-2026"
 
-    try:
-        if os.path.exists(LOG_PATH):
-            os.remove(LOG_PATH)
-    except OSError:
-        pass
+    log.reset()
 
     existing = list_existing_outputs()
 
@@ -17,6 +17,10 @@ Usage:
     
     # Run with custom output name
     python run_meli_edit.py --case MLB_PIX --scenes s1.mp4 s2.mp4 s3.mp4 --output my_video.mp4
+    
+    # Submit without waiting, then check all background jobs later in one pass
+    python run_meli_edit.py --case MLB_PIX --scenes s1.mp4 s2.mp4 s3.mp4 --background
+    python run_meli_edit.py --check
 
 Example jobs.json:
     {
@@ -36,33 +40,84 @@ Example jobs.json:
 """
 
 import argparse
+import asyncio
 import json
 import os
+import random
 import sys
 import time
-import threading
-import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, List, Dict
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, List
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.certs import where as ca_bundle_path
 
-# Load .env
+# Optional C-accelerated JSON for payloads and status responses.
 try:
-    from dotenv import load_dotenv
-    load_dotenv()
+    import orjson
 except ImportError:
-    pass
-
-import requests
+    orjson = None
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_DIR = os.path.dirname(BASE_DIR)
+sys.path.insert(0, REPO_DIR)
+from ugc_tools.env import load_env_default  # noqa: E402
+from ugc_tools.http_retry import runpod_retry  # noqa: E402
+
+# Load .env (cached parse; python-dotenv is used when installed)
+load_env_default(Path(REPO_DIR))
+
 CASES_FILE = os.path.join(REPO_DIR, "presets", "meli_cases.json")
 
+# Jobs submitted with --background, polled in one pass by --check.
+PENDING_FILE = os.environ.get("MELI_PENDING_FILE", os.path.join(os.path.expanduser("~"), ".meli", "pending.json"))
+TERMINAL_STATUSES = {"COMPLETED", "FAILED", "CANCELLED", "TIMED_OUT"}
+
+# Status polling: start fast, back off to a 30s cap, give up after 2h.
+POLL_MAX_INTERVAL = 30
+POLL_TIMEOUT_SECONDS = 2 * 60 * 60
+
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# [epoch second, "%H:%M:%S"] for the last logged second; rebuilt once per second.
+_log_stamp = [0, ""]
+
+
+def _timestamp() -> str:
+    now = int(time.time())
+    stamp = _log_stamp
+    if now != stamp[0]:
+        # Single slice assignment so threads never see a second paired with another's text.
+        stamp[:] = [now, time.strftime('%H:%M:%S', time.localtime(now))]
+    return stamp[1]
+
+
+def next_interval(attempt: int) -> float:
+    """Seconds to wait before status poll number `attempt` (0-based), with jitter."""
+    return min(POLL_MAX_INTERVAL, 2 * 1.7 ** attempt) * random.uniform(0.8, 1.2)
+
 
+@lru_cache(maxsize=1)
 def load_cases() -> dict:
-    """Load the MELI cases configuration"""
-    with open(CASES_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """Load the MELI cases configuration (cached; do not mutate the result)"""
+    with open(CASES_FILE, 'rb') as f:
+        return _json_loads(f.read())
 
 
 def list_cases():
@@ -92,15 +147,12 @@ def list_cases():
     print("Usage: python run_meli_edit.py --case <CASE_ID> --scenes s1.mp4 s2.mp4 s3.mp4")
 
 
-def build_payload(
-    case_id: str,
-    scene_urls: List[str],
-    output_name: Optional[str] = None,
-    output_folder: Optional[str] = None,
-    broll_url_override: Optional[str] = None,
-    endcard_url_override: Optional[str] = None
-) -> dict:
-    """Build RunPod payload from case ID and scene URLs"""
+@lru_cache(maxsize=1024)
+def _case_style(case_id: str, endcard_url_override: Optional[str]) -> tuple:
+    """Resolve (case, style_overrides, introcard_url, endcard_url) for a case.
+
+    Cached per (case, endcard override); callers must not mutate the result.
+    """
     config = load_cases()
     
     if case_id not in config['cases']:
@@ -124,6 +176,22 @@ def build_payload(
             **base_style.get('endcard', {}),
             'url': endcard_url
         }
+    return case, base_style, introcard_url, endcard_url
+
+
+def build_payload(
+    case_id: str,
+    scene_urls: List[str],
+    output_name: Optional[str] = None,
+    output_folder: Optional[str] = None,
+    broll_url_override: Optional[str] = None,
+    endcard_url_override: Optional[str] = None
+) -> dict:
+    """Build RunPod payload from case ID and scene URLs.
+
+    style_overrides is shared between payloads of the same case; serialize, don't mutate.
+    """
+    case, base_style, introcard_url, endcard_url = _case_style(case_id, endcard_url_override)
     
     # Build clips array: introcard (overlay), scene1, scene2, broll, scene3, endcard
     clips = []
@@ -165,16 +233,42 @@ class RunPodClient:
     def __init__(self, api_key: str, endpoint_id: str):
         self.base_url = f"https://api.runpod.ai/v2/{endpoint_id}"
         self.headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+        # Shared by all worker threads so polls reuse warm TLS connections.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=runpod_retry(total=5, backoff_factor=0.5)),
+        )
+        # Status polls are the hot path: go straight to urllib3 with the URL prefix
+        # built once, skipping requests' per-call URL parsing and header merging.
+        self._status_url = f"{self.base_url}/status/"
+        self.pool = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=64,
+            headers=self.headers,
+            retries=runpod_retry(total=5, backoff_factor=0.5),
+            timeout=30,
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=ca_bundle_path(),
+        )
     
     def submit_job(self, payload: dict) -> dict:
-        r = requests.post(f"{self.base_url}/run", json=payload, headers=self.headers)
-        r.raise_for_status()
-        return r.json()
+        # Content-Type is already set on the session headers.
+        r = self.session.post(f"{self.base_url}/run", data=_json_dumps(payload))
+        if r.status_code >= 400:
+            raise RuntimeError(f"RunPod /run returned HTTP {r.status_code}: {r.text[:200]}")
+        return _json_loads(r.content)
     
     def get_job_status(self, job_id: str) -> dict:
-        r = requests.get(f"{self.base_url}/status/{job_id}", headers=self.headers)
-        r.raise_for_status()
-        return r.json()
+        r = self.pool.request("GET", self._status_url + job_id)
+        if r.status == 200:
+            return _json_loads(r.data)
+        if r.status == 429 or r.status >= 500:
+            # Still throttled after the pool's retries: keep polling on the next tick.
+            return {"status": "UNKNOWN", "http_status": r.status}
+        # 4xx (expired job, bad key, ...) will not fix itself.
+        return {"status": "FAILED", "error": f"HTTP {r.status}: {r.data[:200].decode('utf-8', 'replace')}"}
 
 
 def run_single_job(
@@ -210,11 +304,15 @@ def run_single_job(
     # Poll until complete
     print("⏳ Waiting for completion...")
     start_time = time.time()
-    poll_interval = 15
+    attempt = 0
     
     while True:
-        time.sleep(poll_interval)
+        time.sleep(next_interval(attempt))
+        attempt += 1
         elapsed = time.time() - start_time
+        if elapsed > POLL_TIMEOUT_SECONDS:
+            print(f"\n⏰ TIMEOUT after {elapsed:.0f}s")
+            return {"job_id": job_id, "status": "TIMEOUT", "elapsed": elapsed}
         
         status = client.get_job_status(job_id)
         job_status = status.get("status", "UNKNOWN")
@@ -233,7 +331,76 @@ def run_single_job(
             return {"job_id": job_id, "status": "FAILED", "error": error, "elapsed": elapsed}
 
 
-def run_jobs_from_file(jobs_file: str, workers: int = 3):
+def load_pending() -> List[dict]:
+    try:
+        with open(PENDING_FILE, 'rb') as f:
+            pending = _json_loads(f.read())
+    except (OSError, ValueError):
+        return []
+    return pending if isinstance(pending, list) else []
+
+
+def save_pending(pending: List[dict]):
+    os.makedirs(os.path.dirname(PENDING_FILE), exist_ok=True)
+    tmp_path = PENDING_FILE + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(pending, f, indent=2)
+    os.replace(tmp_path, PENDING_FILE)
+
+
+def add_pending(job_id: str, case_id: str, output_name: Optional[str] = None):
+    pending = load_pending()
+    pending.append({
+        "job_id": job_id,
+        "case": case_id,
+        "output_name": output_name,
+        "submitted": datetime.now().isoformat(timespec="seconds"),
+    })
+    save_pending(pending)
+
+
+def check_pending(workers: int = 16) -> int:
+    """Poll every background job once, report it, and forget the finished ones"""
+    pending = load_pending()
+    if not pending:
+        print("No pending jobs.")
+        return 0
+    
+    api_key = os.environ.get("RUNPOD_API_KEY")
+    endpoint_id = os.environ.get("RUNPOD_ENDPOINT_ID", "3zysuiunu9iacy")
+    if not api_key:
+        print("❌ RUNPOD_API_KEY not set")
+        return 1
+    
+    client = RunPodClient(api_key, endpoint_id)
+    
+    def fetch(entry: dict) -> dict:
+        try:
+            return client.get_job_status(entry["job_id"])
+        except Exception as e:
+            return {"status": "UNKNOWN", "error": str(e)}
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending)))) as pool:
+        statuses = list(pool.map(fetch, pending))
+    
+    still_pending = []
+    for entry, status in zip(pending, statuses):
+        job_status = status.get("status", "UNKNOWN")
+        line = f"{entry['job_id']}  {entry.get('case', '?'):<24} {job_status}"
+        if job_status == "COMPLETED":
+            line += f"  {(status.get('output') or {}).get('output_url', 'N/A')}"
+        elif status.get("error"):
+            line += f"  {status['error']}"
+        print(line)
+        if job_status not in TERMINAL_STATUSES:
+            still_pending.append(entry)
+    
+    save_pending(still_pending)
+    print(f"\n{len(pending) - len(still_pending)} finished, {len(still_pending)} still pending.")
+    return 0
+
+
+def run_jobs_from_file(jobs_file: str, workers: int = 32):
     """Run multiple jobs from a JSON file"""
     with open(jobs_file, 'r', encoding='utf-8') as f:
         jobs_config = json.load(f)
@@ -254,94 +421,94 @@ def run_jobs_from_file(jobs_file: str, workers: int = 3):
     
     client = RunPodClient(api_key, endpoint_id)
     
-    # Stats
+    # Stats (only touched from the main/event loop thread, so no lock needed)
     stats = {'completed': 0, 'failed': 0, 'total': len(jobs), 'results': []}
-    stats_lock = threading.Lock()
-    print_lock = threading.Lock()
     
     def log(msg):
-        with print_lock:
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
-    
-    def worker(worker_id: int, job_queue: queue.Queue):
-        while True:
-            try:
-                job = job_queue.get(timeout=1)
-            except queue.Empty:
-                if job_queue.empty():
-                    return
-                continue
-            
-            try:
-                payload = build_payload(
-                    job['case'],
-                    job['scenes'],
-                    job.get('output_name'),
-                    output_folder,
-                    job.get('broll_url'),
-                    job.get('endcard_url')
-                )
-                
-                log(f"🚀 Worker {worker_id} | Starting: {job['case']}")
-                
-                result = client.submit_job(payload)
-                runpod_id = result.get("id")
-                log(f"✅ Worker {worker_id} | Submitted: {runpod_id}")
+        # One write() per line keeps submit-thread output from interleaving without a lock.
+        sys.stdout.write(f"[{_timestamp()}] {msg}\n")
+    
+    def submit(job_num: int, job: dict) -> Optional[str]:
+        try:
+            payload = build_payload(
+                job['case'],
+                job['scenes'],
+                job.get('output_name'),
+                output_folder,
+                job.get('broll_url'),
+                job.get('endcard_url')
+            )
+            log(f"🚀 Job {job_num} | Starting: {job['case']}")
+            runpod_id = client.submit_job(payload).get("id")
+            log(f"✅ Job {job_num} | Submitted: {runpod_id}")
+            return runpod_id
+        except Exception as e:
+            log(f"❌ Job {job_num} | Error: {e}")
+            return None
+    
+    async def wait_for(job_num: int, job: dict, runpod_id: str):
+        # Jobs wait in asyncio.sleep between polls; only the short HTTP calls
+        # borrow a thread from the default executor.
+        try:
+            start_time = time.time()
+            attempt = 0
+            while True:
+                await asyncio.sleep(next_interval(attempt))
+                attempt += 1
+                if time.time() - start_time > POLL_TIMEOUT_SECONDS:
+                    stats['failed'] += 1
+                    stats['results'].append({
+                        'case': job['case'],
+                        'status': 'TIMEOUT',
+                        'runpod_id': runpod_id
+                    })
+                    log(f"⏰ Job {job_num} | {job['case']} TIMEOUT")
+                    break
+                status = await asyncio.to_thread(client.get_job_status, runpod_id)
+                job_status = status.get("status")
                 
-                start_time = time.time()
-                while True:
-                    time.sleep(15)
-                    status = client.get_job_status(runpod_id)
-                    job_status = status.get("status")
+                if job_status == "COMPLETED":
+                    elapsed = time.time() - start_time
+                    output = status.get("output", {})
+                    stats['completed'] += 1
+                    stats['results'].append({
+                        'case': job['case'],
+                        'status': 'COMPLETED',
+                        'output_url': output.get('output_url'),
+                        'elapsed': elapsed
+                    })
+                    log(f"✅ Job {job_num} | {job['case']} COMPLETED in {elapsed:.0f}s")
+                    break
                     
-                    if job_status == "COMPLETED":
-                        elapsed = time.time() - start_time
-                        output = status.get("output", {})
-                        with stats_lock:
-                            stats['completed'] += 1
-                            stats['results'].append({
-                                'case': job['case'],
-                                'status': 'COMPLETED',
-                                'output_url': output.get('output_url'),
-                                'elapsed': elapsed
-                            })
-                        log(f"✅ Worker {worker_id} | {job['case']} COMPLETED in {elapsed:.0f}s")
-                        break
-                        
-                    elif job_status == "FAILED":
-                        with stats_lock:
-                            stats['failed'] += 1
-                            stats['results'].append({
-                                'case': job['case'],
-                                'status': 'FAILED',
-                                'error': status.get('error')
-                            })
-                        log(f"❌ Worker {worker_id} | {job['case']} FAILED")
-                        break
-                        
-            except Exception as e:
-                with stats_lock:
+                elif job_status == "FAILED":
                     stats['failed'] += 1
-                log(f"❌ Worker {worker_id} | Error: {e}")
-            
-            finally:
-                job_queue.task_done()
-    
-    # Create queue
-    job_queue = queue.Queue()
-    for job in jobs:
-        job_queue.put(job)
-    
-    # Start workers
-    threads = []
-    for i in range(workers):
-        t = threading.Thread(target=worker, args=(i + 1, job_queue))
-        t.start()
-        threads.append(t)
-    
-    # Wait
-    for t in threads:
-        t.join()
+                    stats['results'].append({
+                        'case': job['case'],
+                        'status': 'FAILED',
+                        'error': status.get('error')
+                    })
+                    log(f"❌ Job {job_num} | {job['case']} FAILED")
+                    break
+                    
+        except Exception as e:
+            stats['failed'] += 1
+            log(f"❌ Job {job_num} | Error: {e}")
+    
+    # Phase 1: submit everything up front so RunPod can start cold workers early.
+    numbered = list(enumerate(jobs, start=1))
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(jobs) or 1))) as pool:
+        run_ids = list(pool.map(lambda item: submit(*item), numbered))
+    stats['failed'] += sum(1 for run_id in run_ids if not run_id)
+    
+    # Phase 2: wait for every submitted job on one event loop.
+    async def run_all():
+        await asyncio.gather(*(
+            wait_for(job_num, job, run_id)
+            for (job_num, job), run_id in zip(numbered, run_ids)
+            if run_id
+        ))
+    
+    asyncio.run(run_all())
     
     # Summary
     print("\n" + "=" * 70)
@@ -358,7 +525,9 @@ def main():
 Examples:
     python run_meli_edit.py --list
     python run_meli_edit.py --case MLB_PIX --scenes s1.mp4 s2.mp4 s3.mp4
-    python run_meli_edit.py --jobs my_jobs.json --workers 3
+    python run_meli_edit.py --jobs my_jobs.json --workers 32
+    python run_meli_edit.py --case MLB_PIX --scenes s1.mp4 s2.mp4 s3.mp4 --background
+    python run_meli_edit.py --check
         """
     )
     
@@ -370,8 +539,10 @@ Examples:
     parser.add_argument("--endcard-url", help="Override endcard URL for this run")
     parser.add_argument("--output-folder", help="S3 output folder")
     parser.add_argument("--jobs", "-j", help="JSON file with multiple jobs")
-    parser.add_argument("--workers", "-w", type=int, default=3, help="Number of workers for batch jobs")
+    parser.add_argument("--workers", "-w", type=int, default=32, help="Concurrent submissions for batch jobs")
     parser.add_argument("--no-wait", action="store_true", help="Submit and don't wait for completion")
+    parser.add_argument("--background", action="store_true", help="Submit, record the job for --check and exit")
+    parser.add_argument("--check", action="store_true", help="Poll all background jobs once and drop finished ones")
     parser.add_argument("--payload-only", action="store_true", help="Print payload JSON and exit (don't submit)")
     
     args = parser.parse_args()
@@ -380,6 +551,9 @@ Examples:
         list_cases()
         return 0
     
+    if args.check:
+        return check_pending()
+    
     if args.jobs:
         run_jobs_from_file(args.jobs, args.workers)
         return 0
@@ -397,15 +571,18 @@ Examples:
             print(json.dumps(payload, indent=2))
             return 0
         
-        run_single_job(
+        result = run_single_job(
             args.case,
             args.scenes,
             args.output,
             args.output_folder,
-            wait=not args.no_wait,
+            wait=not (args.no_wait or args.background),
             broll_url_override=args.broll_url,
             endcard_url_override=args.endcard_url
         )
+        if args.background and result.get("job_id"):
+            add_pending(result["job_id"], args.case, args.output)
+            print(f"📝 Recorded in {PENDING_FILE}; run with --check to see progress")
         return 0
     
     parser.print_help()
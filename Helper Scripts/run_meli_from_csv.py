@@ -10,84 +10,56 @@ in assets/IGNOREASSETS/unified_parent_asset_mapping.csv.
 """
 
 import csv
-import copy
 import json
 import os
 import sys
-from typing import Dict, Any
-
-import requests
-
+from pathlib import Path
+from typing import Dict, Any, List
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_DIR = os.path.dirname(BASE_DIR)
+sys.path.insert(0, REPO_DIR)
+from ugc_tools.csv_tools import cell  # noqa: E402
+from ugc_tools.env import load_env_default  # noqa: E402
+from ugc_tools.http_retry import TokenBucket, make_client, post_with_retry  # noqa: E402
+from ugc_tools.run_log import RunLog  # noqa: E402
+from ugc_tools.submission_cache import submit_jobs  # noqa: E402
+
 CSV_PATH = os.path.join(REPO_DIR, "assets", "IGNOREASSETS", "unified_parent_asset_mapping.csv")
 CASES_PATH = os.path.join(REPO_DIR, "presets", "meli_cases.json")
 LOG_PATH = os.path.join(REPO_DIR, "meli_from_csv.log")
+SUBMITTED_PATH = Path(REPO_DIR) / ".runpod_submitted.meli_from_csv.json"
 
+SESSION = make_client(pool_size=32, http2=False)
 
-def load_env_from_dotenv() -> None:
-    """Best-effort load of RUNPOD_* vars from nearby .env files."""
-    candidates = [
-        os.path.join(REPO_DIR, ".env"),
-        os.path.join(os.path.dirname(REPO_DIR), ".env"),
-        os.path.join(os.getcwd(), ".env"),
-    ]
-    for path in candidates:
-        if not os.path.exists(path):
-            continue
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
-                        continue
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and key not in os.environ:
-                        os.environ[key] = value
-        except OSError:
-            pass
-        # Stop at first .env we successfully read
-        break
-
-
-def log(message: str) -> None:
-    """Log to stdout and to a local file for inspection."""
-    text = str(message)
-    print(text)
-    try:
-        with open(LOG_PATH, "a", encoding="utf-8") as lf:
-            lf.write(text + "\n")
-    except OSError:
-        pass
+
+log = RunLog(LOG_PATH)
 
 
 def build_payload(
-    row: Dict[str, str],
+    row: List[str],
+    cols: Dict[str, int],
     base_style: Dict[str, Any],
     default_introcard_url: str,
     output_folder: str,
 ) -> Dict[str, Any]:
-    parent = row["Parent Folder"].strip()
-    geo = row["GEO"].strip()
-    scene1 = (row.get("Scene1_URL") or "").strip()
-    scene2 = (row.get("Scene2_URL") or "").strip()
-    scene3 = (row.get("Scene3_URL") or "").strip()
-    broll_url = (row.get("Broll_S3_URL") or "").strip()
-    endcard_url = (row.get("Endcard_S3_URL") or "").strip()
-    introcard_url = (row.get("Introcard_S3_URL") or "").strip() or default_introcard_url
+    parent = cell(row, cols, "Parent Folder")
+    geo = cell(row, cols, "GEO")
+    scene1 = cell(row, cols, "Scene1_URL")
+    scene2 = cell(row, cols, "Scene2_URL")
+    scene3 = cell(row, cols, "Scene3_URL")
+    broll_url = cell(row, cols, "Broll_S3_URL")
+    endcard_url = cell(row, cols, "Endcard_S3_URL")
+    introcard_url = cell(row, cols, "Introcard_S3_URL") or default_introcard_url
 
     if not (scene1 and scene2 and scene3):
         raise ValueError(f"{parent}: missing one or more scene URLs")
     if not broll_url:
         raise ValueError(f"{parent}: missing B-roll S3 URL")
 
-    style = copy.deepcopy(base_style)
+    style = dict(base_style)
     if endcard_url:
-        style.setdefault("endcard", {})
-        style["endcard"]["url"] = endcard_url
+        style["endcard"] = {**(base_style.get("endcard") or {}), "url": endcard_url}
 
     clips = []
     if introcard_url:
@@ -127,7 +99,7 @@ def main() -> None:
     if not os.path.exists(CASES_PATH):
         raise SystemExit(f"Cases config not found: {CASES_PATH}")
 
-    load_env_from_dotenv()
+    load_env_default(Path(REPO_DIR))
 
     api_key = os.environ.get("RUNPOD_API_KEY")
     endpoint_id = os.environ.get("RUNPOD_ENDPOINT_ID", "3zysuiunu9iacy")
@@ -144,37 +116,35 @@ def main() -> None:
 
     output_folder = "MELI_Exports/2026-01"
     # Start fresh log
-    try:
-        if os.path.exists(LOG_PATH):
-            os.remove(LOG_PATH)
-    except OSError:
-        pass
+    log.reset()
 
     log(f"Using endpoint {endpoint_id}")
 
-    submitted = 0
+    jobs = []
 
     with open(CSV_PATH, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        # Resolve header positions once instead of building a dict per row.
+        cols = {name: i for i, name in enumerate(next(reader, []))}
         for row in reader:
-            parent = row.get("Parent Folder", "").strip() or "UNKNOWN"
+            parent = cell(row, cols, "Parent Folder") or "UNKNOWN"
             try:
-                payload = build_payload(row, base_style, default_introcard_url, output_folder)
+                payload = build_payload(row, cols, base_style, default_introcard_url, output_folder)
             except ValueError as e:
                 log(f"Skipping {parent}: {e}")
                 continue
 
-            try:
-                r = requests.post(base_url, headers=headers, json=payload, timeout=60)
-                r.raise_for_status()
-                data = r.json()
-            except Exception as e:
-                log(f"{parent}: ERROR submitting job: {e}")
-                continue
+            jobs.append((parent, payload))
+
+    # Same submit rate cap as submit_mlm_jobs.py
+    submit_bucket = TokenBucket(float(os.environ.get("RUNPOD_SUBMIT_RPS", "10")))
+
+    def _submit_job(payload: Dict[str, Any]) -> str:
+        submit_bucket.acquire()
+        r = post_with_retry(SESSION, base_url, headers=headers, json=payload, timeout=60)
+        return r.json().get("id", "")
 
-            run_id = data.get("id")
-            log(f"{parent}: submitted {run_id}")
-            submitted += 1
+    submitted = submit_jobs(jobs, _submit_job, SUBMITTED_PATH, log=log)
 
     log(f"Submitted {submitted} jobs")
 
@@ -1,37 +1,28 @@
 #!/usr/bin/env python3
 """Submit MELI Edit Classic jobs for TAP rows only."""
 import csv
-import copy
 import json
 import os
-import requests
+import sys
+from pathlib import Path
+
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_DIR = os.path.dirname(BASE_DIR)
+sys.path.insert(0, REPO_DIR)
+from ugc_tools.env import load_env_default  # noqa: E402
+from ugc_tools.http_retry import TokenBucket, make_client, post_with_retry  # noqa: E402
+from ugc_tools.submission_cache import submit_jobs  # noqa: E402
+
 CSV_PATH = os.path.join(REPO_DIR, "assets", "IGNOREASSETS", "unified_parent_asset_mapping.csv")
 CASES_PATH = os.path.join(REPO_DIR, "presets", "meli_cases.json")
+SUBMITTED_PATH = Path(REPO_DIR) / ".runpod_submitted.meli_from_csv_tap.json"
 
-
-def load_env():
-    for path in (
-        os.path.join(REPO_DIR, ".env"),
-        os.path.join(os.path.dirname(REPO_DIR), ".env"),
-        os.path.join(os.getcwd(), ".env"),
-    ):
-        if not os.path.exists(path):
-            continue
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                k, v = line.split("=", 1)
-                os.environ.setdefault(k.strip(), v.strip().strip('"').strip("'"))
-        break
+SESSION = make_client(pool_size=32, http2=False)
 
 
 def main():
-    load_env()
+    load_env_default(Path(REPO_DIR))
     api_key = os.environ.get("RUNPOD_API_KEY")
     endpoint_id = os.environ.get("RUNPOD_ENDPOINT_ID", "3zysuiunu9iacy")
     if not api_key:
@@ -45,26 +36,38 @@ def main():
     base_url = f"https://api.runpod.ai/v2/{endpoint_id}/run"
     headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
 
-    submitted = 0
+    jobs = []
     with open(CSV_PATH, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        # Resolve header positions once instead of building a dict per row.
+        cols = {name: i for i, name in enumerate(next(reader, []))}
+        i_type = cols.get("Type", -1)
+        i_introcard = cols.get("Introcard_S3_URL", -1)
+        i_parent = cols["Parent Folder"]
+        i_geo = cols["GEO"]
+        i_scene1 = cols["Scene1_URL"]
+        i_scene2 = cols["Scene2_URL"]
+        i_scene3 = cols["Scene3_URL"]
+        i_broll = cols["Broll_S3_URL"]
+        i_endcard = cols["Endcard_S3_URL"]
         for row in reader:
-            if (row.get("Type") or "").strip().upper() != "TAP":
+            if i_type < 0 or i_type >= len(row) or row[i_type].strip().upper() != "TAP":
                 continue
 
-            parent = row["Parent Folder"].strip()
-            geo = row["GEO"].strip()
-            scene1 = row["Scene1_URL"].strip()
-            scene2 = row["Scene2_URL"].strip()
-            scene3 = row["Scene3_URL"].strip()
-            introcard_url = (row.get("Introcard_S3_URL") or "").strip() or default_introcard_url
-            broll_url = row["Broll_S3_URL"].strip()
-            endcard_url = row["Endcard_S3_URL"].strip()
-
-            style = copy.deepcopy(base_style)
+            parent = row[i_parent].strip()
+            geo = row[i_geo].strip()
+            scene1 = row[i_scene1].strip()
+            scene2 = row[i_scene2].strip()
+            scene3 = row[i_scene3].strip()
+            introcard_url = (
+                row[i_introcard].strip() if 0 <= i_introcard < len(row) else ""
+            ) or default_introcard_url
+            broll_url = row[i_broll].strip()
+            endcard_url = row[i_endcard].strip()
+
+            style = dict(base_style)
             if endcard_url:
-                style.setdefault("endcard", {})
-                style["endcard"]["url"] = endcard_url
+                style["endcard"] = {**(base_style.get("endcard") or {}), "url": endcard_url}
 
             clips = []
             if introcard_url:
@@ -94,12 +97,17 @@ def main():
                 }
             }
 
-            r = requests.post(base_url, headers=headers, json=payload, timeout=60)
-            r.raise_for_status()
-            data = r.json()
-            run_id = data.get("id")
-            print(f"{parent}: submitted {run_id}")
-            submitted += 1
+            jobs.append((parent, payload))
+
+    # Same submit rate cap as submit_mlm_jobs.py
+    submit_bucket = TokenBucket(float(os.environ.get("RUNPOD_SUBMIT_RPS", "10")))
+
+    def _submit_job(payload):
+        submit_bucket.acquire()
+        r = post_with_retry(SESSION, base_url, headers=headers, json=payload, timeout=60)
+        return r.json().get("id")
+
+    submitted = submit_jobs(jobs, _submit_job, SUBMITTED_PATH)
 
     print(f"Submitted {submitted} TAP jobs")
 
@@ -15,6 +15,8 @@ import json
 import os
 import re
 import sys
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Any
 
 import requests
@@ -24,6 +26,8 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_DIR = os.path.dirname(BASE_DIR)
 sys.path.insert(0, REPO_DIR)
 from geo_mapping import normalize_geo
+from ugc_tools.env import load_env_default
+from ugc_tools.run_log import RunLog
 DEFAULT_CSV = "LATAM_edit_outputs_urls.csv"
 CASES_PATH = os.path.join(REPO_DIR, "presets", "meli_cases.json")
 LOG_PATH = os.path.join(REPO_DIR, "latam_meli_from_csv.log")
@@ -54,41 +58,10 @@ LATAM_ENDCARD_ALPHA = {
 ENDCARD_OVERLAP = 0.75
 
 
-def load_env_from_dotenv() -> None:
-    candidates = [
-        os.path.join(REPO_DIR, ".env"),
-        os.path.join(os.path.dirname(REPO_DIR), ".env"),
-        os.path.join(os.getcwd(), ".env"),
-    ]
-    for path in candidates:
-        if not os.path.exists(path):
-            continue
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
-                        continue
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and key not in os.environ:
-                        os.environ[key] = value
-        except OSError:
-            pass
-        break
-
-
-def log(message: str) -> None:
-    text = str(message)
-    print(text)
-    try:
-        with open(LOG_PATH, "a", encoding="utf-8") as lf:
-            lf.write(text + "\n")
-    except OSError:
-        pass
+log = RunLog(LOG_PATH)
 
 
+@lru_cache(maxsize=4096)
 def _normalize_url(url: str) -> str:
     from urllib.parse import quote, unquote
 
@@ -233,7 +206,7 @@ def main() -> None:
     if not os.path.exists(csv_path):
         raise SystemExit(f"CSV not found: {csv_path}")
 
-    load_env_from_dotenv()
+    load_env_default(Path(REPO_DIR))
 
     api_key = os.environ.get("RUNPOD_API_KEY")
     endpoint_id = os.environ.get("RUNPOD_ENDPOINT_ID", "h55ft9cy7fyi1d")
@@ -243,11 +216,7 @@ def main() -> None:
     base_url = f"https://api.runpod.ai/v2/{endpoint_id}/run"
     headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
 
-    try:
-        if os.path.exists(LOG_PATH):
-            os.remove(LOG_PATH)
-    except OSError:
-        pass
+    log.reset()
 
     log("LATAM Edit - fontsize 64, master quality, white+black outline, highlight: #1b0088, safe zones, endcard 0.75s")
     log(f"Using endpoint {endpoint_id}")
@@ -1,22 +1,26 @@
 #!/usr/bin/env python3
 """Submit MELI EDIT CLASSIC jobs for MLA + MLC + MLM CSVs into a single output folder."""
 import csv
-import copy
 import json
 import os
 import re
 import sys
-import time
-from typing import Dict, Any, Iterable, List, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Tuple
 from urllib.parse import quote
 
-import requests
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_DIR = os.path.dirname(BASE_DIR)
 WORKSPACE_DIR = os.path.dirname(REPO_DIR)
 sys.path.insert(0, REPO_DIR)
 from geo_mapping import normalize_geo
+from ugc_tools.csv_tools import cell
+from ugc_tools.env import load_env_default
+from ugc_tools.http_retry import TokenBucket, make_client, post_with_retry
+from ugc_tools.run_log import RunLog
+from ugc_tools.submission_cache import submit_jobs
 
 CSV_SOURCES = [
     {
@@ -35,57 +39,33 @@ CSV_SOURCES = [
 
 CASES_PATH = os.path.join(REPO_DIR, "presets", "meli_cases.json")
 LOG_PATH = os.path.join(REPO_DIR, "users_meli_reedit_feb_2026.log")
+SUBMITTED_PATH = Path(REPO_DIR) / ".runpod_submitted.users_meli_reedit_feb_2026.json"
 
 OUTPUT_FOLDER = "MP-Users/Outputs 02-2026"
 
+SESSION = make_client(pool_size=32, http2=False)
 
-def load_env_from_dotenv() -> None:
-    candidates = [
-        os.path.join(REPO_DIR, ".env"),
-        os.path.join(os.path.dirname(REPO_DIR), ".env"),
-        os.path.join(os.getcwd(), ".env"),
-    ]
-    for path in candidates:
-        if not os.path.exists(path):
-            continue
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
-                        continue
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and key not in os.environ:
-                        os.environ[key] = value
-        except OSError:
-            pass
-        break
-
-
-def log(message: str) -> None:
-    text = str(message)
-    print(text)
-    try:
-        with open(LOG_PATH, "a", encoding="utf-8") as lf:
-            lf.write(text + "\n")
-    except OSError:
-        pass
+
+log = RunLog(LOG_PATH)
+
+
+_SCENE1_PARENT_RE = re.compile(r"/([^/]+)/[^/]+_scene_1_lipsync\.mp4")
+_GENERIC_PARENT_RE = re.compile(r"/([^/]+)/[^/]+\.mp4")
 
 
 def parse_parent_from_scene_url(url: str) -> str:
     if not url:
         return "UNKNOWN"
-    m = re.search(r"/([^/]+)/[^/]+_scene_1_lipsync\.mp4", url)
+    m = _SCENE1_PARENT_RE.search(url)
     if m:
         return m.group(1)
-    m = re.search(r"/([^/]+)/[^/]+\.mp4", url)
+    m = _GENERIC_PARENT_RE.search(url)
     if m:
         return m.group(1)
     return "UNKNOWN"
 
 
+@lru_cache(maxsize=4096)
 def _normalize_url(url: str) -> str:
     url = (url or "").strip()
     if url.startswith("s3://"):
@@ -105,29 +85,30 @@ def _normalize_url(url: str) -> str:
     return url
 
 
-def _pick_first(row: Dict[str, str], keys: Iterable[str]) -> str:
+def _pick_first(row: List[str], cols: Dict[str, int], keys: Iterable[str]) -> str:
     for key in keys:
-        value = (row.get(key) or "").strip()
+        value = cell(row, cols, key)
         if value:
             return value
     return ""
 
 
 def build_payload(
-    row: Dict[str, str],
+    row: List[str],
+    cols: Dict[str, int],
     base_style: Dict[str, Any],
     default_introcard_url: str,
 ) -> Dict[str, Any]:
-    geo = normalize_geo((row.get("GEO") or "").strip())
-    scene1 = (row.get("scene_1_lipsync") or "").strip()
-    scene2 = (row.get("scene_2_lipsync") or "").strip()
-    scene3 = (row.get("scene_3_lipsync") or "").strip()
+    geo = normalize_geo(cell(row, cols, "GEO"))
+    scene1 = cell(row, cols, "scene_1_lipsync")
+    scene2 = cell(row, cols, "scene_2_lipsync")
+    scene3 = cell(row, cols, "scene_3_lipsync")
 
     broll_url = _normalize_url(
-        _pick_first(row, ["BROLL S3", "BROLL S3 URL", "Broll", "BRoll"])
+        _pick_first(row, cols, ["BROLL S3", "BROLL S3 URL", "Broll", "BRoll"])
     )
     endcard_url = _normalize_url(
-        _pick_first(row, ["ENDCARD S3", "ENDCARD S3 URL", "Endcard"])
+        _pick_first(row, cols, ["ENDCARD S3", "ENDCARD S3 URL", "Endcard"])
     )
 
     if not (scene1 and scene2 and scene3):
@@ -139,9 +120,7 @@ def build_payload(
 
     parent = parse_parent_from_scene_url(scene1)
 
-    style = copy.deepcopy(base_style)
-    style.setdefault("endcard", {})
-    style["endcard"]["url"] = endcard_url
+    style = {**base_style, "endcard": {**(base_style.get("endcard") or {}), "url": endcard_url}}
 
     clips: List[Dict[str, str]] = []
     if default_introcard_url:
@@ -173,18 +152,20 @@ def build_payload(
     }
 
 
-def iter_csv_rows(csv_path: str) -> Iterable[Dict[str, str]]:
+def iter_csv_rows(csv_path: str) -> Iterable[Tuple[List[str], Dict[str, int]]]:
+    """Yield (row, cols) pairs; `cols` maps header names to positions for this file."""
     with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        cols = {name: i for i, name in enumerate(next(reader, []))}
         for row in reader:
-            yield row
+            yield row, cols
 
 
 def main() -> None:
     if not os.path.exists(CASES_PATH):
         raise SystemExit(f"Cases config not found: {CASES_PATH}")
 
-    load_env_from_dotenv()
+    load_env_default(Path(REPO_DIR))
 
     api_key = os.environ.get("RUNPOD_API_KEY")
     endpoint_id = os.environ.get("RUNPOD_ENDPOINT_ID", "h55ft9cy7fyi1d")
@@ -199,18 +180,14 @@ def main() -> None:
     base_url = f"https://api.runpod.ai/v2/{endpoint_id}/run"
     headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
 
-    try:
-        if os.path.exists(LOG_PATH):
-            os.remove(LOG_PATH)
-    except OSError:
-        pass
+    log.reset()
 
     log(f"Using endpoint {endpoint_id}")
     log(f"Output folder: {OUTPUT_FOLDER}")
     log("")
 
-    submitted = 0
     total = 0
+    jobs = []
 
     for source in CSV_SOURCES:
         label = source["label"]
@@ -221,37 +198,34 @@ def main() -> None:
 
         log(f"Processing {label}: {path}")
 
-        for row in iter_csv_rows(path):
+        for row, cols in iter_csv_rows(path):
             total += 1
-            parent = parse_parent_from_scene_url((row.get("scene_1_lipsync") or "").strip())
+            parent = parse_parent_from_scene_url(cell(row, cols, "scene_1_lipsync"))
             try:
-                payload = build_payload(row, base_style, default_introcard_url)
+                payload = build_payload(row, cols, base_style, default_introcard_url)
             except ValueError as e:
                 log(f"Skipping {label} {parent}: {e}")
                 continue
 
+
             broll_url = payload["input"]["clips"][3]["url"]
             endcard_url = payload["input"]["clips"][5]["url"]
             log(f"{label} {parent}")
             log(f"  Broll: {broll_url}")
             log(f"  Endcard: {endcard_url}")
+            jobs.append((f"{label} {parent}", payload))
 
-            try:
-                r = requests.post(base_url, headers=headers, json=payload, timeout=60)
-                r.raise_for_status()
-                data = r.json()
-            except Exception as e:
-                log(f"  ERROR submitting job: {e}")
-                continue
+        log("")
 
-            run_id = data.get("id")
-            log(f"  -> submitted: {run_id}")
-            submitted += 1
+    # Same submit rate cap as submit_mlm_jobs.py
+    submit_bucket = TokenBucket(float(os.environ.get("RUNPOD_SUBMIT_RPS", "10")))
 
-            if submitted % 10 == 0:
-                time.sleep(0.5)
+    def _submit_job(payload: Dict[str, Any]) -> str:
+        submit_bucket.acquire()
+        r = post_with_retry(SESSION, base_url, headers=headers, json=payload, timeout=60)
+        return r.json().get("id", "")
 
-        log("")
+    submitted = submit_jobs(jobs, _submit_job, SUBMITTED_PATH, log=log)
 
     log(f"Submitted {submitted}/{total} jobs")
 
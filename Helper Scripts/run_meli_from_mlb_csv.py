@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 """Submit MELI EDIT CLASSIC jobs from Files for Edit - MLB_Approved.s3.csv."""
 import csv
-import copy
 import json
 import os
 import re
 import sys
 import time
+from functools import lru_cache
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, Any
 from urllib.parse import urlparse
 
@@ -18,6 +19,8 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_DIR = os.path.dirname(BASE_DIR)
 sys.path.insert(0, REPO_DIR)
 from geo_mapping import normalize_geo
+from ugc_tools.env import load_env_default
+from ugc_tools.run_log import RunLog
 CSV_PATH = os.path.join(REPO_DIR, "Files for Edit - MLB_Approved.s3.csv")
 CASES_PATH = os.path.join(REPO_DIR, "presets", "meli_cases.json")
 LOG_PATH = os.path.join(REPO_DIR, "mlb_meli_from_csv.log")
@@ -25,53 +28,26 @@ DEFAULT_PRESIGN_EXPIRES = 6 * 60 * 60
 _S3_CLIENT = None
 
 
-def load_env_from_dotenv() -> None:
-    candidates = [
-        os.path.join(REPO_DIR, ".env"),
-        os.path.join(os.path.dirname(REPO_DIR), ".env"),
-        os.path.join(os.getcwd(), ".env"),
-    ]
-    for path in candidates:
-        if not os.path.exists(path):
-            continue
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
-                        continue
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and key not in os.environ:
-                        os.environ[key] = value
-        except OSError:
-            pass
-        break
-
-
-def log(message: str) -> None:
-    text = str(message)
-    print(text)
-    try:
-        with open(LOG_PATH, "a", encoding="utf-8") as lf:
-            lf.write(text + "\n")
-    except OSError:
-        pass
+log = RunLog(LOG_PATH)
+
+
+_SCENE1_PARENT_RE = re.compile(r"/([^/]+)/[^/]+_scene_1_lipsync\.mp4")
+_GENERIC_PARENT_RE = re.compile(r"/([^/]+)/[^/]+\.mp4")
 
 
 def parse_parent_from_scene_url(url: str) -> str:
     if not url:
         return "UNKNOWN"
-    m = re.search(r"/([^/]+)/[^/]+_scene_1_lipsync\.mp4", url)
+    m = _SCENE1_PARENT_RE.search(url)
     if m:
         return m.group(1)
-    m = re.search(r"/([^/]+)/[^/]+\.mp4", url)
+    m = _GENERIC_PARENT_RE.search(url)
     if m:
         return m.group(1)
     return "UNKNOWN"
 
 
+@lru_cache(maxsize=4096)
 def _normalize_url(url: str) -> str:
     from urllib.parse import quote, unquote
     import unicodedata
@@ -208,9 +184,7 @@ def build_payload(
 
     parent = parse_parent_from_scene_url(scene1)
 
-    style = copy.deepcopy(base_style)
-    style.setdefault("endcard", {})
-    style["endcard"]["url"] = endcard_url
+    style = {**base_style, "endcard": {**(base_style.get("endcard") or {}), "url": endcard_url}}
 
     clips = []
     if default_introcard_url:
@@ -252,7 +226,7 @@ def main() -> None:
     if not os.path.exists(CASES_PATH):
         raise SystemExit(f"Cases config not found: {CASES_PATH}")
 
-    load_env_from_dotenv()
+    load_env_default(Path(REPO_DIR))
 
     api_key = os.environ.get("RUNPOD_API_KEY")
     endpoint_id = os.environ.get("RUNPOD_ENDPOINT_ID", "h55ft9cy7fyi1d")
@@ -273,8 +247,7 @@ def main() -> None:
         REPO_DIR,
         f"mlb_meli_from_csv_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log",
     )
-    global LOG_PATH
-    LOG_PATH = log_path
+    log.path = log_path
 
     log(f"Using endpoint {endpoint_id}")
 
@@ -1,72 +1,52 @@
 #!/usr/bin/env python3
 """Submit MELI EDIT CLASSIC jobs from USER for Edit - MLC_Approved.csv."""
 import csv
-import copy
 import json
 import os
 import re
 import sys
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Any
 from urllib.parse import quote
 
-import requests
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_DIR = os.path.dirname(BASE_DIR)
 sys.path.insert(0, REPO_DIR)
 from geo_mapping import normalize_geo
+from ugc_tools.env import load_env_default
+from ugc_tools.http_retry import TokenBucket, make_client, post_with_retry
+from ugc_tools.run_log import RunLog
+from ugc_tools.submission_cache import submit_jobs
 CSV_PATH = os.path.join(os.path.dirname(REPO_DIR), "USER for Edit - MLC_Approved.csv")
 CASES_PATH = os.path.join(REPO_DIR, "presets", "meli_cases.json")
 LOG_PATH = os.path.join(REPO_DIR, "users_mlc_meli_from_csv.log")
+SUBMITTED_PATH = Path(REPO_DIR) / ".runpod_submitted.users_mlc_meli_from_csv.json"
 
+SESSION = make_client(pool_size=32, http2=False)
+
+
+log = RunLog(LOG_PATH)
 
-def load_env_from_dotenv() -> None:
-    candidates = [
-        os.path.join(REPO_DIR, ".env"),
-        os.path.join(os.path.dirname(REPO_DIR), ".env"),
-        os.path.join(os.getcwd(), ".env"),
-    ]
-    for path in candidates:
-        if not os.path.exists(path):
-            continue
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
-                        continue
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and key not in os.environ:
-                        os.environ[key] = value
-        except OSError:
-            pass
-        break
-
-
-def log(message: str) -> None:
-    text = str(message)
-    print(text)
-    try:
-        with open(LOG_PATH, "a", encoding="utf-8") as lf:
-            lf.write(text + "\n")
-    except OSError:
-        pass
+
+_SCENE1_PARENT_RE = re.compile(r"/([^/]+)/[^/]+_scene_1_lipsync\.mp4")
+_GENERIC_PARENT_RE = re.compile(r"/([^/]+)/[^/]+\.mp4")
 
 
 def parse_parent_from_scene_url(url: str) -> str:
     if not url:
         return "UNKNOWN"
-    m = re.search(r"/([^/]+)/[^/]+_scene_1_lipsync\.mp4", url)
+    m = _SCENE1_PARENT_RE.search(url)
     if m:
         return m.group(1)
-    m = re.search(r"/([^/]+)/[^/]+\.mp4", url)
+    m = _GENERIC_PARENT_RE.search(url)
     if m:
         return m.group(1)
     return "UNKNOWN"
 
 
+@lru_cache(maxsize=4096)
 def _normalize_url(url: str) -> str:
     """Convert s3:// URLs to https:// and properly encode special characters."""
     url = (url or "").strip()
@@ -116,9 +96,7 @@ def build_payload(
 
     parent = parse_parent_from_scene_url(scene1)
 
-    style = copy.deepcopy(base_style)
-    style.setdefault("endcard", {})
-    style["endcard"]["url"] = endcard_url
+    style = {**base_style, "endcard": {**(base_style.get("endcard") or {}), "url": endcard_url}}
 
     clips = []
     if default_introcard_url:
@@ -156,7 +134,7 @@ def main() -> None:
     if not os.path.exists(CASES_PATH):
         raise SystemExit(f"Cases config not found: {CASES_PATH}")
 
-    load_env_from_dotenv()
+    load_env_default(Path(REPO_DIR))
 
     api_key = os.environ.get("RUNPOD_API_KEY")
     endpoint_id = os.environ.get("RUNPOD_ENDPOINT_ID", "h55ft9cy7fyi1d")
@@ -174,19 +152,15 @@ def main() -> None:
     # MLC outputs go to a specific folder
     output_folder = "MP-Users/MLC_Outputs"
 
-    try:
-        if os.path.exists(LOG_PATH):
-            os.remove(LOG_PATH)
-    except OSError:
-        pass
+    log.reset()
 
     log(f"Using endpoint {endpoint_id}")
     log(f"Reading from: {CSV_PATH}")
     log(f"Output folder: {output_folder}")
     log("")
 
-    submitted = 0
     total = 0
+    jobs = []
 
     with open(CSV_PATH, newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
@@ -202,24 +176,24 @@ def main() -> None:
                 log(f"Skipping {parent}: {e}")
                 continue
 
+
             # Log the URLs being used
             broll_url = payload["input"]["clips"][3]["url"]  # broll is at index 3
             endcard_url = payload["input"]["clips"][5]["url"]  # endcard is at index 5
             log(f"Row {total}: {parent}")
             log(f"  Broll: {broll_url}")
             log(f"  Endcard: {endcard_url}")
+            jobs.append((parent, payload))
 
-            try:
-                r = requests.post(base_url, headers=headers, json=payload, timeout=60)
-                r.raise_for_status()
-                data = r.json()
-            except Exception as e:
-                log(f"  ERROR submitting job: {e}")
-                continue
+    # Same submit rate cap as submit_mlm_jobs.py
+    submit_bucket = TokenBucket(float(os.environ.get("RUNPOD_SUBMIT_RPS", "10")))
+
+    def _submit_job(payload: Dict[str, Any]) -> str:
+        submit_bucket.acquire()
+        r = post_with_retry(SESSION, base_url, headers=headers, json=payload, timeout=60)
+        return r.json().get("id", "")
 
-            run_id = data.get("id")
-            log(f"  -> submitted: {run_id}")
-            submitted += 1
+    submitted = submit_jobs(jobs, _submit_job, SUBMITTED_PATH, log=log)
 
     log("")
     log(f"Submitted {submitted}/{total} jobs")
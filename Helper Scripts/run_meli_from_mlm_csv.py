@@ -7,42 +7,40 @@ import csv
 import os
 import sys
 import re
-import requests
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from urllib.parse import urlparse, quote
 import json
 from datetime import datetime
+from pathlib import Path
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+from ugc_tools.env import load_env_from_candidates
+from ugc_tools.http_retry import make_client, post_with_retry
+from ugc_tools.submission_cache import load_submitted, payload_digest, save_submitted
 
 # ================== CONFIG ==================
-# Load from environment or .env file
-def load_env():
-    import os
-    env_files = [
-        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"),
-        os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), ".env"),
-    ]
-    for env_path in env_files:
-        if os.path.exists(env_path):
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and '=' in line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip().strip('"').strip("'")
-                        if key and key not in os.environ:
-                            os.environ[key] = value
-            break
-
-load_env()
+# Load from environment or .env file (repo root, then its parent)
+load_env_from_candidates([Path(REPO_DIR) / ".env", Path(REPO_DIR).parent / ".env"])
 
 RUNPOD_API_KEY = os.environ.get("RUNPOD_API_KEY", "")
 RUNPOD_ENDPOINT_ID = "h55ft9cy7fyi1d"  # MELI Edit Classic
+SUBMIT_URL = f"https://api.runpod.ai/v2/{RUNPOD_ENDPOINT_ID}/run"
 S3_BUCKET = "meli-ai.filmmaker"
 S3_REGION = "us-east-2"
 S3_PREFIX = "MP-Users/Assets"
 OUTPUT_PREFIX = "MP-Users/MLM_Outputs"
 
+SUBMITTED_PATH = Path(REPO_DIR) / ".runpod_submitted.mlm_meli_from_csv.json"
+
+# One pooled client (HTTP/2 when httpx is installed) reused by every job submission.
+SESSION = make_client({
+    "Authorization": f"Bearer {RUNPOD_API_KEY}",
+    "Content-Type": "application/json",
+})
+
 CSV_PATH = "/Users/marianotinti/Desktop/UGC EDITOR/Edit-Pipeline/Files for Edit - MLM_Approved.csv"
 
 # B-roll mapping: product -> S3 filename
@@ -68,28 +66,32 @@ ENDCARD_MAPPING = {
     "1nTA4Lr5hcZj3ToQk75YKx1uNxbYJ88vj": "MLM- tarjeta_debit_mastercard Endcard.mov",
 }
 
+# Compiled once; used for every CSV row.
+# Matches both the /d/{id}/ and ?id={id} URL formats in one pass.
+_DRIVE_ID_RE = re.compile(r'(?:/d/|[?&]id=)([a-zA-Z0-9_-]+)')
+_UNIQUE_ID_RE = re.compile(r'/(\d+)_[^/]+/')
+
+# Columns read from each row; indices are resolved once from the header.
+REQUIRED_COLUMNS = ("Product", "GEO", "Gender", "scene_1_lipsync", "scene_2_lipsync", "scene_3_lipsync")
+
 
 def extract_drive_file_id(url):
     """Extract Google Drive file ID from URL."""
     if not url or url.strip() == "":
         return None
-    # Pattern for /d/{id}/ format
-    match = re.search(r'/d/([a-zA-Z0-9_-]+)', url)
-    if match:
-        return match.group(1)
-    # Pattern for id={id} format
-    match = re.search(r'id=([a-zA-Z0-9_-]+)', url)
-    if match:
-        return match.group(1)
-    return None
+    match = _DRIVE_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
+@lru_cache(maxsize=4096)
 def _normalize_url(url: str) -> str:
     """NFD-decompose the path, then URL-encode non-ASCII."""
     if not url:
         return url
     parsed = urlparse(url)
-    nfd_path = unicodedata.normalize("NFD", parsed.path)
+    path = parsed.path
+    # NFD only changes non-ASCII paths; most S3 keys skip the codepoint scan.
+    nfd_path = path if path.isascii() else unicodedata.normalize("NFD", path)
     safe_path = quote(nfd_path, safe="/-_.~")
     return f"{parsed.scheme}://{parsed.netloc}{safe_path}"
 
@@ -99,16 +101,22 @@ def get_s3_url(filename: str) -> str:
     return f"https://s3.{S3_REGION}.amazonaws.com/{S3_BUCKET}/{S3_PREFIX}/{filename}"
 
 
-def build_payload(row: dict, broll_s3: str, endcard_s3: str) -> dict:
-    """Build MELI Edit Classic payload from CSV row."""
-    product = row["Product"]
-    geo = row["GEO"]
-    gender = row["Gender"]
+# Mapping key -> S3 URL, built once so every row shares the same strings.
+_BROLL_S3 = {k: get_s3_url(v) for k, v in BROLL_MAPPING.items()}
+_ENDCARD_S3 = {k: get_s3_url(v) for k, v in ENDCARD_MAPPING.items()}
+
+
+def build_payload(row: list, cols: dict, broll_s3: str, endcard_s3: str) -> dict:
+    """Build MELI Edit Classic payload from a CSV row; `cols` maps header name -> index."""
+    product = row[cols["Product"]]
+    geo = row[cols["GEO"]]
+    gender = row[cols["Gender"]]
+    scene_urls = [row[cols[f"scene_{n}_lipsync"]] for n in (1, 2, 3)]
     
     # Extract unique ID from scene_1_lipsync URL
-    scene1_url = row["scene_1_lipsync"]
+    scene1_url = scene_urls[0]
     # Pattern: /MP-Users/MLM_NEW/123_product-GEO-gender/...
-    match = re.search(r'/(\d+)_[^/]+/', scene1_url)
+    match = _UNIQUE_ID_RE.search(scene1_url)
     unique_id = match.group(1) if match else "unknown"
     
     output_name = f"{unique_id}_{product}-{geo}-{gender}_edited"
@@ -116,9 +124,9 @@ def build_payload(row: dict, broll_s3: str, endcard_s3: str) -> dict:
     return {
         "input": {
             "clips": [
-                {"url": _normalize_url(row["scene_1_lipsync"]), "type": "lipsync"},
-                {"url": _normalize_url(row["scene_2_lipsync"]), "type": "lipsync"},
-                {"url": _normalize_url(row["scene_3_lipsync"]), "type": "lipsync"},
+                {"url": _normalize_url(scene_urls[0]), "type": "lipsync"},
+                {"url": _normalize_url(scene_urls[1]), "type": "lipsync"},
+                {"url": _normalize_url(scene_urls[2]), "type": "lipsync"},
                 {"url": _normalize_url(broll_s3), "type": "broll"},
                 {"url": _normalize_url(endcard_s3), "type": "endcard"},
             ],
@@ -131,14 +139,8 @@ def build_payload(row: dict, broll_s3: str, endcard_s3: str) -> dict:
 
 def submit_job(payload: dict) -> dict:
     """Submit job to RunPod endpoint."""
-    url = f"https://api.runpod.ai/v2/{RUNPOD_ENDPOINT_ID}/run"
-    headers = {
-        "Authorization": f"Bearer {RUNPOD_API_KEY}",
-        "Content-Type": "application/json",
-    }
-    response = requests.post(url, headers=headers, json=payload, timeout=30)
-    response.raise_for_status()
-    return response.json()
+    # Auth headers live on SESSION; 429/5xx and dropped connections are retried with backoff.
+    return post_with_retry(SESSION, SUBMIT_URL, json=payload, timeout=30).json()
 
 
 def main():
@@ -148,70 +150,108 @@ def main():
     print(f"Output prefix: {OUTPUT_PREFIX}")
     print("=" * 60)
     
-    # Read CSV
+    # Count data lines for progress output without building any row dicts
     with open(CSV_PATH, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+        total = max(sum(1 for _ in f) - 1, 0)
     
-    print(f"\nFound {len(rows)} rows in CSV")
+    print(f"\nFound {total} rows in CSV")
     
-    # Process each row
     successful = 0
     failed = 0
-    job_ids = []
+    rows_read = 0
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    job_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"mlm_job_ids_{timestamp}.txt")
+    submit_workers = int(os.environ.get("RUNPOD_WORKERS", "16"))
+    submitted_by_digest = load_submitted(SUBMITTED_PATH)
+    seen = set(submitted_by_digest)
+    skipped = 0
     
-    for i, row in enumerate(rows, 1):
-        product = row["Product"]
-        geo = row["GEO"]
-        gender = row["Gender"]
-        
-        print(f"\n[{i}/{len(rows)}] {product}-{geo}-{gender}")
-        
-        # Get B-roll S3 URL
-        broll_filename = BROLL_MAPPING.get(product)
-        if not broll_filename:
-            print(f"  ✗ No B-roll mapping for product: {product}")
-            failed += 1
-            continue
-        broll_s3 = get_s3_url(broll_filename)
-        
-        # Get Endcard S3 URL
-        endcard_drive_url = row.get("Endcard", "")
-        endcard_file_id = extract_drive_file_id(endcard_drive_url)
-        endcard_filename = ENDCARD_MAPPING.get(endcard_file_id)
-        if not endcard_filename:
-            print(f"  ✗ No Endcard mapping for Drive ID: {endcard_file_id}")
-            failed += 1
-            continue
-        endcard_s3 = get_s3_url(endcard_filename)
-        
-        print(f"  B-roll: {broll_filename}")
-        print(f"  Endcard: {endcard_filename}")
+    # Stream rows straight into the pool: each job is submitted as soon as its
+    # row is parsed, while the RunPod round trips overlap in the workers.
+    # Job IDs are appended as each submit succeeds, so an aborted run keeps them.
+    with ThreadPoolExecutor(max_workers=submit_workers) as executor, \
+            open(CSV_PATH, 'r', encoding='utf-8') as f, \
+            open(job_file, 'a', buffering=1) as ids_fh:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        cols = {name: idx for idx, name in enumerate(header)}
+        missing = [name for name in REQUIRED_COLUMNS if name not in cols]
+        if missing:
+            raise SystemExit(f"CSV is missing required columns: {', '.join(missing)}")
+        width = len(header)
+        future_map = {}
+        for i, row in enumerate(reader, 1):
+            rows_read = i
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            product = row[cols["Product"]]
+            geo = row[cols["GEO"]]
+            gender = row[cols["Gender"]]
+            
+            print(f"\n[{i}/{total}] {product}-{geo}-{gender}")
+            
+            # Get B-roll S3 URL
+            broll_filename = BROLL_MAPPING.get(product)
+            if not broll_filename:
+                print(f"  ✗ No B-roll mapping for product: {product}")
+                failed += 1
+                continue
+            broll_s3 = _BROLL_S3[product]
+            
+            # Get Endcard S3 URL
+            endcard_drive_url = row[cols["Endcard"]] if "Endcard" in cols else ""
+            endcard_file_id = extract_drive_file_id(endcard_drive_url)
+            endcard_filename = ENDCARD_MAPPING.get(endcard_file_id)
+            if not endcard_filename:
+                print(f"  ✗ No Endcard mapping for Drive ID: {endcard_file_id}")
+                failed += 1
+                continue
+            endcard_s3 = _ENDCARD_S3[endcard_file_id]
+            
+            print(f"  B-roll: {broll_filename}")
+            print(f"  Endcard: {endcard_filename}")
+            
+            try:
+                payload = build_payload(row, cols, broll_s3, endcard_s3)
+            except Exception as e:
+                print(f"  ✗ Failed: {e}")
+                failed += 1
+                continue
+            digest = payload_digest(payload)
+            if digest in seen:
+                cached = submitted_by_digest.get(digest)
+                print("  - Skipped duplicate payload" + (f" (submitted {cached})" if cached else ""))
+                skipped += 1
+                continue
+            seen.add(digest)
+            future_map[executor.submit(submit_job, payload)] = (i, f"{product}-{geo}-{gender}", digest)
         
-        # Build and submit
         try:
-            payload = build_payload(row, broll_s3, endcard_s3)
-            result = submit_job(payload)
-            job_id = result.get("id", "unknown")
-            job_ids.append(job_id)
-            print(f"  ✓ Submitted: {job_id}")
-            successful += 1
-        except Exception as e:
-            print(f"  ✗ Failed: {e}")
-            failed += 1
+            for future in as_completed(future_map):
+                i, label, digest = future_map[future]
+                try:
+                    job_id = future.result().get("id", "unknown")
+                    ids_fh.write(job_id + "\n")
+                    submitted_by_digest[digest] = job_id
+                    print(f"  ✓ [{i}/{total}] {label} submitted: {job_id}")
+                    successful += 1
+                except Exception as e:
+                    print(f"  ✗ [{i}/{total}] {label} failed: {e}")
+                    failed += 1
+        finally:
+            save_submitted(SUBMITTED_PATH, submitted_by_digest)
     
     # Summary
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
-    print(f"Total rows: {len(rows)}")
+    print(f"Total rows: {rows_read}")
     print(f"Successful: {successful}")
     print(f"Failed: {failed}")
+    print(f"Skipped (duplicate): {skipped}")
     
-    if job_ids:
-        print(f"\nJob IDs saved to mlm_job_ids_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
-        with open(f"/Users/marianotinti/Desktop/UGC EDITOR/Edit-Pipeline/Helper Scripts/mlm_job_ids_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt", 'w') as f:
-            f.write('\n'.join(job_ids))
+    if successful:
+        print(f"\nJob IDs saved to: {job_file}")
 
 
 if __name__ == "__main__":
@@ -1,119 +1,120 @@
 #!/usr/bin/env python3
 """Submit MELI Edit Classic jobs for all rows in s3_assets_structured.csv."""
 import csv
-import copy
-import json
 import os
-import requests
-import time
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_DIR = os.path.dirname(BASE_DIR)
+sys.path.insert(0, REPO_DIR)
+from ugc_tools.env import load_env_default
+from ugc_tools.http_retry import TokenBucket, decode_json, make_client, post_with_retry
 CSV_PATH = os.path.join(REPO_DIR, "assets", "IGNOREASSETS", "s3_assets_structured.csv")
 CASES_PATH = os.path.join(REPO_DIR, "presets", "meli_cases.json")
 
-
-def load_env():
-    for path in (
-        os.path.join(REPO_DIR, ".env"),
-        os.path.join(os.path.dirname(REPO_DIR), ".env"),
-        os.path.join(os.getcwd(), ".env"),
-    ):
-        if not os.path.exists(path):
-            continue
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                k, v = line.split("=", 1)
-                os.environ.setdefault(k.strip(), v.strip().strip('"').strip("'"))
-        break
+# One pooled client (HTTP/2 when httpx is installed) reused by every job submission.
+SESSION = make_client()
 
 
 def main():
-    load_env()
+    load_env_default(Path(REPO_DIR))
     api_key = os.environ.get("RUNPOD_API_KEY")
     endpoint_id = os.environ.get("RUNPOD_ENDPOINT_ID", "h55ft9cy7fyi1d")
     if not api_key:
         raise SystemExit("RUNPOD_API_KEY not set")
 
-    with open(CASES_PATH, "r", encoding="utf-8") as f:
-        cases = json.load(f)
+    with open(CASES_PATH, "rb") as f:
+        cases = decode_json(f.read())
     base_style = cases.get("base_style", {})
     default_introcard_url = cases.get("introcard_url", "")
 
     base_url = f"https://api.runpod.ai/v2/{endpoint_id}/run"
-    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    SESSION.headers.update({"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"})
 
     submitted = 0
     errors = []
-    
+    submit_workers = int(os.environ.get("RUNPOD_WORKERS", "16"))
+
+    # Count data lines for progress output without building any row dicts.
     with open(CSV_PATH, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    
-    total = len(rows)
+        total = max(sum(1 for _ in f) - 1, 0)
     print(f"Found {total} rows to process")
-    
-    for i, row in enumerate(rows, 1):
-        parent = row["Parent Folder"].strip()
-        ptype = row["Type"].strip()
-        geo = row["GEO"].strip()
-        scene1 = row["Scene1_URL"].strip()
-        scene2 = row["Scene2_URL"].strip()
-        scene3 = row["Scene3_URL"].strip()
-        introcard_url = (row.get("Introcard_S3_URL") or "").strip() or default_introcard_url
-        broll_url = row["Broll_S3_URL"].strip()
-        endcard_url = row["Endcard_S3_URL"].strip()
-
-        style = copy.deepcopy(base_style)
-        if endcard_url:
-            style.setdefault("endcard", {})
-            style["endcard"]["url"] = endcard_url
-
-        clips = []
-        if introcard_url:
-            clips.append({"type": "introcard", "url": introcard_url})
-        clips.extend(
-            [
-                {"type": "scene", "url": scene1},
-                {"type": "scene", "url": scene2},
-                {"type": "broll", "url": broll_url},
-                {"type": "scene", "url": scene3},
-            ]
-        )
-        if endcard_url:
-            clips.append({"type": "endcard", "url": endcard_url})
-
-        payload = {
-            "input": {
-                "job_id": f"meli_{parent}",
-                "geo": geo,
-                "output_folder": "MELI_Exports/2026-02",
-                "output_filename": f"{parent}_MELI_EDIT.mp4",
-                "clips": clips,
-                "music_url": "random",
-                "subtitle_mode": "auto",
-                "edit_preset": "standard_vertical",
-                "style_overrides": style,
+
+    # Spread submissions at a steady rate instead of bursting into RunPod's /run limit.
+    bucket = TokenBucket(float(os.environ.get("RUNPOD_SUBMIT_RPS", "20")))
+
+    def _submit_job(payload):
+        bucket.acquire()
+        return post_with_retry(SESSION, base_url, json=payload, timeout=60).json().get("id")
+
+    # Stream rows straight into the pool so the first job is submitted while
+    # the rest of the CSV is still being parsed. The semaphore caps queued
+    # payloads at twice the worker count, so memory follows the pool, not the file.
+    backlog = threading.BoundedSemaphore(2 * submit_workers)
+
+    with ThreadPoolExecutor(max_workers=submit_workers) as executor, \
+            open(CSV_PATH, newline="", encoding="utf-8") as f:
+        future_map = {}
+        for i, row in enumerate(csv.DictReader(f), 1):
+            parent = row["Parent Folder"].strip()
+            ptype = row["Type"].strip()
+            geo = row["GEO"].strip()
+            scene1 = row["Scene1_URL"].strip()
+            scene2 = row["Scene2_URL"].strip()
+            scene3 = row["Scene3_URL"].strip()
+            introcard_url = (row.get("Introcard_S3_URL") or "").strip() or default_introcard_url
+            broll_url = row["Broll_S3_URL"].strip()
+            endcard_url = row["Endcard_S3_URL"].strip()
+
+            style = dict(base_style)
+            if endcard_url:
+                style["endcard"] = {**(base_style.get("endcard") or {}), "url": endcard_url}
+
+            clips = []
+            if introcard_url:
+                clips.append({"type": "introcard", "url": introcard_url})
+            clips.extend(
+                [
+                    {"type": "scene", "url": scene1},
+                    {"type": "scene", "url": scene2},
+                    {"type": "broll", "url": broll_url},
+                    {"type": "scene", "url": scene3},
+                ]
+            )
+            if endcard_url:
+                clips.append({"type": "endcard", "url": endcard_url})
+
+            payload = {
+                "input": {
+                    "job_id": f"meli_{parent}",
+                    "geo": geo,
+                    "output_folder": "MELI_Exports/2026-02",
+                    "output_filename": f"{parent}_MELI_EDIT.mp4",
+                    "clips": clips,
+                    "music_url": "random",
+                    "subtitle_mode": "auto",
+                    "edit_preset": "standard_vertical",
+                    "style_overrides": style,
+                }
             }
-        }
-
-        try:
-            r = requests.post(base_url, headers=headers, json=payload, timeout=60)
-            r.raise_for_status()
-            data = r.json()
-            run_id = data.get("id")
-            print(f"[{i}/{total}] {parent} ({ptype}/{geo}): submitted {run_id}")
-            submitted += 1
-        except Exception as e:
-            print(f"[{i}/{total}] {parent} ({ptype}/{geo}): ERROR - {e}")
-            errors.append((parent, str(e)))
-        
-        # Small delay to avoid rate limiting
-        if i % 10 == 0:
-            time.sleep(0.5)
+
+            backlog.acquire()
+            future = executor.submit(_submit_job, payload)
+            future.add_done_callback(lambda _: backlog.release())
+            future_map[future] = (i, parent, ptype, geo)
+
+        for future in as_completed(future_map):
+            i, parent, ptype, geo = future_map[future]
+            try:
+                run_id = future.result()
+                print(f"[{i}/{total}] {parent} ({ptype}/{geo}): submitted {run_id}")
+                submitted += 1
+            except Exception as e:
+                print(f"[{i}/{total}] {parent} ({ptype}/{geo}): ERROR - {e}")
+                errors.append((parent, str(e)))
 
     print(f"\n=== Summary ===")
     print(f"Submitted: {submitted}/{total} jobs")
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 """Submit MELI EDIT CLASSIC jobs from USERS FILES FOR EDIT, MLA APPROVED.s3.csv."""
 import csv
-import copy
 import json
 import os
 import re
 import sys
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Any
 
 import requests
@@ -19,53 +20,27 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_DIR = os.path.dirname(BASE_DIR)
 sys.path.insert(0, REPO_DIR)
 from geo_mapping import normalize_geo
+from ugc_tools.env import load_env_default
+from ugc_tools.run_log import RunLog
 DEFAULT_CSV_PATH = os.path.join(REPO_DIR, "Files for Edit - MARIAN ESTOS SON PARA EDITAR.presigned.csv")
 CASES_PATH = os.path.join(REPO_DIR, "presets", "meli_cases.json")
 LOG_PATH = os.path.join(REPO_DIR, "users_meli_from_csv.log")
 
 
-def load_env_from_dotenv() -> None:
-    candidates = [
-        os.path.join(REPO_DIR, ".env"),
-        os.path.join(os.path.dirname(REPO_DIR), ".env"),
-        os.path.join(os.getcwd(), ".env"),
-    ]
-    for path in candidates:
-        if not os.path.exists(path):
-            continue
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
-                        continue
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and key not in os.environ:
-                        os.environ[key] = value
-        except OSError:
-            pass
-        break
-
-
-def log(message: str) -> None:
-    text = str(message)
-    print(text)
-    try:
-        with open(LOG_PATH, "a", encoding="utf-8") as lf:
-            lf.write(text + "\n")
-    except OSError:
-        pass
+log = RunLog(LOG_PATH)
+
+
+_SCENE1_PARENT_RE = re.compile(r"/([^/]+)/[^/]+_scene_1(?:_lipsync)?\.mp4")
+_GENERIC_PARENT_RE = re.compile(r"/([^/]+)/[^/]+\.mp4")
 
 
 def parse_parent_from_scene_url(url: str) -> str:
     if not url:
         return "UNKNOWN"
-    m = re.search(r"/([^/]+)/[^/]+_scene_1(?:_lipsync)?\.mp4", url)
+    m = _SCENE1_PARENT_RE.search(url)
     if m:
         return m.group(1)
-    m = re.search(r"/([^/]+)/[^/]+\.mp4", url)
+    m = _GENERIC_PARENT_RE.search(url)
     if m:
         return m.group(1)
     return "UNKNOWN"
@@ -130,6 +105,7 @@ def _build_row_dict(headers: list, values: list) -> Dict[str, str]:
     return row
 
 
+@lru_cache(maxsize=4096)
 def _normalize_url(url: str) -> str:
     from urllib.parse import quote
     url = (url or "").strip()
@@ -321,14 +297,14 @@ def build_payload(
     safe_record = _sanitize_filename_part(record_id)
     safe_prod = _sanitize_filename_part(prod)
 
-    style = copy.deepcopy(base_style)
-    style.setdefault("endcard", {})
-    style["endcard"]["url"] = endcard_url
+    # Shallow copy: subdicts edited below (endcard, highlight) are copied first.
+    style = {**base_style, "endcard": {**(base_style.get("endcard") or {}), "url": endcard_url}}
     # Requested subtitle style: no black stroke; text uses stroke color as fill.
     if style.get("stroke_color"):
         style["color"] = style.get("stroke_color")
     style["stroke_width"] = 0
     if isinstance(style.get("highlight"), dict):
+        style["highlight"] = dict(style["highlight"])
         style["highlight"]["stroke_width"] = 0
         if style["highlight"].get("stroke_color"):
             style["highlight"]["text_color"] = style["highlight"]["stroke_color"]
@@ -405,7 +381,7 @@ def main() -> None:
     if not os.path.exists(CASES_PATH):
         raise SystemExit(f"Cases config not found: {CASES_PATH}")
 
-    load_env_from_dotenv()
+    load_env_default(Path(REPO_DIR))
 
     api_key = os.environ.get("RUNPOD_API_KEY")
     endpoint_id = os.environ.get("RUNPOD_ENDPOINT_ID", "h55ft9cy7fyi1d")
@@ -429,11 +405,7 @@ def main() -> None:
         s3_region = os.environ.get("AWS_DEFAULT_REGION", "us-east-2")
         s3_client = boto3.client("s3", region_name=s3_region)
 
-    try:
-        if os.path.exists(LOG_PATH):
-            os.remove(LOG_PATH)
-    except OSError:
-        pass
+    log.reset()
 
     log(f"Using endpoint {endpoint_id}")
 
@@ -12,6 +12,8 @@ import json
 import os
 import re
 import sys
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 import requests
@@ -22,7 +24,9 @@ REPO_DIR = os.path.dirname(BASE_DIR)
 sys.path.insert(0, REPO_DIR)
 
 from geo_mapping import normalize_geo  # noqa: E402
+from ugc_tools.env import load_env_default  # noqa: E402
 from ugc_tools.meli_subtitle_style import apply_meli_flat_subtitle_style  # noqa: E402
+from ugc_tools.run_log import RunLog  # noqa: E402
 
 MELI_CASES_PATH = os.path.join(REPO_DIR, "presets", "meli_cases.json")
 DEFAULT_OUTPUT_BUCKET = "meli-ai.filmmaker"
@@ -80,38 +84,10 @@ def build_horizontal_style_overrides() -> Dict[str, Any]:
     return style
 
 
-def load_env_from_dotenv() -> None:
-    for path in (
-        os.path.join(REPO_DIR, ".env"),
-        os.path.join(os.path.dirname(REPO_DIR), ".env"),
-        os.path.join(os.getcwd(), ".env"),
-    ):
-        if not os.path.exists(path):
-            continue
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
-                        continue
-                    k, _, v = line.partition("=")
-                    k, v = k.strip(), v.strip().strip('"').strip("'")
-                    if k and k not in os.environ:
-                        os.environ[k] = v
-        except OSError:
-            pass
-        break
-
-
-def log(msg: str) -> None:
-    print(msg)
-    try:
-        with open(LOG_PATH, "a", encoding="utf-8") as lf:
-            lf.write(msg + "\n")
-    except OSError:
-        pass
+log = RunLog(LOG_PATH)
 
 
+@lru_cache(maxsize=4096)
 def _normalize_url(url: str) -> str:
     from urllib.parse import quote
 
@@ -228,14 +204,10 @@ def main() -> None:
     csv_path = resolve_csv_path(args.csv)
     if not os.path.exists(csv_path):
         raise SystemExit(f"CSV not found: {csv_path}")
-    load_env_from_dotenv()
+    load_env_default(Path(REPO_DIR))
     api_key = os.environ.get("RUNPOD_API_KEY")
     endpoint_id = os.environ.get("RUNPOD_ENDPOINT_ID", DEFAULT_ENDPOINT)
-    try:
-        if os.path.exists(LOG_PATH):
-            os.remove(LOG_PATH)
-    except OSError:
-        pass
+    log.reset()
     style_template = build_horizontal_style_overrides()
     log(f"Horizontal MELI — fontsize={style_template.get('fontsize')} clip_order={args.clip_order}")
     log(f"CSV: {csv_path}")
@@ -1,32 +1,30 @@
 #!/usr/bin/env python3
 """RunPod helper CLI.
 
-Consolidates submit, status, poll, and endpoint image update into one tool.
+Consolidates submit, status, poll, poll-many, and endpoint image update into one tool.
 """
 
 import argparse
 import json
+import logging
 import os
+import random
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
-import requests
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from ugc_tools.env import load_env_from_candidates
+from ugc_tools.http_retry import make_client
 
 REPO = Path("/Users/marianotinti/Desktop/UGC EDITOR/Edit-Pipeline")
 DEFAULT_PAYLOAD = REPO / "assets" / "IGNOREASSETS" / "local_meli_first_row_payload.json"
 DEFAULT_IMAGE = "docker.io/marianotintiwc/edit-pipeline:latest"
 
-
-def load_env(env_path: Path) -> None:
-    if not env_path.exists():
-        return
-    for line in env_path.read_text().splitlines():
-        if not line.strip() or line.strip().startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+# Poll loops log one INFO line per response; full bodies only at LOGLEVEL=DEBUG.
+log = logging.getLogger(__name__)
 
 
 def require_env(*keys: str) -> None:
@@ -60,7 +58,8 @@ def run_submit(payload_path: Path, endpoint_id: str, api_key: str) -> None:
         "Content-Type": "application/json",
     }
 
-    resp = requests.post(f"{base}/run", headers=headers, json=payload, timeout=60)
+    with make_client(headers) as client:
+        resp = client.post(f"{base}/run", json=payload, timeout=60)
     print("RUN HTTP", resp.status_code)
     print(resp.text)
     resp.raise_for_status()
@@ -74,25 +73,113 @@ def run_submit(payload_path: Path, endpoint_id: str, api_key: str) -> None:
 
 def run_status(job_id: str, endpoint_id: str, api_key: str) -> None:
     base = f"https://api.runpod.ai/v2/{endpoint_id}"
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = requests.get(f"{base}/status/{job_id}", headers=headers, timeout=30)
+    with make_client({"Authorization": f"Bearer {api_key}"}) as client:
+        resp = client.get(f"{base}/status/{job_id}", timeout=30)
     print("STATUS HTTP", resp.status_code)
     print(resp.text)
 
 
-def run_poll(job_id: str, endpoint_id: str, api_key: str, interval: float, max_polls: int) -> None:
+def run_poll(
+    job_id: str,
+    endpoint_id: str,
+    api_key: str,
+    interval: float,
+    max_polls: int,
+    min_interval: float = 2.0,
+) -> None:
+    """Poll until a terminal status.
+
+    The wait starts at ``min_interval`` and doubles (with jitter) up to
+    ``interval`` while the status stays the same; any transition resets it.
+    """
+    base = f"https://api.runpod.ai/v2/{endpoint_id}"
+    delay = min(min_interval, interval)
+    last_status = None
+    # One session so every poll reuses the same TLS connection.
+    with make_client({"Authorization": f"Bearer {api_key}"}) as session:
+        for i in range(1, max_polls + 1):
+            time.sleep(delay * random.uniform(0.8, 1.2))
+            resp = session.get(f"{base}/status/{job_id}", timeout=30)
+            status = None
+            if resp.status_code == 200:
+                status = resp.json().get("status")
+            log.info("POLL %d HTTP %s status=%s", i, resp.status_code, status)
+            log.debug("body=%s", resp.text)
+            if status in {"COMPLETED", "FAILED", "CANCELLED"}:
+                break
+            delay = min_interval if status != last_status else min(interval, delay * 2)
+            last_status = status
+
+
+def run_poll_many(
+    job_ids: list,
+    endpoint_id: str,
+    api_key: str,
+    interval: float,
+    min_interval: float = 2.0,
+    workers: int = 16,
+    deadline: float = 1800.0,
+) -> None:
+    """Poll many jobs in rounds until all are terminal or ``deadline`` seconds pass.
+
+    Each round fetches every pending job concurrently over one pooled client,
+    then waits with the same backoff as run_poll (reset whenever any job moves).
+    A 4xx other than 429 (unknown job, bad key or endpoint) is terminal for
+    that job: repeating the request cannot succeed.
+    """
     base = f"https://api.runpod.ai/v2/{endpoint_id}"
-    headers = {"Authorization": f"Bearer {api_key}"}
-
-    for i in range(1, max_polls + 1):
-        time.sleep(interval)
-        resp = requests.get(f"{base}/status/{job_id}", headers=headers, timeout=30)
-        print(f"POLL {i} HTTP", resp.status_code)
-        print(resp.text)
-        if resp.status_code == 200:
-            data = resp.json()
-            if data.get("status") in {"COMPLETED", "FAILED", "CANCELLED"}:
+    terminal = {"COMPLETED", "FAILED", "CANCELLED", "TIMED_OUT", "NOT_FOUND"}
+
+    def is_terminal(status) -> bool:
+        if status in terminal:
+            return True
+        return isinstance(status, str) and status.startswith("HTTP_4") and status != "HTTP_429"
+
+    statuses = {job_id: None for job_id in dict.fromkeys(job_ids)}
+    delay = min(min_interval, interval)
+    start = time.monotonic()
+
+    with make_client({"Authorization": f"Bearer {api_key}"}) as session, \
+            ThreadPoolExecutor(max_workers=max(1, min(workers, len(statuses)))) as pool:
+
+        def fetch(job_id: str):
+            try:
+                resp = session.get(f"{base}/status/{job_id}", timeout=30)
+                if resp.status_code == 200:
+                    return resp.json().get("status")
+                if resp.status_code == 404:
+                    # Unknown or expired job id: it will never finish, stop polling it.
+                    return "NOT_FOUND"
+                return f"HTTP_{resp.status_code}"
+            except Exception as exc:
+                return f"ERROR: {exc}"
+
+        round_num = 0
+        while True:
+            pending = [job_id for job_id, status in statuses.items() if not is_terminal(status)]
+            if not pending:
                 break
+            if round_num:
+                wait = delay * random.uniform(0.8, 1.2)
+                if time.monotonic() - start + wait >= deadline:
+                    print(f"Gave up after {deadline:.0f}s; {len(pending)} job(s) still pending")
+                    break
+                time.sleep(wait)
+            round_num += 1
+            changed = False
+            for job_id, status in zip(pending, pool.map(fetch, pending)):
+                if status != statuses[job_id]:
+                    print(f"{job_id} {status}")
+                    statuses[job_id] = status
+                    changed = True
+            still_pending = sum(1 for status in statuses.values() if not is_terminal(status))
+            print(f"ROUND {round_num}: {still_pending}/{len(statuses)} pending")
+            delay = min_interval if changed else min(interval, delay * 2)
+
+    summary = {}
+    for status in statuses.values():
+        summary[status] = summary.get(status, 0) + 1
+    print(json.dumps(summary, indent=2))
 
 
 def run_update_image(endpoint_id: str, api_key: str, image_name: str) -> None:
@@ -101,8 +188,10 @@ def run_update_image(endpoint_id: str, api_key: str, image_name: str) -> None:
         "Content-Type": "application/json",
     }
 
+    session = make_client(headers)
+
     endpoint_url = f"https://rest.runpod.io/v1/endpoints/{endpoint_id}"
-    endpoint_resp = requests.get(endpoint_url, headers=headers, timeout=30)
+    endpoint_resp = session.get(endpoint_url, timeout=30)
     print("Endpoint HTTP", endpoint_resp.status_code)
     endpoint_resp.raise_for_status()
     endpoint = endpoint_resp.json()
@@ -116,7 +205,7 @@ def run_update_image(endpoint_id: str, api_key: str, image_name: str) -> None:
 
     update_url = f"https://rest.runpod.io/v1/templates/{template_id}"
     update_body = {"imageName": image_name}
-    update_resp = requests.patch(update_url, headers=headers, json=update_body, timeout=30)
+    update_resp = session.patch(update_url, json=update_body, timeout=30)
     print("Update HTTP", update_resp.status_code)
     update_resp.raise_for_status()
 
@@ -150,9 +239,17 @@ def build_parser() -> argparse.ArgumentParser:
 
     poll_parser = subparsers.add_parser("poll", help="Poll job status")
     poll_parser.add_argument("job_id", help="RunPod job id")
-    poll_parser.add_argument("--interval", type=float, default=10.0, help="Seconds between polls")
+    poll_parser.add_argument("--interval", type=float, default=30.0, help="Maximum seconds between polls")
+    poll_parser.add_argument("--min-interval", type=float, default=2.0, help="First wait; doubles while status is unchanged")
     poll_parser.add_argument("--max-polls", type=int, default=30, help="Maximum polls before exit")
 
+    poll_many_parser = subparsers.add_parser("poll-many", help="Poll several jobs until all finish")
+    poll_many_parser.add_argument("job_ids", nargs="+", help="RunPod job ids")
+    poll_many_parser.add_argument("--interval", type=float, default=30.0, help="Maximum seconds between rounds")
+    poll_many_parser.add_argument("--min-interval", type=float, default=2.0, help="First wait; doubles while nothing changes")
+    poll_many_parser.add_argument("--workers", type=int, default=16, help="Concurrent status requests per round")
+    poll_many_parser.add_argument("--deadline", type=float, default=1800.0, help="Stop polling after this many seconds")
+
     update_parser = subparsers.add_parser("update-image", help="Update endpoint template image")
     update_parser.add_argument("--image", default=DEFAULT_IMAGE, help="Docker image name")
 
@@ -162,8 +259,9 @@ def build_parser() -> argparse.ArgumentParser:
 def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO").upper(), format="%(message)s", stream=sys.stdout)
 
-    load_env(Path(args.env))
+    load_env_from_candidates([Path(args.env)])
     endpoint_id = get_endpoint_id(args.endpoint_id)
     api_key = get_api_key()
 
@@ -174,7 +272,12 @@ def main() -> int:
         run_status(args.job_id, endpoint_id, api_key)
         return 0
     if args.command == "poll":
-        run_poll(args.job_id, endpoint_id, api_key, args.interval, args.max_polls)
+        run_poll(args.job_id, endpoint_id, api_key, args.interval, args.max_polls, args.min_interval)
+        return 0
+    if args.command == "poll-many":
+        run_poll_many(
+            args.job_ids, endpoint_id, api_key, args.interval, args.min_interval, args.workers, args.deadline
+        )
         return 0
     if args.command == "update-image":
         run_update_image(endpoint_id, api_key, args.image)
@@ -1,19 +1,16 @@
 import os
 import sys
 from pathlib import Path
-import requests
 
-REPO = Path("/Users/marianotinti/Desktop/UGC EDITOR/Edit-Pipeline")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from ugc_tools.env import load_env_from_candidates
+from ugc_tools.http_retry import make_client
 
+REPO = Path("/Users/marianotinti/Desktop/UGC EDITOR/Edit-Pipeline")
 
-def load_env(env_path: Path) -> None:
-    if not env_path.exists():
-        return
-    for line in env_path.read_text().splitlines():
-        if not line.strip() or line.strip().startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+# One keep-alive session for every RunPod call; retry policy from
+# ugc_tools.http_retry (POSTs only on 429/503 or connect errors).
+SESSION = make_client(pool_size=16, http2=False)
 
 
 def main() -> None:
@@ -21,7 +18,7 @@ def main() -> None:
         raise SystemExit("Usage: runpod_status.py <job_id>")
 
     job_id = sys.argv[1]
-    load_env(REPO / ".env")
+    load_env_from_candidates([REPO / ".env"])
 
     api_key = os.getenv("RUNPOD_API_KEY")
     endpoint_id = os.getenv("RUNPOD_ENDPOINT_ID", "3zysuiunu9iacy")
@@ -31,7 +28,7 @@ def main() -> None:
 
     base = f"https://api.runpod.ai/v2/{endpoint_id}"
     headers = {"Authorization": f"Bearer {api_key}"}
-    resp = requests.get(f"{base}/status/{job_id}", headers=headers, timeout=30)
+    resp = SESSION.get(f"{base}/status/{job_id}", headers=headers, timeout=30)
     print("STATUS HTTP", resp.status_code)
     print(resp.text)
 
@@ -1,26 +1,91 @@
+import argparse
+import logging
 import os
-import json
+import sys
+import random
 import time
 from pathlib import Path
 
 import requests
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from ugc_tools.env import load_env_from_candidates
+from ugc_tools.http_retry import decode_json, encode_json, make_client
+
 REPO = Path("/Users/marianotinti/Desktop/UGC EDITOR/Edit-Pipeline")
 PAYLOAD_PATH = REPO / "assets" / "IGNOREASSETS" / "local_meli_first_row_payload.json"
-
-
-def load_env(env_path: Path) -> None:
-    if not env_path.exists():
-        return
-    for line in env_path.read_text().splitlines():
-        if not line.strip() or line.strip().startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+TERMINAL_STATUSES = {"COMPLETED", "FAILED", "CANCELLED"}
+
+# Poll loops log one INFO line per response; full bodies only at LOGLEVEL=DEBUG.
+log = logging.getLogger(__name__)
+
+# One keep-alive session for every RunPod call; retry policy from
+# ugc_tools.http_retry (POSTs only on 429/503 or connect errors).
+SESSION = make_client(pool_size=16, http2=False)
+
+
+def backoff_delay(attempt: int, initial: float, cap: float) -> float:
+    """Exponential wait for `attempt` (0-based), capped, plus up to 0.5s jitter."""
+    return min(cap, initial * 2 ** attempt) + random.uniform(0, 0.5)
+
+
+def stream_until_terminal(
+    session: requests.Session,
+    base: str,
+    job_id: str,
+    deadline_at: float,
+    initial: float = 1.0,
+    cap: float = 30.0,
+) -> bool:
+    """Follow `/stream/{job_id}` until the job reaches a terminal status.
+
+    RunPod holds each stream request open until it has output or a status
+    change, so this replaces the status poll loop. A stream that ends on a
+    non-terminal status (usual for non-generator handlers) is reopened after
+    `backoff_delay`. Returns False if the stream drops or errors; the caller
+    falls back to polling `/status`.
+    """
+    attempt = 0
+    while time.monotonic() < deadline_at:
+        if attempt:
+            delay = backoff_delay(attempt - 1, initial, cap)
+            if time.monotonic() + delay >= deadline_at:
+                return False
+            time.sleep(delay)
+        attempt += 1
+        try:
+            with session.get(
+                f"{base}/stream/{job_id}",
+                stream=True,
+                timeout=(5, max(1.0, deadline_at - time.monotonic())),
+            ) as resp:
+                print("STREAM HTTP", resp.status_code)
+                if resp.status_code != 200:
+                    return False
+                status = None
+                for line in resp.iter_lines(decode_unicode=True):
+                    if not line:
+                        continue
+                    status = decode_json(line).get("status", status)
+                    log.info("STREAM status=%s", status)
+                    log.debug("body=%s", line)
+                    if status in TERMINAL_STATUSES:
+                        return True
+        except (requests.RequestException, ValueError) as e:
+            print("STREAM ERROR", e)
+            return False
+    return False
 
 
 def main() -> None:
-    load_env(REPO / ".env")
+    parser = argparse.ArgumentParser(description="Submit the local MELI payload and poll until it finishes")
+    parser.add_argument("--initial-interval", type=float, default=1.0, help="First poll wait in seconds")
+    parser.add_argument("--max-interval", type=float, default=30.0, help="Cap on the poll wait in seconds")
+    parser.add_argument("--deadline", type=float, default=1800.0, help="Stop polling after this many seconds")
+    args = parser.parse_args()
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO").upper(), format="%(message)s", stream=sys.stdout)
+
+    load_env_from_candidates([REPO / ".env"])
 
     api_key = os.getenv("RUNPOD_API_KEY")
     endpoint_id = os.getenv("RUNPOD_ENDPOINT_ID", "3zysuiunu9iacy")
@@ -31,7 +96,7 @@ def main() -> None:
     if not PAYLOAD_PATH.exists():
         raise SystemExit(f"Payload not found: {PAYLOAD_PATH}")
 
-    payload = json.loads(PAYLOAD_PATH.read_text())
+    payload = decode_json(PAYLOAD_PATH.read_bytes())
 
     base = f"https://api.runpod.ai/v2/{endpoint_id}"
     headers = {
@@ -39,27 +104,67 @@ def main() -> None:
         "Content-Type": "application/json",
     }
 
-    run_resp = requests.post(f"{base}/run", headers=headers, json=payload, timeout=60)
+    SESSION.headers.update(headers)
+
+    # orjson-encoded bytes when available; Content-Type is already on SESSION.
+    run_resp = SESSION.post(f"{base}/run", data=encode_json(payload), timeout=60)
     print("RUN HTTP", run_resp.status_code)
     print(run_resp.text)
     run_resp.raise_for_status()
 
-    job_id = run_resp.json().get("id")
+    job_id = decode_json(run_resp.content).get("id")
     if not job_id:
         raise SystemExit("No job id returned")
 
     print("JOB_ID", job_id)
 
-    for i in range(1, 31):
-        time.sleep(10)
-        status_resp = requests.get(f"{base}/status/{job_id}", headers=headers, timeout=30)
-        print(f"POLL {i} HTTP", status_resp.status_code)
-        print(status_resp.text)
-        if status_resp.status_code != 200:
+    start = time.monotonic()
+    if stream_until_terminal(
+        SESSION, base, job_id, start + args.deadline, args.initial_interval, args.max_interval
+    ):
+        return
+
+    # Stream unavailable: poll /status instead. Short jobs are caught by the
+    # first few quick polls; long ones back off to max_interval. Server errors
+    # back off on their own counter. The last ETag is sent back as
+    # If-None-Match so an unchanged status can come back as an empty 304.
+    attempt = 0
+    error_attempt = 0
+    etag = None
+    delay = backoff_delay(0, args.initial_interval, args.max_interval)
+    i = 0
+    while time.monotonic() - start + delay < args.deadline:
+        time.sleep(delay)
+        i += 1
+        try:
+            status_resp = SESSION.get(
+                f"{base}/status/{job_id}",
+                headers={"If-None-Match": etag} if etag else None,
+                timeout=30,
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            print(f"POLL {i} ERROR", e)
+            error_attempt += 1
+            delay = backoff_delay(error_attempt, args.initial_interval, args.max_interval)
             continue
-        data = status_resp.json()
-        if data.get("status") in {"COMPLETED", "FAILED", "CANCELLED"}:
+        status = None
+        if status_resp.status_code == 200:
+            etag = status_resp.headers.get("ETag") or etag
+            status = decode_json(status_resp.content).get("status")
+        log.info("POLL %d HTTP %s status=%s", i, status_resp.status_code, status)
+        if status_resp.status_code != 304:
+            log.debug("body=%s", status_resp.text)
+        if status in TERMINAL_STATUSES:
             break
+        if status_resp.status_code == 429 or status_resp.status_code >= 500:
+            error_attempt += 1
+            delay = backoff_delay(error_attempt, args.initial_interval, args.max_interval)
+            continue
+        error_attempt = 0
+        attempt += 1
+        delay = backoff_delay(attempt, args.initial_interval, args.max_interval)
+    else:
+        print(f"Gave up after {args.deadline:.0f}s; job {job_id} is still running")
 
 
 if __name__ == "__main__":
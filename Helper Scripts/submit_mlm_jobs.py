@@ -4,21 +4,43 @@ Submit MLM jobs to RunPod from the updated CSV
 """
 
 import csv
+import json
 import requests
 import os
-import time
-from dotenv import load_dotenv
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
-load_dotenv()
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from ugc_tools.env import load_env_default
+from ugc_tools.http_retry import TokenBucket, make_client, post_with_retry
+from ugc_tools.submission_cache import load_submitted, payload_digest, save_submitted
+
+load_env_default(Path(__file__).resolve().parent.parent)
 
 # Configuration
 RUNPOD_API_KEY = os.getenv("RUNPOD_API_KEY")
 ENDPOINT_ID = "h55ft9cy7fyi1d"  # MELI Edit Classic
 CSV_PATH = "/Users/marianotinti/Desktop/UGC EDITOR/Edit-Pipeline/Files for Edit - MLM_Approved.s3.csv"
 OUTPUT_PREFIX = "MP-Users/MLM_Outputs"
+OUTPUT_DIR = "/Users/marianotinti/Desktop/UGC EDITOR/Edit-Pipeline"
+REPORT_PATH = os.path.join(OUTPUT_DIR, "mlm_submit_report.json")
+SUBMIT_URL = f"https://api.runpod.ai/v2/{ENDPOINT_ID}/run"
 
-def submit_job(row, row_num):
-    """Submit a single job to RunPod"""
+SUBMITTED_PATH = Path(__file__).resolve().parent.parent / ".runpod_submitted.submit_mlm_jobs.json"
+
+# One keep-alive session shared by the submit threads; retry policy from
+# ugc_tools.http_retry (POSTs only on 429/503 or connect errors).
+SESSION = make_client(pool_size=16, http2=False)
+SESSION.headers.update({
+    "Authorization": f"Bearer {RUNPOD_API_KEY}",
+    "Content-Type": "application/json",
+})
+# Caps the submit rate across threads (the old serial loop slept 0.1s per row).
+SUBMIT_BUCKET = TokenBucket(float(os.environ.get("RUNPOD_SUBMIT_RPS", "10")))
+
+def build_payload(row):
+    """Build the RunPod payload for one CSV row"""
     
     # Extract video ID from scene_1 URL
     # Example: .../12_60_de_regalo-MLM-male/12_60_de_regalo-MLM-male_scene_1_lipsync.mp4
@@ -39,21 +61,17 @@ def submit_job(row, row_num):
             "s3_output_prefix": OUTPUT_PREFIX
         }
     }
-    
-    headers = {
-        "Authorization": f"Bearer {RUNPOD_API_KEY}",
-        "Content-Type": "application/json"
-    }
-    
-    url = f"https://api.runpod.ai/v2/{ENDPOINT_ID}/run"
-    
-    response = requests.post(url, json=payload, headers=headers)
-    
-    if response.status_code == 200:
-        data = response.json()
-        return data.get("id"), None
-    else:
-        return None, f"HTTP {response.status_code}: {response.text}"
+    return payload
+
+def submit_job(payload):
+    """Submit a single job to RunPod"""
+    SUBMIT_BUCKET.acquire()
+    try:
+        # Retries 429/503 or connect errors, honouring Retry-After.
+        response = post_with_retry(SESSION, SUBMIT_URL, json=payload, timeout=60)
+    except requests.HTTPError as e:
+        return None, f"HTTP {e.response.status_code}: {e.response.text}"
+    return response.json().get("id"), None
 
 def main():
     print("=" * 60)
@@ -63,35 +81,61 @@ def main():
     print(f"Output: s3://meli-ai.filmmaker/{OUTPUT_PREFIX}/")
     print()
     
-    # Read CSV
-    rows = []
+    # Count data lines for progress output; rows are streamed into the pool below
     with open(CSV_PATH, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            rows.append(row)
+        total = max(sum(1 for _ in f) - 1, 0)
     
-    print(f"Found {len(rows)} jobs to submit")
+    print(f"Found {total} jobs to submit")
     print()
     
-    # Submit jobs
-    job_ids = []
-    errors = []
+    # Submit jobs concurrently; results are printed here as each one finishes
+    # Indexed by row number (total from the line count is an upper bound on rows)
+    job_ids_by_row = [None] * total
+    errors_by_row = [None] * total
+    duplicates = 0
+    workers = int(os.environ.get("RUNPOD_WORKERS", "16"))
+    submitted_by_digest = load_submitted(SUBMITTED_PATH)
+    seen = set(submitted_by_digest)
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor, \
+            open(CSV_PATH, "r", encoding="utf-8") as f:
+        future_map = {}
+        for i, row in enumerate(csv.DictReader(f), 1):
+            payload = build_payload(row)
+            digest = payload_digest(payload)
+            if digest in seen:
+                cached = submitted_by_digest.get(digest)
+                print(f"[{i:2d}/{total}] = {row['Product']}-{row['Gender']}: dedup" + (f" ({cached})" if cached else ""))
+                duplicates += 1
+                continue
+            seen.add(digest)
+            future_map[executor.submit(submit_job, payload)] = (i, row["Product"], row["Gender"], digest)
+        try:
+            for future in as_completed(future_map):
+                i, product, gender, digest = future_map[future]
+                try:
+                    job_id, error = future.result()
+                except requests.RequestException as e:
+                    job_id, error = None, str(e)
+                
+                if job_id:
+                    job_ids_by_row[i - 1] = job_id
+                    submitted_by_digest[digest] = job_id
+                    print(f"[{i:2d}/{total}] ✓ {product}-{gender}: {job_id}")
+                else:
+                    errors_by_row[i - 1] = (i, product, error)
+                    print(f"[{i:2d}/{total}] ✗ {product}-{gender}: {error}")
+        finally:
+            save_submitted(SUBMITTED_PATH, submitted_by_digest)
+    
+    job_ids = [job_id for job_id in job_ids_by_row if job_id]
+    errors = [error for error in errors_by_row if error]
     
-    for i, row in enumerate(rows, 1):
-        product = row["Product"]
-        gender = row["Gender"]
-        
-        job_id, error = submit_job(row, i)
-        
-        if job_id:
-            job_ids.append(job_id)
-            print(f"[{i:2d}/{len(rows)}] ✓ {product}-{gender}: {job_id}")
-        else:
-            errors.append((i, product, error))
-            print(f"[{i:2d}/{len(rows)}] ✗ {product}-{gender}: {error}")
-        
-        # Small delay to avoid rate limiting
-        time.sleep(0.1)
+    # Per-row outcome, keyed by CSV row number
+    success_report = {str(i): job_id for i, job_id in enumerate(job_ids_by_row, 1) if job_id}
+    failure_report = {str(row_num): {"product": product, "error": error} for row_num, product, error in errors}
+    with open(REPORT_PATH, "w", encoding="utf-8") as f:
+        json.dump({"submitted": success_report, "failed": failure_report}, f, indent=2, ensure_ascii=False)
     
     # Summary
     print()
@@ -100,11 +144,13 @@ def main():
     print("=" * 60)
     print(f"✓ Submitted: {len(job_ids)}")
     print(f"✗ Failed: {len(errors)}")
+    print(f"= Duplicates skipped: {duplicates}")
+    print(f"Report saved to: {os.path.basename(REPORT_PATH)}")
     
     if job_ids:
         print()
         print("Job IDs saved to: mlm_job_ids.txt")
-        with open("/Users/marianotinti/Desktop/UGC EDITOR/Edit-Pipeline/mlm_job_ids.txt", "w") as f:
+        with open(os.path.join(OUTPUT_DIR, "mlm_job_ids.txt"), "w") as f:
             for jid in job_ids:
                 f.write(jid + "\n")
     
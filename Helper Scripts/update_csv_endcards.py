@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Update CSV with correct endcard URLs"""
 import csv
+import hashlib
+import os
 from urllib.parse import quote
 
 csv_path = "/Users/marianotinti/Desktop/UGC EDITOR/Edit-Pipeline/Files for Edit - MLM_Approved.s3.csv"
@@ -18,26 +20,49 @@ PRODUCT_ENDCARD_MAP = {
     "tarjeta_debit_mastercard": "MLM- Pide tu Tarjeta ahora.mov",
 }
 
-rows = []
-with open(csv_path, "r", encoding="utf-8") as f:
-    reader = csv.DictReader(f)
-    fieldnames = reader.fieldnames
-    for row in reader:
-        rows.append(row)
 
-for row in rows:
-    product = row["Product"]
-    endcard_name = PRODUCT_ENDCARD_MAP.get(product)
-    if endcard_name:
-        encoded_name = quote(endcard_name)
-        row["ENDCARD S3"] = f"https://s3.us-east-2.amazonaws.com/{BUCKET}/{PREFIX}{encoded_name}"
+def csv_digest(path):
+    """Digest of the CSV bytes + endcard map; matches the sidecar after a rewrite."""
+    with open(path, "rb") as f:
+        h = hashlib.blake2b(f.read(), digest_size=16)
+    h.update(repr(sorted(PRODUCT_ENDCARD_MAP.items())).encode())
+    return h.hexdigest()
+
 
-with open(csv_path, "w", encoding="utf-8", newline="") as f:
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
+# The CSV is rewritten in place, so the sidecar holds the digest of our own
+# output: if it still matches, the file is already up to date.
+hash_path = csv_path + ".hash"
+try:
+    with open(hash_path, "r", encoding="utf-8") as f:
+        unchanged = f.read().strip() == csv_digest(csv_path)
+except OSError:
+    unchanged = False
+if unchanged:
+    print("CSV unchanged since last run, skipping rewrite")
+    raise SystemExit(0)
+
+# Stream rows into a temp file next to the CSV, then swap it in place. The
+# 64 KiB write buffer turns the per-row writes into a few large ones.
+tmp_path = csv_path + ".tmp"
+updated = 0
+with open(csv_path, "r", encoding="utf-8") as fin, \
+        open(tmp_path, "w", encoding="utf-8", newline="", buffering=1 << 16) as fout:
+    reader = csv.DictReader(fin)
+    writer = csv.DictWriter(fout, fieldnames=reader.fieldnames)
     writer.writeheader()
-    writer.writerows(rows)
+    for row in reader:
+        product = row["Product"]
+        endcard_name = PRODUCT_ENDCARD_MAP.get(product)
+        if endcard_name:
+            encoded_name = quote(endcard_name)
+            row["ENDCARD S3"] = f"https://s3.us-east-2.amazonaws.com/{BUCKET}/{PREFIX}{encoded_name}"
+        writer.writerow(row)
+        updated += 1
+os.replace(tmp_path, csv_path)
+with open(hash_path, "w", encoding="utf-8") as f:
+    f.write(csv_digest(csv_path) + "\n")
 
-print(f"Updated {len(rows)} rows in CSV")
+print(f"Updated {updated} rows in CSV")
 print()
 print("ENDCARD MAPPING:")
 for p, e in PRODUCT_ENDCARD_MAP.items():
@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 """Update MLM CSV with correct S3 URLs for B-rolls and Endcards."""
 import csv
+import hashlib
 import os
 from urllib.parse import quote
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 INPUT_CSV = os.path.join(BASE_DIR, "Files for Edit - MLM_Approved.csv")
 OUTPUT_CSV = os.path.join(BASE_DIR, "Files for Edit - MLM_Approved.s3.csv")
+# Digest of the input CSV + mappings that produced OUTPUT_CSV, plus the
+# output's size and mtime when it was written.
+HASH_PATH = OUTPUT_CSV + ".hash"
 
 S3_BASE = "https://s3.us-east-2.amazonaws.com/meli-ai.filmmaker/MP-Users/Assets"
 
@@ -41,66 +45,103 @@ def get_s3_url(filename):
     return f"{S3_BASE}/{encoded}"
 
 
+# Every product's S3 URLs, encoded once; rows only do a dict lookup.
+_BROLL_S3 = {k: get_s3_url(v) for k, v in BROLL_MAPPING.items()}
+_ENDCARD_S3 = {k: get_s3_url(v) for k, v in ENDCARD_MAPPING.items()}
+
+
+def _inputs_digest():
+    """Digest of everything the output depends on: input CSV bytes + mappings."""
+    with open(INPUT_CSV, 'rb') as f:
+        h = hashlib.blake2b(f.read(), digest_size=16)
+    h.update(repr(sorted(BROLL_MAPPING.items())).encode())
+    h.update(repr(sorted(ENDCARD_MAPPING.items())).encode())
+    return h.hexdigest()
+
+
+def _sidecar_line(digest):
+    """`digest size mtime_ns`: edits to OUTPUT_CSV itself also invalidate the skip."""
+    st = os.stat(OUTPUT_CSV)
+    return f"{digest} {st.st_size} {st.st_mtime_ns}"
+
+
 def main():
     print("=" * 60)
     print("Updating MLM CSV with S3 URLs")
     print("=" * 60)
     
-    # Read CSV
-    with open(INPUT_CSV, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-        fieldnames = list(reader.fieldnames)
-    
-    # Add S3 columns if not present
-    if "BROLL S3" not in fieldnames:
-        fieldnames.append("BROLL S3")
-    if "ENDCARD S3" not in fieldnames:
-        fieldnames.append("ENDCARD S3")
+    # Skip the rewrite when neither the input, the mappings nor the output changed
+    digest = _inputs_digest()
+    if os.path.exists(OUTPUT_CSV):
+        try:
+            with open(HASH_PATH, 'r', encoding='utf-8') as f:
+                if f.read().strip() == _sidecar_line(digest):
+                    print(f"\n✓ Unchanged since last run, skipping: {OUTPUT_CSV}")
+                    return
+        except OSError:
+            pass
     
-    print(f"\nProcessing {len(rows)} rows...")
-    
-    # Update rows
-    for row in rows:
-        product = row["Product"]
+    # Stream rows straight from the input CSV to a temp file next to the
+    # output, then swap it in: an interrupted run never leaves a truncated
+    # OUTPUT_CSV. The 64 KiB write buffer batches the per-row writes.
+    updated = 0
+    tmp_path = OUTPUT_CSV + ".tmp"
+    with open(INPUT_CSV, 'r', encoding='utf-8') as fin, \
+            open(tmp_path, 'w', encoding='utf-8', newline='', buffering=1 << 16) as fout:
+        reader = csv.DictReader(fin)
+        fieldnames = list(reader.fieldnames or [])
         
-        # Set B-roll S3 URL
-        broll_file = BROLL_MAPPING.get(product)
-        if broll_file:
-            row["BROLL S3"] = get_s3_url(broll_file)
-        else:
-            print(f"  WARNING: No B-roll mapping for: {product}")
+        # Add S3 columns if not present
+        if "BROLL S3" not in fieldnames:
+            fieldnames.append("BROLL S3")
+        if "ENDCARD S3" not in fieldnames:
+            fieldnames.append("ENDCARD S3")
         
-        # Set Endcard S3 URL
-        endcard_file = ENDCARD_MAPPING.get(product)
-        if endcard_file:
-            row["ENDCARD S3"] = get_s3_url(endcard_file)
-        else:
-            print(f"  WARNING: No Endcard mapping for: {product}")
-    
-    # Write updated CSV
-    with open(OUTPUT_CSV, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(fout, fieldnames=fieldnames)
         writer.writeheader()
-        writer.writerows(rows)
+        
+        print("\nProcessing rows...")
+        
+        for row in reader:
+            product = row["Product"]
+            
+            # Set B-roll S3 URL
+            broll_url = _BROLL_S3.get(product)
+            if broll_url:
+                row["BROLL S3"] = broll_url
+            else:
+                print(f"  WARNING: No B-roll mapping for: {product}")
+            
+            # Set Endcard S3 URL
+            endcard_url = _ENDCARD_S3.get(product)
+            if endcard_url:
+                row["ENDCARD S3"] = endcard_url
+            else:
+                print(f"  WARNING: No Endcard mapping for: {product}")
+            
+            writer.writerow(row)
+            updated += 1
+    
+    os.replace(tmp_path, OUTPUT_CSV)
+    
+    with open(HASH_PATH, 'w', encoding='utf-8') as f:
+        f.write(_sidecar_line(digest) + "\n")
     
-    print(f"\n✓ Updated {len(rows)} rows")
+    print(f"\n✓ Updated {updated} rows")
     print(f"✓ Saved to: {OUTPUT_CSV}")
     
     # Show mapping summary
     print("\n" + "=" * 60)
     print("B-ROLL MAPPING")
     print("=" * 60)
-    for product, filename in BROLL_MAPPING.items():
-        url = get_s3_url(filename)
+    for product, url in _BROLL_S3.items():
         print(f"  {product}:")
         print(f"    -> {url}")
     
     print("\n" + "=" * 60)
     print("ENDCARD MAPPING")
     print("=" * 60)
-    for product, filename in ENDCARD_MAPPING.items():
-        url = get_s3_url(filename)
+    for product, url in _ENDCARD_S3.items():
         print(f"  {product}:")
         print(f"    -> {url}")
 
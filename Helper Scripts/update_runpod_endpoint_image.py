@@ -1,24 +1,18 @@
 import os
+import sys
 import json
 from pathlib import Path
 import requests
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from ugc_tools.env import load_env_from_candidates
+
 REPO = Path("/Users/marianotinti/Desktop/UGC EDITOR/Edit-Pipeline")
 TARGET_IMAGE = "docker.io/marianotintiwc/edit-pipeline:v1.09"
 
 
-def load_env(env_path: Path) -> None:
-    if not env_path.exists():
-        return
-    for line in env_path.read_text().splitlines():
-        if not line.strip() or line.strip().startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
-
-
 def main() -> None:
-    load_env(REPO / ".env")
+    load_env_from_candidates([REPO / ".env"])
 
     api_key = os.getenv("RUNPOD_API_KEY")
     endpoint_id = os.getenv("RUNPOD_ENDPOINT_ID")
@@ -9,13 +9,18 @@ then updates mlb_edit_mapping.csv with S3 URLs.
 import csv
 import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import boto3
+from boto3.s3.transfer import TransferConfig
 from pathlib import Path
 import gdown
-from dotenv import load_dotenv
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from ugc_tools.env import load_env_default
 
 # Load environment variables from .env
-load_dotenv()
+load_env_default(Path(__file__).resolve().parent.parent)
 
 # S3 Configuration
 S3_BUCKET = "meli-ai.filmmaker"
@@ -25,12 +30,35 @@ AWS_REGION = "us-east-2"
 # Local temp directory
 TEMP_DIR = Path("batch_temp/broll_upload")
 
+# One S3 client for the listing and every upload (boto3 clients are thread-safe)
+S3 = boto3.client(
+    's3',
+    region_name=AWS_REGION,
+    aws_access_key_id=os.environ.get('AWS_ACCESS_KEY_ID'),
+    aws_secret_access_key=os.environ.get('AWS_SECRET_ACCESS_KEY')
+)
+
+# Drive URL formats: .../file/d/{id}/... and ...?id={id}
+_DRIVE_PATH_ID = re.compile(r'/d/([a-zA-Z0-9_-]+)')
+_DRIVE_QUERY_ID = re.compile(r'[?&]id=([a-zA-Z0-9_-]+)')
+
+# Files downloaded/uploaded in parallel
+WORKERS = int(os.environ.get("UPLOAD_WORKERS", "4"))
+
+# Upload large videos as parallel 8 MiB parts
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
 
 def extract_drive_id(url: str) -> str:
     """Extract Google Drive file ID from URL."""
     if not url:
         return None
-    match = re.search(r'/d/([a-zA-Z0-9_-]+)', url)
+    match = _DRIVE_PATH_ID.search(url) or _DRIVE_QUERY_ID.search(url)
     return match.group(1) if match else None
 
 
@@ -61,20 +89,14 @@ def download_from_drive(file_id: str, output_path: Path) -> bool:
 
 def upload_to_s3(local_path: Path, s3_key: str) -> str:
     """Upload file to S3 and return the URL."""
-    s3 = boto3.client(
-        's3',
-        region_name=AWS_REGION,
-        aws_access_key_id=os.environ.get('AWS_ACCESS_KEY_ID'),
-        aws_secret_access_key=os.environ.get('AWS_SECRET_ACCESS_KEY')
-    )
-    
     try:
         print(f"  ☁️  Uploading to s3://{S3_BUCKET}/{s3_key}...")
-        s3.upload_file(
+        S3.upload_file(
             str(local_path),
             S3_BUCKET,
             s3_key,
-            ExtraArgs={'ContentType': 'video/mp4'}
+            ExtraArgs={'ContentType': 'video/mp4'},
+            Config=TRANSFER_CONFIG
         )
         s3_url = f"https://s3.{AWS_REGION}.amazonaws.com/{S3_BUCKET}/{s3_key}"
         print(f"  ✅ Uploaded: {s3_url}")
@@ -84,97 +106,108 @@ def upload_to_s3(local_path: Path, s3_key: str) -> str:
         return None
 
 
+def migrate_asset(kind: str, drive_id: str, info: dict, existing: set) -> str:
+    """Copy one Drive asset to S3 (unless already there) and return its S3 URL."""
+    label = "B-roll" if kind == "broll" else "Endcard"
+    print(f"\n🎬 {label}: {info['value_prop']} ({drive_id})")
+    
+    local_path = TEMP_DIR / f"{kind}_{drive_id}.mp4"
+    s3_key = f"{S3_PREFIX}/{kind}_{drive_id}.mp4"
+    
+    if s3_key in existing:
+        print(f"  ⏭️  Already in S3: {s3_key}")
+        return f"https://s3.{AWS_REGION}.amazonaws.com/{S3_BUCKET}/{s3_key}"
+    if download_from_drive(drive_id, local_path):
+        return upload_to_s3(local_path, s3_key)
+    return None
+
+
 def main():
     # Create temp directory
     TEMP_DIR.mkdir(parents=True, exist_ok=True)
     
     # Load mapping
     mapping_path = "mlb_edit_mapping.csv"
-    with open(mapping_path, 'r', encoding='utf-8') as f:
-        rows = list(csv.DictReader(f))
-    
-    print(f"✅ Loaded {len(rows)} MLB projects\n")
     
-    # Collect unique B-roll and Endcard URLs
+    # Collect unique B-roll and Endcard URLs in one streaming pass; the CSV is
+    # read again below when it is rewritten, so rows are never held in memory.
     unique_brolls = {}
     unique_endcards = {}
     
-    for row in rows:
-        broll_url = row.get('Broll_URL', '').strip()
-        endcard_url = row.get('Endcard_URL', '').strip()
-        value_prop = row.get('ValueProp', '').strip()
-        
-        broll_id = extract_drive_id(broll_url)
-        endcard_id = extract_drive_id(endcard_url)
-        
-        if broll_id and broll_id not in unique_brolls:
-            unique_brolls[broll_id] = {'value_prop': value_prop, 'original_url': broll_url}
-        
-        if endcard_id and endcard_id not in unique_endcards:
-            unique_endcards[endcard_id] = {'value_prop': value_prop, 'original_url': endcard_url}
-    
+    project_count = 0
+    with open(mapping_path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            project_count += 1
+            broll_url = row.get('Broll_URL', '').strip()
+            endcard_url = row.get('Endcard_URL', '').strip()
+            value_prop = row.get('ValueProp', '').strip()
+            
+            broll_id = extract_drive_id(broll_url)
+            endcard_id = extract_drive_id(endcard_url)
+            
+            if broll_id and broll_id not in unique_brolls:
+                unique_brolls[broll_id] = {'value_prop': value_prop, 'original_url': broll_url}
+            
+            if endcard_id and endcard_id not in unique_endcards:
+                unique_endcards[endcard_id] = {'value_prop': value_prop, 'original_url': endcard_url}
+    
+    print(f"✅ Loaded {project_count} MLB projects\n")
     print(f"📁 Unique B-rolls: {len(unique_brolls)}")
     print(f"📁 Unique Endcards: {len(unique_endcards)}\n")
     
-    # Download and upload B-rolls
+    # List what is already in S3 once, so existing assets skip download + upload
+    existing = {
+        obj['Key']
+        for page in S3.get_paginator('list_objects_v2').paginate(Bucket=S3_BUCKET, Prefix=f"{S3_PREFIX}/")
+        for obj in page.get('Contents', [])
+    }
+    
+    # Download and upload B-rolls and Endcards together; each worker downloads
+    # then uploads, so one file's download overlaps another's upload.
     print("=" * 60)
-    print("PROCESSING B-ROLLS")
+    print("PROCESSING B-ROLLS AND ENDCARDS")
     print("=" * 60)
     
     broll_s3_map = {}  # drive_id -> s3_url
-    for drive_id, info in unique_brolls.items():
-        print(f"\n🎬 B-roll: {info['value_prop']} ({drive_id})")
-        
-        local_path = TEMP_DIR / f"broll_{drive_id}.mp4"
-        
-        if download_from_drive(drive_id, local_path):
-            s3_key = f"{S3_PREFIX}/broll_{drive_id}.mp4"
-            s3_url = upload_to_s3(local_path, s3_key)
-            if s3_url:
-                broll_s3_map[drive_id] = s3_url
-    
-    # Download and upload Endcards
-    print("\n" + "=" * 60)
-    print("PROCESSING ENDCARDS")
-    print("=" * 60)
-    
     endcard_s3_map = {}  # drive_id -> s3_url
-    for drive_id, info in unique_endcards.items():
-        print(f"\n🎬 Endcard: {info['value_prop']} ({drive_id})")
-        
-        local_path = TEMP_DIR / f"endcard_{drive_id}.mp4"
-        
-        if download_from_drive(drive_id, local_path):
-            s3_key = f"{S3_PREFIX}/endcard_{drive_id}.mp4"
-            s3_url = upload_to_s3(local_path, s3_key)
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        future_map = {}
+        for kind, unique, s3_map in (
+            ("broll", unique_brolls, broll_s3_map),
+            ("endcard", unique_endcards, endcard_s3_map),
+        ):
+            for drive_id, info in unique.items():
+                future = executor.submit(migrate_asset, kind, drive_id, info, existing)
+                future_map[future] = (drive_id, s3_map)
+        for future in as_completed(future_map):
+            drive_id, s3_map = future_map[future]
+            s3_url = future.result()
             if s3_url:
-                endcard_s3_map[drive_id] = s3_url
+                s3_map[drive_id] = s3_url
     
     # Update mapping CSV
     print("\n" + "=" * 60)
     print("UPDATING MAPPING CSV")
     print("=" * 60)
     
-    updated_rows = []
-    for row in rows:
-        broll_id = extract_drive_id(row.get('Broll_URL', ''))
-        endcard_id = extract_drive_id(row.get('Endcard_URL', ''))
-        
-        if broll_id and broll_id in broll_s3_map:
-            row['Broll_URL'] = broll_s3_map[broll_id]
-        
-        if endcard_id and endcard_id in endcard_s3_map:
-            row['Endcard_URL'] = endcard_s3_map[endcard_id]
-        
-        updated_rows.append(row)
-    
-    # Write updated CSV
+    # Rewrite row by row from the mapping CSV into the S3 mapping CSV
     output_path = "mlb_edit_mapping_s3.csv"
-    fieldnames = list(rows[0].keys())
-    with open(output_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+    with open(mapping_path, 'r', encoding='utf-8') as fin, \
+            open(output_path, 'w', encoding='utf-8', newline='') as fout:
+        reader = csv.DictReader(fin)
+        writer = csv.DictWriter(fout, fieldnames=reader.fieldnames)
         writer.writeheader()
-        writer.writerows(updated_rows)
+        for row in reader:
+            broll_id = extract_drive_id(row.get('Broll_URL', ''))
+            endcard_id = extract_drive_id(row.get('Endcard_URL', ''))
+            
+            if broll_id and broll_id in broll_s3_map:
+                row['Broll_URL'] = broll_s3_map[broll_id]
+            
+            if endcard_id and endcard_id in endcard_s3_map:
+                row['Endcard_URL'] = endcard_s3_map[endcard_id]
+            
+            writer.writerow(row)
     
     print(f"\n✅ Updated mapping saved to: {output_path}")
     print(f"   B-rolls migrated: {len(broll_s3_map)}/{len(unique_brolls)}")
@@ -41,7 +41,7 @@ Input Schema:
         # === PROCESSING ===
         "edit_preset": str,                    # "standard_vertical", "no_interpolation", "no_subtitles", "simple_concat"
         "enable_interpolation": bool,          # Enable RIFE (default: true)
-        "rife_model": str,                     # "rife-v4" | "rife-v4.6" (default: "rife-v4")
+        "rife_model": str,                     # "rife-v4" | "rife-v4.6" | "minterpolate" (default: "rife-v4")
         "input_fps": float | int,              # Source FPS for interpolation (default: 24)
         "style_overrides": dict | None,        # Partial style.json overrides
         "output_filename": str | None,         # Custom output filename
@@ -90,15 +90,23 @@ import logging
 import traceback
 import random
 import glob
+import hashlib
 import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Dict, Any, List, Optional, Tuple, Union
+from functools import lru_cache
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
 import runpod
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
 # Add project root to path for imports
@@ -315,13 +323,33 @@ class ProcessingContext:
 # S3 Upload
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Multipart uploads with parallel parts; rendered MP4s are often hundreds of MB.
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True,
+)
+
+
+@lru_cache(maxsize=1)
 def get_s3_client():
-    """Create S3 client from environment variables."""
+    """
+    Create S3 client from environment variables.
+    
+    Built once per worker and shared: boto3 clients are thread-safe, and the
+    connection pool is sized for S3_TRANSFER_CONFIG's part threads.
+    """
     return boto3.client(
         's3',
         aws_access_key_id=os.environ.get('AWS_ACCESS_KEY_ID'),
         aws_secret_access_key=os.environ.get('AWS_SECRET_ACCESS_KEY'),
-        region_name=os.environ.get('AWS_REGION', 'us-east-1')
+        region_name=os.environ.get('AWS_REGION', 'us-east-1'),
+        config=BotoConfig(
+            max_pool_connections=32,
+            tcp_keepalive=True,
+            retries={'mode': 'adaptive', 'max_attempts': 5},
+        ),
     )
 
 
@@ -351,7 +379,8 @@ def upload_to_s3(
         key,
         ExtraArgs={
             'ContentType': content_type
-        }
+        },
+        Config=S3_TRANSFER_CONFIG
     )
     
     region = os.environ.get('AWS_REGION', 'us-east-1')
@@ -402,6 +431,33 @@ def download_from_s3(
 # File Downloads
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Shared keep-alive session for public URL downloads, so concurrent and
+# repeated downloads reuse pooled HTTPS connections.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
+
+# Input clips, music and manual SRT download in parallel on one pool.
+DOWNLOAD_WORKERS = 4
+
+# Read/write size for streamed downloads (vs 8 KiB: far fewer Python-level calls).
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Download cache size cap; least recently used objects are evicted past it.
+DOWNLOAD_CACHE_MAX_BYTES = int(os.environ.get("DOWNLOAD_CACHE_MAX_BYTES", 20 * 1024 ** 3))
+
+# Query parameters that mark a presigned/expiring URL (S3 SigV4/V2, CloudFront, GCS).
+PRESIGNED_QUERY_PARAMS = (
+    "x-amz-signature", "signature", "x-amz-credential", "expires", "x-goog-signature",
+)
+
+
 def parse_s3_url(url: str) -> Optional[Tuple[str, str]]:
     """
     Parse an S3 URL to extract bucket and key.
@@ -439,20 +495,164 @@ def parse_s3_url(url: str) -> Optional[Tuple[str, str]]:
     return None
 
 
-def download_file(url: str, dest_path: str, ctx: ProcessingContext) -> str:
+def _is_presigned_url(url: str) -> bool:
+    """True when the URL carries a signature/expiry query (GET-signed URLs reject HEAD)."""
+    from urllib.parse import parse_qsl, urlsplit
+    return any(name.lower() in PRESIGNED_QUERY_PARAMS for name, _ in parse_qsl(urlsplit(url).query))
+
+
+def _normalize_cache_url(url: str) -> str:
+    """scheme://host/path with the host lowercased and the query/fragment dropped."""
+    from urllib.parse import urlsplit
+    parts = urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path}"
+
+
+def _download_cache_key(source: str, etag: Optional[str], size: Any) -> Optional[str]:
+    """
+    Cache key for a remote object from its source + ETag + size.
+    
+    `source` is the normalized URL (or s3://bucket/key): ETags are only
+    unique per object, not across hosts or buckets. Weak ETags are not cached.
+    """
+    if not etag or etag.startswith('W/'):
+        return None
+    tag = etag.strip('"')
+    return hashlib.sha256(f"{source}\n{tag}:{size}".encode()).hexdigest()
+
+
+def _link_or_copy(src: str, dest: str) -> None:
+    """Hardlink when src and dest share a filesystem, else copy."""
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+
+def _file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _download_cache_lookup(cache_dir: str, cache_key: str, dest_path: str) -> bool:
+    cached = os.path.join(cache_dir, "etag", cache_key)
+    if not os.path.exists(cached):
+        return False
+    _link_or_copy(cached, dest_path)
+    try:
+        # Entries are hardlinks of their blob: this marks the content as
+        # recently used for eviction
+        os.utime(cached)
+    except OSError:
+        pass
+    return True
+
+
+def _download_cache_evict(cache_dir: str, max_bytes: int, ctx: ProcessingContext) -> None:
+    """Drop least recently used blobs (and the entries linking to them) until under max_bytes."""
+    blob_dir = os.path.join(cache_dir, "sha256")
+    entry_dir = os.path.join(cache_dir, "etag")
+    try:
+        blobs = [e for e in os.scandir(blob_dir) if e.is_file() and not e.name.endswith(".tmp")]
+        stats = {e.path: e.stat() for e in blobs}
+    except OSError:
+        return
+    total = sum(st.st_size for st in stats.values())
+    if total <= max_bytes:
+        return
+    
+    entries_by_inode: Dict[Tuple[int, int], List[str]] = {}
+    try:
+        for e in os.scandir(entry_dir):
+            st = e.stat()
+            entries_by_inode.setdefault((st.st_dev, st.st_ino), []).append(e.path)
+    except OSError:
+        pass
+    
+    evicted = 0
+    for path, st in sorted(stats.items(), key=lambda item: item[1].st_mtime):
+        if total <= max_bytes:
+            break
+        try:
+            for entry in entries_by_inode.get((st.st_dev, st.st_ino), []):
+                os.remove(entry)
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            ctx.log(f"  [cache] Could not evict {os.path.basename(path)}: {e}", "WARN")
+            continue
+        total -= st.st_size
+        evicted += 1
+    if evicted:
+        ctx.log(f"  [cache] Evicted {evicted} object(s), {total / (1024 * 1024):.0f} MB cached")
+
+
+def _download_cache_store(
+    cache_dir: str,
+    cache_key: str,
+    path: str,
+    ctx: ProcessingContext,
+    digest: Optional[str] = None
+) -> None:
+    """
+    Add a finished download to the cache, then evict down to DOWNLOAD_CACHE_MAX_BYTES.
+    
+    Content lives once under sha256/<digest> (identical bytes from different
+    URLs share it); etag/<key> is a hardlink to it for lookups.
+    """
+    try:
+        digest = digest or _file_sha256(path)
+        blob = os.path.join(cache_dir, "sha256", digest)
+        entry = os.path.join(cache_dir, "etag", cache_key)
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        # Link to a unique temp name, then rename: parallel downloads of the
+        # same object can race here
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        if not os.path.exists(blob):
+            _link_or_copy(path, blob + suffix)
+            os.replace(blob + suffix, blob)
+        _link_or_copy(blob, entry + suffix)
+        os.replace(entry + suffix, entry)
+        os.utime(blob)
+    except OSError as e:
+        ctx.log(f"  [cache] Could not cache {os.path.basename(path)}: {e}", "WARN")
+        return
+    _download_cache_evict(cache_dir, DOWNLOAD_CACHE_MAX_BYTES, ctx)
+
+
+def download_file(
+    url: str,
+    dest_path: str,
+    ctx: ProcessingContext,
+    session: Optional[requests.Session] = None,
+    cache_dir: Optional[str] = None
+) -> str:
     """
     Download a file from URL to local path.
     Automatically detects S3 URLs and uses authenticated boto3 download.
     
+    The download cache is opt-in (DOWNLOAD_CACHE_DIR): objects with a strong
+    ETag are served from it on repeat jobs instead of being downloaded again.
+    Presigned URLs are never HEAD-ed or cached.
+    
     Args:
         url: Source URL
         dest_path: Destination file path
         ctx: Processing context for logging
+        session: HTTP session for public URLs (default: shared SESSION)
+        cache_dir: Download cache (default: DOWNLOAD_CACHE_DIR env; unset/empty disables)
         
     Returns:
         Path to downloaded file
     """
     ctx.log(f"Downloading: {url[:80]}...")
+    if cache_dir is None:
+        cache_dir = os.environ.get('DOWNLOAD_CACHE_DIR')
     
     # Check if this is an S3 URL that needs authenticated download
     s3_info = parse_s3_url(url)
@@ -461,7 +661,18 @@ def download_file(url: str, dest_path: str, ctx: ProcessingContext) -> str:
         ctx.log(f"  [S3] Authenticated download from {bucket}/{key[:50]}...")
         try:
             s3 = get_s3_client()
+            cache_key = None
+            if cache_dir:
+                head = s3.head_object(Bucket=bucket, Key=key)
+                cache_key = _download_cache_key(
+                    f"s3://{bucket}/{key}", head.get('ETag'), head.get('ContentLength')
+                )
+                if cache_key and _download_cache_lookup(cache_dir, cache_key, dest_path):
+                    ctx.log(f"Cache hit: {os.path.basename(dest_path)}")
+                    return dest_path
             s3.download_file(bucket, key, dest_path)
+            if cache_key:
+                _download_cache_store(cache_dir, cache_key, dest_path, ctx)
             size_mb = os.path.getsize(dest_path) / (1024 * 1024)
             ctx.log(f"Downloaded: {os.path.basename(dest_path)} ({size_mb:.1f} MB)")
             return dest_path
@@ -470,16 +681,38 @@ def download_file(url: str, dest_path: str, ctx: ProcessingContext) -> str:
             # Fall through to try as public URL
     
     # Try as public URL
-    response = requests.get(url, stream=True, timeout=300)
+    http = session or SESSION
+    cache_key = None
+    if cache_dir and not _is_presigned_url(url):
+        try:
+            head = http.head(url, allow_redirects=True, timeout=30)
+            if head.ok:
+                cache_key = _download_cache_key(
+                    _normalize_cache_url(url), head.headers.get('ETag'), head.headers.get('Content-Length')
+                )
+        except requests.RequestException:
+            pass
+        if cache_key and _download_cache_lookup(cache_dir, cache_key, dest_path):
+            ctx.log(f"Cache hit: {os.path.basename(dest_path)}")
+            return dest_path
+    
+    response = http.get(url, stream=True, timeout=300)
     response.raise_for_status()
     
-    total_size = int(response.headers.get('content-length', 0))
-    downloaded = 0
+    # Hash while streaming so caching needs no second read of the file
+    digest = hashlib.sha256() if cache_key else None
     
     with open(dest_path, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            f.write(chunk)
-            downloaded += len(chunk)
+        if digest is None:
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+        else:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                digest.update(chunk)
+    
+    if cache_key:
+        _download_cache_store(cache_dir, cache_key, dest_path, ctx, digest.hexdigest())
     
     size_mb = os.path.getsize(dest_path) / (1024 * 1024)
     ctx.log(f"Downloaded: {os.path.basename(dest_path)} ({size_mb:.1f} MB)")
@@ -490,17 +723,26 @@ def download_file(url: str, dest_path: str, ctx: ProcessingContext) -> str:
 def download_videos(
     clips: List[ClipInput],
     work_dir: str,
-    ctx: ProcessingContext
+    ctx: ProcessingContext,
+    executor: Optional[ThreadPoolExecutor] = None
 ) -> List[Dict[str, Any]]:
     """
     Download all input videos to work directory.
     
-    Returns list of clip dicts with local paths and trim info.
+    Downloads run concurrently on ``executor`` (or a private pool of
+    DOWNLOAD_WORKERS threads).
+    
+    Returns list of clip dicts with local paths and trim info, in clip order.
     """
     video_dir = os.path.join(work_dir, "videos")
     os.makedirs(video_dir, exist_ok=True)
     
-    downloaded_clips = []
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+            return download_videos(clips, work_dir, ctx, executor=pool)
+    
+    dests = []
+    futures = []
     for i, clip in enumerate(clips):
         # Extract extension from URL or default to .mp4
         ext = os.path.splitext(clip.url.split('?')[0])[1] or '.mp4'
@@ -514,8 +756,12 @@ def download_videos(
         else:
             clip_type_prefix = "scene"
         dest = os.path.join(video_dir, f"{clip_type_prefix}_{i+1}{ext}")
-        download_file(clip.url, dest, ctx)
-        
+        dests.append(dest)
+        futures.append(executor.submit(download_file, clip.url, dest, ctx))
+    
+    downloaded_clips = []
+    for clip, dest, future in zip(clips, dests, futures):
+        future.result()
         downloaded_clips.append({
             "path": dest,
             "type": clip.clip_type,
@@ -592,6 +838,152 @@ def generate_clips_config(downloaded_clips: List[Dict[str, Any]], work_dir: str,
     return config_path
 
 
+def _probe_stream_params(path: str, ffprobe: str) -> Optional[List[Dict[str, Any]]]:
+    """Codec parameters of every stream in `path` (what concat stream-copy needs to match)."""
+    import subprocess
+    result = subprocess.run(
+        [
+            ffprobe, "-v", "error",
+            "-show_entries",
+            "stream=codec_type,codec_name,profile,width,height,pix_fmt,r_frame_rate,sample_rate,channels",
+            "-of", "json",
+            path
+        ],
+        capture_output=True,
+        text=True,
+        timeout=30
+    )
+    if result.returncode != 0:
+        return None
+    streams = json.loads(result.stdout or "{}").get("streams") or []
+    return [{k: v for k, v in stream.items() if k != "index"} for stream in streams] or None
+
+
+def _probe_duration(path: str, ffprobe: str) -> Optional[float]:
+    """Container duration of `path` in seconds, or None if it cannot be probed."""
+    import subprocess
+    probe = subprocess.run(
+        [ffprobe, "-v", "error", "-show_entries", "format=duration", "-of", "json", path],
+        capture_output=True,
+        text=True,
+        timeout=30
+    )
+    try:
+        return float(json.loads(probe.stdout)["format"]["duration"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def concat_stream_copy(
+    downloaded_clips: List[Dict[str, Any]],
+    target_resolution: Tuple[int, int],
+    export_fps: float,
+    output_path: str,
+    ctx: ProcessingContext
+) -> Optional[float]:
+    """
+    Concatenate clips with FFmpeg's concat demuxer, copying the video stream.
+    
+    Only applies when every clip is an untrimmed scene with identical codec
+    parameters, already at the target resolution and export frame rate.
+    B-roll is excluded: the default style alpha-fills every b-roll in
+    process_clips, which a stream copy would skip. Audio is re-encoded with
+    the same per-clip boundary fades process_clips applies. Returns the output
+    duration, or None when the clips do not qualify, FFmpeg fails or a probe
+    fails (the caller then takes the normal MoviePy path).
+    """
+    import subprocess
+    from fractions import Fraction
+    from ugc_pipeline.clips import TRANSITION_AUDIO_FADE, _get_ffmpeg_path, _get_ffprobe_path
+    
+    for clip in downloaded_clips:
+        if clip.get("type") != "scene":
+            return None
+        if any(clip.get(k) is not None for k in ("start", "end", "alpha_fill", "overlap_seconds", "effects")):
+            return None
+    
+    ffprobe = _get_ffprobe_path()
+    if not ffprobe:
+        return None
+    params = [_probe_stream_params(clip["path"], ffprobe) for clip in downloaded_clips]
+    if params[0] is None or any(p != params[0] for p in params[1:]):
+        ctx.log("Stream-copy concat skipped: clips differ in codec parameters")
+        return None
+    video = next((p for p in params[0] if p.get("codec_type") == "video"), None)
+    if not video or (video.get("width"), video.get("height")) != tuple(target_resolution):
+        ctx.log("Stream-copy concat skipped: clips are not at the target resolution")
+        return None
+    try:
+        source_fps = Fraction(video.get("r_frame_rate") or "0")
+    except (ValueError, ZeroDivisionError):
+        source_fps = Fraction(0)
+    if source_fps != Fraction(export_fps).limit_denominator(1001):
+        ctx.log(f"Stream-copy concat skipped: clips are {video.get('r_frame_rate')} fps, export is {export_fps}")
+        return None
+    has_audio = any(p.get("codec_type") == "audio" for p in params[0])
+    durations = [_probe_duration(clip["path"], ffprobe) for clip in downloaded_clips]
+    if any(d is None for d in durations):
+        return None
+    
+    list_path = os.path.join(os.path.dirname(output_path), "concat.txt")
+    with open(list_path, "w", encoding="utf-8") as f:
+        for clip in downloaded_clips:
+            escaped = clip["path"].replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+    
+    cmd = [_get_ffmpeg_path(), "-y", "-v", "error", "-f", "concat", "-safe", "0", "-i", list_path]
+    if has_audio:
+        # Same tiny in/out fades per clip as process_clips, then joined
+        graph = []
+        for i, (clip, duration) in enumerate(zip(downloaded_clips, durations), 1):
+            cmd += ["-i", clip["path"]]
+            fade = min(TRANSITION_AUDIO_FADE, max(0.0, duration / 4.0))
+            graph.append(
+                f"[{i}:a]afade=t=in:d={fade},afade=t=out:st={max(0.0, duration - fade)}:d={fade}[a{i}]"
+            )
+        inputs = "".join(f"[a{i}]" for i in range(1, len(downloaded_clips) + 1))
+        graph.append(f"{inputs}concat=n={len(downloaded_clips)}:v=0:a=1[aout]")
+        cmd += [
+            "-filter_complex", ";".join(graph),
+            "-map", "0:v", "-map", "[aout]",
+            "-c:a", "aac", "-b:a", "320k",
+        ]
+    else:
+        cmd += ["-map", "0:v"]
+    cmd += ["-c:v", "copy", "-movflags", "+faststart", output_path]
+    
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        ctx.log(f"Stream-copy concat failed, re-encoding instead: {result.stderr.strip()[-300:]}", "WARN")
+        return None
+    
+    duration = _probe_duration(output_path, ffprobe)
+    if duration is None:
+        ctx.log("Stream-copy concat output could not be probed, re-encoding instead", "WARN")
+    return duration
+
+
+# check_rife_binary() result: a successful probe is kept for the life of the
+# worker since the binary does not change between jobs on a warm container. A
+# failure may be transient (e.g. the volume still mounting), so it is re-probed
+# after RIFE_RECHECK_SECONDS.
+RIFE_RECHECK_SECONDS = 60.0
+_RIFE_CHECK: Optional[Tuple[bool, str]] = None
+_RIFE_CHECKED_AT = 0.0
+
+
+def check_rife_binary_cached() -> Tuple[bool, str]:
+    """Return the (available, info) result of check_rife_binary, cached per process."""
+    global _RIFE_CHECK, _RIFE_CHECKED_AT
+    if _RIFE_CHECK is None or (
+        not _RIFE_CHECK[0] and time.monotonic() - _RIFE_CHECKED_AT >= RIFE_RECHECK_SECONDS
+    ):
+        from startup_check import check_rife_binary
+        _RIFE_CHECK = check_rife_binary()
+        _RIFE_CHECKED_AT = time.monotonic()
+    return _RIFE_CHECK
+
+
 def generate_style_config(
     job_input: JobInput,
     work_dir: str,
@@ -758,17 +1150,20 @@ def generate_style_config(
             style["endcard"]["overlap_seconds"] = 0.5
         ctx.log("Endcard clip present: overlap enabled")
 
-    # Apply user overrides (deep merge)
+    # Apply user overrides (deep merge, in place: style is built fresh above)
     if job_input.style_overrides:
-        style = deep_merge(style, job_input.style_overrides)
+        deep_merge(style, job_input.style_overrides)
         ctx.log(f"Applied {len(job_input.style_overrides)} style overrides")
     
-    # Validate RIFE if enabled
-    if style["postprocess"]["frame_interpolation"]["enabled"]:
+    # Validate RIFE if enabled (minterpolate/FILM do not use the binary)
+    interp = style["postprocess"]["frame_interpolation"]
+    if interp["enabled"] and str(interp.get("model", "rife-v4")).lower().startswith("rife"):
         try:
-            from startup_check import check_rife_binary
-            check_rife_binary()
-            ctx.log("RIFE validation: OK")
+            rife_ok, rife_info = check_rife_binary_cached()
+            if rife_ok:
+                ctx.log("RIFE validation: OK")
+            else:
+                ctx.log(f"RIFE validation: {rife_info}", "WARN")
         except RIFENotAvailableError as e:
             raise RuntimeError(
                 f"RIFE frame interpolation is enabled but not available: {e}. "
@@ -783,14 +1178,23 @@ def generate_style_config(
 
 
 def deep_merge(base: Dict, override: Dict) -> Dict:
-    """Deep merge two dictionaries, with override taking precedence."""
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
-    return result
+    """
+    Deep merge override into base in place, with override taking precedence.
+    
+    Mutates and returns ``base``; callers pass a dict they own. Walks nested
+    dicts with an explicit stack, so arbitrarily deep overrides neither
+    recurse nor copy.
+    """
+    stack = [(base, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
+    return base
 
 
 VALID_INPUT_KEYS = {
@@ -969,7 +1373,8 @@ def validate_payload(job_input_raw: Dict[str, Any], ctx: ProcessingContext) -> N
 
 def run_pipeline(
     job_input: JobInput,
-    ctx: ProcessingContext
+    ctx: ProcessingContext,
+    on_export: Optional[Callable[[str], Any]] = None
 ) -> Tuple[str, float]:
     """
     Execute the full video processing pipeline.
@@ -977,17 +1382,53 @@ def run_pipeline(
     Args:
         job_input: Validated job input parameters
         ctx: Processing context
+        on_export: Called with the output path as soon as the export is
+            written, before MoviePy resources are released
         
     Returns:
         Tuple of (output_path, video_duration)
     """
+    # Input downloads (clips, music, manual SRT) share one pool.
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as downloads:
+        return _run_pipeline(job_input, ctx, downloads, on_export)
+
+
+def _run_pipeline(
+    job_input: JobInput,
+    ctx: ProcessingContext,
+    downloads: ThreadPoolExecutor,
+    on_export: Optional[Callable[[str], Any]] = None
+) -> Tuple[str, float]:
     work_dir = ctx.work_dir
+    resolved_music = job_input.get_resolved_music_path()
+    
+    # Start the music / manual SRT downloads now so they overlap with step 1
+    music_future: Optional[Future] = None
+    if (
+        resolved_music != "random"
+        and job_input.music_url != "random"
+        and resolved_music
+        and resolved_music.startswith(('http://', 'https://'))
+    ):
+        music_dir = os.path.join(work_dir, "audio")
+        os.makedirs(music_dir, exist_ok=True)
+        ext = os.path.splitext(resolved_music.split('?')[0])[1] or '.mp3'
+        music_future = downloads.submit(
+            download_file, resolved_music, os.path.join(music_dir, f"music{ext}"), ctx
+        )
+    srt_future: Optional[Future] = None
+    if job_input.subtitle_mode == SubtitleMode.MANUAL and job_input.manual_srt_url:
+        subs_dir = os.path.join(work_dir, "subs")
+        os.makedirs(subs_dir, exist_ok=True)
+        srt_future = downloads.submit(
+            download_file, job_input.manual_srt_url, os.path.join(subs_dir, "subtitles.srt"), ctx
+        )
     
     # Step 1: Download input videos (using new clips format)
     with ctx.time_block("Step 1/6: Downloading input videos"):
         if not job_input.clips:
             raise ValueError("No clips to process")
-        downloaded_clips = download_videos(job_input.clips, work_dir, ctx)
+        downloaded_clips = download_videos(job_input.clips, work_dir, ctx, executor=downloads)
         scene_count = sum(1 for c in downloaded_clips if c.get("type") == "scene")
         broll_count = sum(1 for c in downloaded_clips if c.get("type") == "broll")
         endcard_count = sum(1 for c in downloaded_clips if c.get("type") == "endcard")
@@ -998,7 +1439,6 @@ def run_pipeline(
     
     # Step 2: Handle music (download URL, use random, or skip)
     music_path = None
-    resolved_music = job_input.get_resolved_music_path()
 
     with ctx.time_block("Step 2/6: Preparing background music"):
         if resolved_music == "random" or job_input.music_url == "random":
@@ -1008,13 +1448,9 @@ def run_pipeline(
                 ctx.log(f"Using random music: {os.path.basename(music_path)}")
             else:
                 ctx.log("No music files found in assets/audio", "WARN")
-        elif resolved_music and resolved_music.startswith(('http://', 'https://')):
-            ctx.log("Downloading background music...")
-            music_dir = os.path.join(work_dir, "audio")
-            os.makedirs(music_dir, exist_ok=True)
-            ext = os.path.splitext(resolved_music.split('?')[0])[1] or '.mp3'
-            music_path = os.path.join(music_dir, f"music{ext}")
-            download_file(resolved_music, music_path, ctx)
+        elif music_future is not None:
+            ctx.log("Waiting for background music download...")
+            music_path = music_future.result()
         elif resolved_music and os.path.exists(resolved_music):
             # Local file path (e.g., from random selection)
             music_path = resolved_music
@@ -1026,12 +1462,12 @@ def run_pipeline(
     srt_path = None
     with ctx.time_block("Step 3/6: Preparing subtitles"):
         if job_input.subtitle_mode == SubtitleMode.MANUAL:
-            ctx.log("Downloading manual subtitles...")
+            ctx.log("Waiting for manual subtitles download...")
             subs_dir = os.path.join(work_dir, "subs")
             os.makedirs(subs_dir, exist_ok=True)
             srt_path = os.path.join(subs_dir, "subtitles.srt")
-            if job_input.manual_srt_url:
-                download_file(job_input.manual_srt_url, srt_path, ctx)
+            if srt_future is not None:
+                srt_future.result()
         elif job_input.subtitle_mode == SubtitleMode.NONE:
             ctx.log("Subtitles disabled")
         else:
@@ -1068,6 +1504,27 @@ def run_pipeline(
         f"gpu_id={interp_cfg.get('gpu_id', 'n/a')}"
     )
     
+    # SIMPLE_CONCAT with nothing to render on top: join the inputs without re-encoding
+    if (
+        job_input.edit_preset == EditPreset.SIMPLE_CONCAT
+        and music_path is None
+        and job_input.subtitle_mode == SubtitleMode.NONE
+        and not job_input.style_overrides
+        and not interp_cfg.get("enabled", False)
+    ):
+        from ugc_pipeline.clips import _get_target_resolution
+        with ctx.time_block("Stream-copy concat"):
+            # export_video writes 30 fps when frame interpolation is off
+            duration = concat_stream_copy(
+                downloaded_clips, _get_target_resolution(style), 30, output_path, ctx
+            )
+        if duration is not None:
+            if on_export is not None:
+                on_export(output_path)
+            file_size = os.path.getsize(output_path) / (1024 * 1024)
+            ctx.log(f"Export complete (stream copy): {file_size:.1f} MB, {duration:.1f}s")
+            return output_path, duration
+    
     # Process clips
     with ctx.time_block("Clips processing", include_gpu=True):
         video_clip = process_clips(clips_config, style)
@@ -1093,18 +1550,12 @@ def run_pipeline(
                 
                 try:
                     from ugc_pipeline.transcription import transcribe_audio_array
-                    import numpy as np
+                    from ugc_pipeline.audio import extract_audio_array
                     
-                    # Extract audio
-                    audio_chunks = []
-                    for chunk in video_clip.audio.iter_chunks(fps=16000, chunksize=3000):
-                        audio_chunks.append(chunk)
+                    # Extract audio (16kHz mono float32)
+                    audio_array = extract_audio_array(video_clip.audio, fps=16000)
                     
-                    if audio_chunks:
-                        audio_array = np.vstack(audio_chunks)
-                        if len(audio_array.shape) > 1 and audio_array.shape[1] > 1:
-                            audio_array = audio_array.mean(axis=1)
-                        
+                    if audio_array.size:
                         transcription_config = style.get("transcription", {})
                         whisper_language = job_input.get_whisper_language()
                         ctx.log(f"Whisper language: {whisper_language} (geo: {job_input.geo or 'not specified'})")
@@ -1165,6 +1616,9 @@ def run_pipeline(
         ctx.log(f"GPU processes (pre-export): {get_gpu_processes()}")
         export_video(video_clip, output_path, style, log_func=ctx.log)
     
+    if on_export is not None:
+        on_export(output_path)
+    
     # Clean up MoviePy resources
     video_clip.close()
     
@@ -1298,14 +1752,21 @@ def configure_cache_environment(ctx: ProcessingContext) -> None:
 
         whisper_cache = os.environ.get("WHISPER_CACHE_DIR") or os.path.join(base_cache, "whisper_models")
         xdg_cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(base_cache, "cache")
+        # Input download cache is opt-in: set DOWNLOAD_CACHE_DIR to enable it
+        download_cache = os.environ.get("DOWNLOAD_CACHE_DIR", "")
 
         os.environ["WHISPER_CACHE_DIR"] = whisper_cache
         os.environ["XDG_CACHE_HOME"] = xdg_cache
 
         os.makedirs(whisper_cache, exist_ok=True)
         os.makedirs(xdg_cache, exist_ok=True)
+        if download_cache:
+            os.makedirs(download_cache, exist_ok=True)
 
-        ctx.log(f"Cache dirs: WHISPER_CACHE_DIR={whisper_cache} | XDG_CACHE_HOME={xdg_cache}")
+        ctx.log(
+            f"Cache dirs: WHISPER_CACHE_DIR={whisper_cache} | XDG_CACHE_HOME={xdg_cache} | "
+            f"DOWNLOAD_CACHE_DIR={download_cache or '(disabled)'}"
+        )
     except Exception as e:
         ctx.log(f"Cache env setup failed: {e}", "WARN")
 
@@ -1366,6 +1827,7 @@ def handler(job: Dict[str, Any]) -> Dict[str, Any]:
     
     try:
         ctx.log(f"Starting job {job_id}")
+        _join_pending_cleanup(ctx)
         ctx.log(f"Work directory: {work_dir}")
         configure_cache_environment(ctx)
         ctx.log("Configuring GPU environment...")
@@ -1421,11 +1883,8 @@ def handler(job: Dict[str, Any]) -> Dict[str, Any]:
         )
         ctx.log(f"Input validation passed (geo: {job_input.geo or 'not specified'})")
         
-        # Run pipeline
-        output_path, duration = run_pipeline(job_input, ctx)
-        
-        # Upload to S3
-        ctx.log("Step 6/6: Uploading to S3...")
+        # Resolve the S3 destination up front so the upload can start as soon
+        # as the export is written
         bucket = (
             job_input.output_bucket
             or os.environ.get('S3_BUCKET', 'ugc-pipeline-outputs')
@@ -1437,12 +1896,21 @@ def handler(job: Dict[str, Any]) -> Dict[str, Any]:
             )
         
         # Use custom output_folder if provided, otherwise default to outputs/{job_id}/
-        if job_input.output_folder:
-            s3_key = f"{job_input.output_folder.strip('/')}/{os.path.basename(output_path)}"
-        else:
-            s3_key = f"outputs/{job_id}/{os.path.basename(output_path)}"
+        def s3_key_for(path: str) -> str:
+            if job_input.output_folder:
+                return f"{job_input.output_folder.strip('/')}/{os.path.basename(path)}"
+            return f"outputs/{job_id}/{os.path.basename(path)}"
         
-        output_url = upload_to_s3(output_path, bucket, s3_key)
+        # Run pipeline; the upload overlaps MoviePy teardown and final logging
+        with ThreadPoolExecutor(max_workers=1) as uploader:
+            upload_futures: List[Future] = []
+            
+            def start_upload(path: str) -> None:
+                ctx.log("Step 6/6: Uploading to S3...")
+                upload_futures.append(uploader.submit(upload_to_s3, path, bucket, s3_key_for(path)))
+            
+            output_path, duration = run_pipeline(job_input, ctx, on_export=start_upload)
+            output_url = upload_futures[0].result()
         ctx.log(f"Upload complete: {output_url}")
         
         # Success response
@@ -1505,11 +1973,37 @@ def handler(job: Dict[str, Any]) -> Dict[str, Any]:
         }
         
     finally:
-        # Cleanup work directory
-        try:
-            shutil.rmtree(work_dir)
-        except Exception as e:
-            print(f"Warning: Failed to cleanup {work_dir}: {e}")
+        # Cleanup work directory in the background so the response is returned
+        # without waiting on the tree walk; the next job joins it
+        cleanup = threading.Thread(
+            target=_cleanup_work_dir, args=(work_dir,), name=f"cleanup-{job_id}"
+        )
+        cleanup.start()
+        _PENDING_CLEANUP.append(cleanup)
+
+
+# Background work-dir removals started by previous jobs on this worker.
+_PENDING_CLEANUP: List[threading.Thread] = []
+
+# How long a new job waits for earlier cleanups before starting anyway.
+CLEANUP_JOIN_TIMEOUT = 60.0
+
+
+def _join_pending_cleanup(ctx: ProcessingContext) -> None:
+    """Wait for earlier jobs' work-dir cleanups; log any that are still running."""
+    for thread in list(_PENDING_CLEANUP):
+        thread.join(timeout=CLEANUP_JOIN_TIMEOUT)
+        if thread.is_alive():
+            ctx.log(f"{thread.name} still running after {CLEANUP_JOIN_TIMEOUT:.0f}s", "WARN")
+        else:
+            _PENDING_CLEANUP.remove(thread)
+
+
+def _cleanup_work_dir(work_dir: str) -> None:
+    try:
+        shutil.rmtree(work_dir)
+    except Exception as e:
+        print(f"Warning: Failed to cleanup {work_dir}: {e}")
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+import wave
+
+try:
+    import numpy as np
+    from moviepy.editor import AudioFileClip
+
+    from ugc_pipeline.audio import extract_audio_array
+except ImportError:  # video deps are not installed for API-only test runs
+    AudioFileClip = None
+
+
+def _write_stereo_wav(path: str, seconds: float, rate: int = 44100) -> None:
+    t = np.arange(int(seconds * rate)) / rate
+    left = 0.5 * np.sin(2 * np.pi * 220 * t)
+    right = 0.25 * np.sin(2 * np.pi * 330 * t)
+    frames = (np.stack([left, right], axis=1) * 32767).astype("<i2")
+    with wave.open(path, "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(frames.tobytes())
+
+
+@unittest.skipIf(AudioFileClip is None, "moviepy/numpy not installed")
+class TestExtractAudioArray(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "stereo.wav")
+        _write_stereo_wav(self.path, seconds=12.0)
+        self.clip = AudioFileClip(self.path)
+
+    def tearDown(self):
+        self.clip.close()
+        self.tmp.cleanup()
+
+    def test_renders_file_longer_than_reader_buffer(self):
+        audio = extract_audio_array(self.clip, fps=16000)
+        self.assertEqual(audio.dtype, np.float32)
+        self.assertEqual(audio.ndim, 1)
+        self.assertEqual(audio.shape[0], int(16000 * self.clip.duration))
+
+    def test_stereo_downmix_matches_soundarray_mean(self):
+        audio = extract_audio_array(self.clip, fps=16000)
+        # Reference: the same chunk schedule through to_soundarray (via
+        # iter_chunks), stacked and averaged the old way, on a fresh reader
+        # so seek state matches
+        with AudioFileClip(self.path) as reference:
+            expected = np.vstack(list(reference.iter_chunks(fps=16000, chunksize=16000))).mean(axis=1)
+        self.assertEqual(audio.shape, expected.shape)
+        np.testing.assert_allclose(audio, expected, atol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
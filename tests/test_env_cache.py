@@ -0,0 +1,61 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ugc_tools import env
+
+
+class TestDotenvCache(unittest.TestCase):
+    def setUp(self):
+        env._parse_dotenv.cache_clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / ".env"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_loads_values_without_overriding(self):
+        self.path.write_text('# comment\nUGC_TEST_A="one"\nUGC_TEST_B=two\n', encoding="utf-8")
+        with mock.patch.dict(os.environ, {"UGC_TEST_B": "kept"}, clear=False):
+            env.load_env_from_candidates([self.path])
+            self.assertEqual(os.environ["UGC_TEST_A"], "one")
+            self.assertEqual(os.environ["UGC_TEST_B"], "kept")
+
+    def test_unchanged_file_is_parsed_once(self):
+        self.path.write_text("UGC_TEST_A=one\n", encoding="utf-8")
+        with mock.patch.dict(os.environ, {}, clear=False):
+            env.load_env_from_candidates([self.path])
+            env.load_env_from_candidates([self.path])
+        info = env._parse_dotenv.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+    def test_modified_file_is_reparsed(self):
+        self.path.write_text("UGC_TEST_A=one\n", encoding="utf-8")
+        with mock.patch.dict(os.environ, {}, clear=False):
+            env.load_env_from_candidates([self.path])
+        self.path.write_text("UGC_TEST_A=two\n", encoding="utf-8")
+        os.utime(self.path, (0, self.path.stat().st_mtime + 10))
+        with mock.patch.dict(os.environ, {}, clear=False):
+            env.load_env_from_candidates([self.path])
+            self.assertEqual(os.environ["UGC_TEST_A"], "two")
+
+    def test_fallback_parser_handles_quotes_export_and_comments(self):
+        self.path.write_text(
+            "# comment\n"
+            "export UGC_TEST_A='one two'\n"
+            "UGC_TEST_B = \"x#y\"  # trailing\n"
+            "UGC_TEST_C=https://h/p#frag\r\n"
+            "not a pair\n",
+            encoding="utf-8",
+        )
+        with mock.patch.dict(sys.modules, {"dotenv": None}):
+            pairs = dict(env._parse_dotenv(str(self.path), 0.0))
+        self.assertEqual(pairs, {"UGC_TEST_A": "one two", "UGC_TEST_B": "x#y", "UGC_TEST_C": "https://h/p#frag"})
+
+
+if __name__ == "__main__":
+    unittest.main()
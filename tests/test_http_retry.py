@@ -0,0 +1,131 @@
+import unittest
+from unittest import mock
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ReadTimeoutError
+
+from ugc_tools import http_retry
+from ugc_tools.http_retry import TokenBucket, TransientHTTPError, make_client, post_with_retry
+
+
+def _response(status: int, headers=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response._content = b"{}"
+    return response
+
+
+def _connect_error() -> requests.ConnectionError:
+    cause = NewConnectionError(None, "Failed to establish a new connection: [Errno 111] refused")
+    return requests.ConnectionError(MaxRetryError(None, "/run", cause))
+
+
+class FakeSession:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+        self.bodies = []
+        self.headers = []
+
+    def post(self, url, **kwargs):
+        self.calls += 1
+        self.bodies.append(kwargs.get("data"))
+        self.headers.append(kwargs.get("headers"))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@mock.patch("ugc_tools.http_retry.time.sleep")
+class TestPostWithRetry(unittest.TestCase):
+    def test_retries_transient_errors_then_succeeds(self, sleep):
+        session = FakeSession([_connect_error(), requests.ConnectTimeout(), _response(503), _response(200)])
+        response = post_with_retry(session, "https://example.test/run", json={})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(session.calls, 4)
+        self.assertEqual(sleep.call_count, 3)
+        self.assertEqual(session.bodies, [b"{}"] * 4)
+
+    def test_passes_caller_headers(self, sleep):
+        session = FakeSession([_response(200)])
+        post_with_retry(session, "https://example.test/run", json={}, headers={"Authorization": "Bearer k"})
+        self.assertEqual(session.headers, [{"Authorization": "Bearer k", "Content-Type": "application/json"}])
+
+    def test_honours_retry_after(self, sleep):
+        session = FakeSession([_response(429, {"Retry-After": "7"}), _response(200)])
+        post_with_retry(session, "https://example.test/run", json={})
+        sleep.assert_called_once_with(7.0)
+
+    def test_client_errors_are_not_retried(self, sleep):
+        session = FakeSession([_response(401)])
+        with self.assertRaises(requests.HTTPError):
+            post_with_retry(session, "https://example.test/run", json={})
+        self.assertEqual(session.calls, 1)
+        sleep.assert_not_called()
+
+    def test_possibly_accepted_posts_are_not_retried(self, sleep):
+        for outcome in (requests.ReadTimeout(), requests.ConnectionError("reset"), _response(500), _response(502)):
+            session = FakeSession([outcome, _response(200)])
+            with self.assertRaises(requests.RequestException):
+                post_with_retry(session, "https://example.test/run", json={})
+            self.assertEqual(session.calls, 1)
+        sleep.assert_not_called()
+
+    def test_gives_up_after_max_retries(self, sleep):
+        session = FakeSession([_response(503)] * 3)
+        with self.assertRaises(TransientHTTPError):
+            post_with_retry(session, "https://example.test/run", json={}, max_retries=2)
+        self.assertEqual(session.calls, 3)
+
+
+class TestMakeClient(unittest.TestCase):
+    def test_falls_back_to_requests_session(self):
+        with mock.patch.object(http_retry, "httpx", None):
+            with make_client({"Authorization": "Bearer k"}) as client:
+                self.assertIsInstance(client, requests.Session)
+                self.assertEqual(client.headers["Authorization"], "Bearer k")
+
+    def test_http2_false_returns_requests_session(self):
+        with make_client(http2=False) as client:
+            self.assertIsInstance(client, requests.Session)
+            self.assertIsInstance(client.get_adapter("https://").max_retries, http_retry.RunPodRetry)
+
+
+class TestRunPodRetry(unittest.TestCase):
+    def test_posts_only_retry_when_rejected(self):
+        retry = http_retry.runpod_retry()
+        self.assertTrue(retry.is_retry("POST", 429))
+        self.assertTrue(retry.is_retry("POST", 503))
+        self.assertFalse(retry.is_retry("POST", 500))
+        self.assertFalse(retry.is_retry("POST", 502))
+        self.assertTrue(retry.is_retry("GET", 500))
+
+    def test_posts_are_not_resent_after_read_errors(self):
+        retry = http_retry.runpod_retry()
+        with self.assertRaises(ReadTimeoutError):
+            retry.increment("POST", "/run", error=ReadTimeoutError(None, "/run", "timed out"))
+        retry.increment("POST", "/run", error=NewConnectionError(None, "refused"))
+        retry.increment("GET", "/status/x", error=ReadTimeoutError(None, "/status/x", "timed out"))
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_bursts_to_capacity_then_waits_for_refill(self):
+        clock = [100.0]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        with mock.patch("ugc_tools.http_retry.time.monotonic", side_effect=lambda: clock[0]), \
+                mock.patch("ugc_tools.http_retry.time.sleep", side_effect=fake_sleep) as sleep:
+            bucket = TokenBucket(rate=2.0, capacity=2)
+            bucket.acquire()
+            bucket.acquire()
+            sleep.assert_not_called()
+            bucket.acquire()
+        self.assertAlmostEqual(clock[0], 100.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
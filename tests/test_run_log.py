@@ -0,0 +1,49 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from ugc_tools.run_log import RunLog
+
+
+class TestRunLog(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "run.log"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _log(self, log, message):
+        with contextlib.redirect_stdout(io.StringIO()):
+            log(message)
+
+    def test_lines_reach_the_file_before_close(self):
+        log = RunLog(self.path)
+        self._log(log, "first")
+        self._log(log, 2)
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "first\n2\n")
+        log.close()
+
+    def test_reset_starts_a_fresh_file(self):
+        self.path.write_text("previous run\n", encoding="utf-8")
+        log = RunLog(self.path)
+        log.reset()
+        self._log(log, "new run")
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "new run\n")
+        log.close()
+
+    def test_switching_path_opens_the_new_file(self):
+        log = RunLog(self.path)
+        self._log(log, "a")
+        other = Path(self.tmp.name) / "other.log"
+        log.path = str(other)
+        self._log(log, "b")
+        log.close()
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "a\n")
+        self.assertEqual(other.read_text(encoding="utf-8"), "b\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
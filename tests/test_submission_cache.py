@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ugc_tools.submission_cache import load_submitted, payload_digest, save_submitted, submit_jobs
+
+
+class TestSubmissionCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / ".runpod_submitted.test.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_digest_ignores_key_order(self):
+        a = {"input": {"geo": "MLA", "clips": [{"type": "scene", "url": "u"}]}}
+        b = {"input": {"clips": [{"url": "u", "type": "scene"}], "geo": "MLA"}}
+        self.assertEqual(payload_digest(a), payload_digest(b))
+        self.assertNotEqual(payload_digest(a), payload_digest({"input": {"geo": "MLB"}}))
+
+    def test_round_trip(self):
+        self.assertEqual(load_submitted(self.path), {})
+        save_submitted(self.path, {"abc": "run-1"})
+        self.assertEqual(load_submitted(self.path), {"abc": "run-1"})
+
+    def test_force_resubmit_ignores_saved_ids(self):
+        save_submitted(self.path, {"abc": "run-1"})
+        with mock.patch.dict(os.environ, {"RUNPOD_FORCE_RESUBMIT": "1"}):
+            self.assertEqual(load_submitted(self.path), {})
+
+    def test_submit_jobs_skips_duplicates_and_cached_payloads(self):
+        def job(name, url):
+            return name, {"input": {"job_id": name, "clips": [{"type": "scene", "url": url}]}}
+
+        cached = job("b", "u2")
+        save_submitted(self.path, {payload_digest(cached[1]): "run-old"})
+        sent = []
+
+        def submit(payload):
+            if payload["input"]["job_id"] == "c":
+                raise RuntimeError("boom")
+            sent.append(payload["input"]["job_id"])
+            return "run-" + payload["input"]["job_id"]
+
+        lines = []
+        jobs = [job("a", "u1"), job("a", "u1"), cached, job("c", "u3")]
+        count = submit_jobs(jobs, submit, self.path, log=lines.append, workers=2)
+
+        self.assertEqual(count, 1)
+        self.assertEqual(sent, ["a"])
+        self.assertIn("Skipped 1 duplicate rows", lines)
+        self.assertIn("b: submitted run-old (cached)", lines)
+        self.assertIn("c: ERROR submitting job: boom", lines)
+        saved = load_submitted(self.path)
+        self.assertEqual(sorted(saved.values()), ["run-a", "run-old"])
+
+
+if __name__ == "__main__":
+    unittest.main()
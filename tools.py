@@ -502,13 +502,11 @@ class RunPodClient:
 def worker_runpod(worker_id: int, job_queue: queue.Queue, client: RunPodClient, config: Config):
     """RunPod batch worker"""
     while True:
-        try:
-            project = job_queue.get(timeout=1)
-        except queue.Empty:
-            if job_queue.empty():
-                log(f"🏁 Worker {worker_id} finished - no more jobs")
-                return
-            continue
+        project = job_queue.get()
+        if project is None:
+            job_queue.task_done()
+            log(f"🏁 Worker {worker_id} finished - no more jobs")
+            return
         
         folder = project['folder']
         short_name = folder[:30] + "..." if len(folder) > 30 else folder
@@ -673,6 +671,9 @@ def cmd_batch_runpod(args):
     job_queue = queue.Queue()
     for p in filtered:
         job_queue.put(p)
+    # One sentinel per worker: each exits after draining the real jobs.
+    for _ in range(config.max_workers):
+        job_queue.put(None)
     
     client = RunPodClient(config.api_key, config.endpoint_id)
     
@@ -372,21 +372,14 @@ def main():
         print_status("Generating subtitles with Whisper...", "PROGRESS")
         try:
             from ugc_pipeline.transcription import transcribe_audio_array
-            import numpy as np
+            from ugc_pipeline.audio import extract_audio_array
             
             print_status("Extracting audio to memory (16kHz mono)...", "PROGRESS")
             
-            audio_chunks = []
-            for chunk in video_clip.audio.iter_chunks(fps=16000, chunksize=3000):
-                audio_chunks.append(chunk)
+            audio_array = extract_audio_array(video_clip.audio, fps=16000)
             
-            if not audio_chunks:
+            if not audio_array.size:
                 raise ValueError("Could not extract audio chunks from video.")
-                
-            audio_array = np.vstack(audio_chunks)
-            
-            if len(audio_array.shape) > 1 and audio_array.shape[1] > 1:
-                audio_array = audio_array.mean(axis=1)
             
             print_status(f"Transcribing (model={model_name}, lang={transcription_language})...", "PROGRESS")
             transcribe_audio_array(
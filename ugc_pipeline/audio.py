@@ -1,7 +1,9 @@
 import os
 import time
 from typing import Dict, Any, Optional
-from moviepy.editor import AudioFileClip, VideoFileClip, afx
+
+import numpy as np
+from moviepy.editor import AudioClip, AudioFileClip, VideoFileClip, afx
 
 def process_audio(
     video_clip: VideoFileClip, 
@@ -77,3 +79,48 @@ def process_audio(
     video_clip.audio = final_audio
     print(f"✅ Audio mixed in {time.time() - start_time:.1f}s (volume={volume}, loop={loop_music})")
     return video_clip
+
+
+def extract_audio_array(
+    audio_clip: AudioClip,
+    fps: int = 16000,
+    chunk_seconds: float = 1.0
+) -> np.ndarray:
+    """
+    Renders a clip's audio to a mono float32 array at `fps` (Whisper input).
+
+    The clip is usually a composite (trims, overlaps, music), so it has to be
+    rendered through MoviePy; chunks are written straight into one
+    preallocated buffer, downmixing each chunk in place, instead of being
+    collected in a list and stacked.
+
+    Args:
+        audio_clip: Audio to render (e.g. video_clip.audio)
+        fps: Output sample rate
+        chunk_seconds: Seconds of audio rendered per MoviePy call. Must stay
+            well under the AudioFileClip reader buffer (200000 source frames,
+            ~4.5 s at 44.1 kHz) or the reader indexes out of bounds
+
+    Returns:
+        1-D float32 array (empty if the clip has no samples)
+    """
+    total = int(fps * audio_clip.duration)
+    audio = np.empty(total, dtype=np.float32)
+    pos = 0
+    chunksize = max(1, int(fps * chunk_seconds))
+    for chunk in audio_clip.iter_chunks(fps=fps, chunksize=chunksize):
+        n = len(chunk)
+        out = audio[pos:pos + n]
+        if chunk.ndim == 1:
+            out[:] = chunk
+        elif chunk.shape[1] == 1:
+            out[:] = chunk[:, 0]
+        elif chunk.shape[1] == 2:
+            # Stereo downmix written straight into the output slice (no
+            # temporary); same result as chunk.mean(axis=1), cast to float32
+            np.add(chunk[:, 0], chunk[:, 1], out=out, casting="same_kind")
+            out *= 0.5
+        else:
+            np.mean(chunk, axis=1, out=out)
+        pos += n
+    return audio[:pos]
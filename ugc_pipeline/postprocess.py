@@ -16,6 +16,8 @@ Order matters: Color grade first → aberration/distortion → vignette → hala
 Frame Interpolation Models:
 - "rife-v4": Fast, requires rife-ncnn-vulkan binary
 - "film": Google's FILM model (highest quality for talking heads, requires TensorFlow)
+- "minterpolate": FFmpeg motion-compensated interpolation, fused into the same
+  filter graph as the effects (single decode/encode, no frame dump, no GPU)
 """
 
 import os
@@ -36,7 +38,7 @@ DEFAULT_CONFIG = {
         "enabled": True,
         "input_fps": 24,          # Source framerate (AI typically outputs 24fps)
         "target_fps": 30,         # Target framerate (iPhone standard)
-        "model": "rife-v4",       # "rife-v4" or "film" (Google FILM for highest quality)
+        "model": "rife-v4",       # "rife-v4", "film" (Google FILM for highest quality) or "minterpolate" (FFmpeg, single pass)
         "gpu_id": 0,              # GPU to use (-1 for CPU, RIFE only)
         "gpu_memory_limit": None  # GPU memory limit in GB (FILM only, None = auto)
     },
@@ -139,10 +141,12 @@ def get_rife_path() -> Optional[str]:
     return None
 
 
-def build_filter_graph(config: Dict[str, Any]) -> str:
+def build_filter_graph(config: Dict[str, Any], interpolate_fps: Optional[float] = None) -> str:
     """
     Constructs a robust filter_complex graph with explicit labels.
     This prevents 'semicolon vs comma' errors and handles sizing correctly.
+    If interpolate_fps is set, motion-compensated interpolation to that rate
+    runs first, in the same graph.
     """
     filters = []
     current_label = "[0:v]" # Start with input video
@@ -156,6 +160,10 @@ def build_filter_graph(config: Dict[str, Any]) -> str:
         current_label = next_label
         step_count += 1
 
+    # 0. Frame interpolation (minterpolate model only; RIFE/FILM run outside FFmpeg)
+    if interpolate_fps:
+        add_step(f"minterpolate=fps={interpolate_fps}:mi_mode=mci")
+
     # 1. Color Grading (Eq)
     cg = config.get("color_grading", {})
     if cg.get("enabled", True):
@@ -312,7 +320,16 @@ def apply_postprocess(
         )
     
     # 1. Build the graph
-    filter_graph, final_label = build_filter_graph(config)
+    if use_interpolation and interp_model == "minterpolate":
+        # Interpolation + effects in one FFmpeg pass
+        if verbose:
+            print("      [INFO] Frame interpolation: enabled, model=minterpolate (fused filter graph)")
+        filter_graph, final_label = build_filter_graph(
+            config, interpolate_fps=interp_config.get("target_fps", 30)
+        )
+        use_interpolation = False
+    else:
+        filter_graph, final_label = build_filter_graph(config)
     
     # Frame interpolation workflow
     if use_interpolation:
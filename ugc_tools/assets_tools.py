@@ -4,6 +4,8 @@ import argparse
 import csv
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable
 from urllib.parse import quote
@@ -13,6 +15,7 @@ import requests
 
 from .env import load_env_default
 from .paths import repo_root
+from .s3_tools import list_existing_keys
 
 
 DEFAULT_TMP_DIR = "assets/IGNOREASSETS/users_assets_upload_tmp"
@@ -22,6 +25,9 @@ DEFAULT_S3_BUCKET = "meli-ai.filmmaker"
 DEFAULT_S3_PREFIX = "MP-Users/Assets"
 DEFAULT_S3_REGION = "us-east-2"
 
+_DRIVE_PATH_ID = re.compile(r"/d/([a-zA-Z0-9_-]+)")
+_DRIVE_QUERY_ID = re.compile(r"[?&]id=([a-zA-Z0-9_-]+)")
+
 
 def register_cli(subparsers: argparse._SubParsersAction) -> None:
     assets_parser = subparsers.add_parser("assets", help="Drive/S3 asset workflows")
@@ -36,6 +42,7 @@ def register_cli(subparsers: argparse._SubParsersAction) -> None:
     upload.add_argument("--prefix", default=DEFAULT_S3_PREFIX, help="S3 key prefix")
     upload.add_argument("--region", default=DEFAULT_S3_REGION, help="S3 region")
     upload.add_argument("--skip-existing", action="store_true", help="Skip upload if object exists")
+    upload.add_argument("--workers", type=int, default=4, help="Files downloaded/uploaded in parallel")
     upload.set_defaults(func=cmd_upload_drive)
 
     replace = assets_sub.add_parser("replace-urls", help="Replace Drive URLs with S3 URLs")
@@ -72,8 +79,10 @@ def cmd_upload_drive(args: argparse.Namespace) -> int:
         aws_secret_access_key=os.environ.get("AWS_SECRET_ACCESS_KEY"),
     )
 
-    report_rows: list[dict[str, str]] = []
-    for idx, item in enumerate(items, 1):
+    existing = list_existing_keys(s3, args.bucket, f"{args.prefix}/") if args.skip_existing else set()
+    existing_lock = threading.Lock()
+
+    def process(idx: int, item: dict[str, str]) -> dict[str, str]:
         drive_id = item["drive_id"]
         kind = item["kind"]
         url = item["source_url"]
@@ -82,25 +91,27 @@ def cmd_upload_drive(args: argparse.Namespace) -> int:
         try:
             downloaded_path = download_drive_file(drive_id, tmp_dir)
         except Exception as e:
-            report_rows.append(
-                {
-                    "kind": kind,
-                    "drive_id": drive_id,
-                    "source_url": url,
-                    "filename": "",
-                    "s3_key": "",
-                    "s3_url": "",
-                    "status": f"download_error: {e}",
-                }
-            )
-            continue
+            return {
+                "kind": kind,
+                "drive_id": drive_id,
+                "source_url": url,
+                "filename": "",
+                "s3_key": "",
+                "s3_url": "",
+                "status": f"download_error: {e}",
+            }
 
         filename = downloaded_path.name
         s3_key = f"{args.prefix}/{filename}"
         s3_url = s3_http_url(args.bucket, args.region, s3_key)
 
+        with existing_lock:
+            already_exists = s3_key in existing
+            if args.skip_existing:
+                existing.add(s3_key)
+
         status = "uploaded"
-        if args.skip_existing and s3_exists(s3, args.bucket, s3_key):
+        if already_exists:
             status = "already_exists"
         else:
             try:
@@ -108,17 +119,19 @@ def cmd_upload_drive(args: argparse.Namespace) -> int:
             except Exception as e:
                 status = f"upload_error: {e}"
 
-        report_rows.append(
-            {
-                "kind": kind,
-                "drive_id": drive_id,
-                "source_url": url,
-                "filename": filename,
-                "s3_key": s3_key,
-                "s3_url": s3_url,
-                "status": status,
-            }
-        )
+        return {
+            "kind": kind,
+            "drive_id": drive_id,
+            "source_url": url,
+            "filename": filename,
+            "s3_key": s3_key,
+            "s3_url": s3_url,
+            "status": status,
+        }
+
+    # Each worker downloads then uploads, so downloads overlap other files' uploads.
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        report_rows = list(executor.map(process, range(1, len(items) + 1), items))
 
     report_path.parent.mkdir(parents=True, exist_ok=True)
     with report_path.open("w", newline="", encoding="utf-8") as f:
@@ -185,13 +198,8 @@ def resolve_path(value: str, repo_dir: Path) -> Path:
 def extract_drive_id(url: str) -> str | None:
     if not url or not url.startswith("http"):
         return None
-    match = re.search(r"/d/([a-zA-Z0-9_-]+)", url)
-    if match:
-        return match.group(1)
-    match = re.search(r"[?&]id=([a-zA-Z0-9_-]+)", url)
-    if match:
-        return match.group(1)
-    return None
+    match = _DRIVE_PATH_ID.search(url) or _DRIVE_QUERY_ID.search(url)
+    return match.group(1) if match else None
 
 
 def iter_drive_items(csv_path: Path, columns: list[str]) -> Iterable[dict[str, str]]:
@@ -212,12 +220,9 @@ def download_drive_file(drive_id: str, dest_dir: Path) -> Path:
     try:
         import gdown
 
-        current_dir = Path.cwd()
-        try:
-            os.chdir(dest_dir)
-            downloaded = gdown.download(id=drive_id, output=None, quiet=False)
-        finally:
-            os.chdir(current_dir)
+        # A trailing separator makes gdown keep the Drive filename inside dest_dir;
+        # no chdir, so parallel downloads don't race on the working directory.
+        downloaded = gdown.download(id=drive_id, output=str(dest_dir) + os.sep, quiet=False)
 
         if not downloaded:
             raise RuntimeError("Download failed: empty path")
@@ -276,14 +281,6 @@ def s3_http_url(bucket: str, region: str, key: str) -> str:
     return f"https://s3.{region}.amazonaws.com/{bucket}/{quote(key, safe='/')}"
 
 
-def s3_exists(s3, bucket: str, key: str) -> bool:
-    try:
-        s3.head_object(Bucket=bucket, Key=key)
-        return True
-    except Exception:
-        return False
-
-
 def s3_upload(s3, bucket: str, key: str, local_path: Path) -> None:
     if local_path.suffix.lower() == ".mov":
         content_type = "video/quicktime"
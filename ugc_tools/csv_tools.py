@@ -261,6 +261,15 @@ def get_assets_for_market(asset_map: dict, asset_type: str, market: str) -> tupl
     return assets.get("endcard", ""), assets.get("broll", "")
 
 
+def cell(row: list[str], cols: dict[str, int], name: str) -> str:
+    """Stripped value of column `name` in a csv.reader row, or "" if the column or cell is missing.
+
+    `cols` maps header names to positions, resolved once from the header row.
+    """
+    idx = cols.get(name, -1)
+    return row[idx].strip() if 0 <= idx < len(row) else ""
+
+
 def load_csv_rows(path: Path) -> tuple[list[dict], list[str]]:
     with path.open("r", encoding="utf-8", newline="") as f:
         reader = csv.DictReader(f)
@@ -1,20 +1,44 @@
 from __future__ import annotations
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 
 
+# KEY=value, KEY="value" or KEY='value', optionally prefixed with `export`;
+# a ` # comment` after the value is dropped.
+_ENV_LINE = re.compile(
+    r"""^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_.]*)[ \t]*=[ \t]*"""
+    r"""(?:"([^"\n]*)"|'([^'\n]*)'|([^\n]*?))[ \t]*(?:[ \t]#[^\n]*)?\r?$""",
+    re.MULTILINE,
+)
+
+
+@lru_cache(maxsize=None)
+def _parse_dotenv(path: str, mtime: float) -> tuple[tuple[str, str], ...]:
+    # Keyed on mtime so an unchanged file is only read and parsed once per process.
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        pass
+    else:
+        return tuple((k, v) for k, v in dotenv_values(path).items() if k and v is not None)
+
+    text = Path(path).read_text(encoding="utf-8")
+    return tuple(
+        (m.group(1), next(v for v in m.group(2, 3, 4) if v is not None))
+        for m in _ENV_LINE.finditer(text)
+    )
+
+
 def _load_dotenv_file(path: Path) -> None:
-    if not path.exists():
+    try:
+        pairs = _parse_dotenv(str(path), path.stat().st_mtime)
+    except OSError:
         return
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip().strip('"').strip("'")
-        if key and key not in os.environ:
+    for key, value in pairs:
+        if key not in os.environ:
             os.environ[key] = value
 
 
@@ -31,16 +55,5 @@ def load_env_default(repo_dir: Path) -> None:
         repo_dir.parent / ".env",
         Path.cwd() / ".env",
     ]
-
-    try:
-        from dotenv import load_dotenv
-
-        for path in candidates:
-            if path.exists():
-                load_dotenv(path, override=False)
-                return
-    except Exception:
-        pass
-
     load_env_from_candidates(candidates)
 
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+    import h2  # noqa: F401  (required by httpx for http2=True)
+except ImportError:
+    httpx = None
+
+# Optional C-accelerated JSON for request bodies.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# A 500/502/504 or a read timeout on POST /run may mean the job was queued
+# anyway, so POSTs are only retried when RunPod explicitly rejected them
+# (rate limit / overloaded) or the request never reached it.
+TRANSIENT_STATUS_CODES = frozenset({429, 503})
+
+
+class TransientHTTPError(requests.HTTPError):
+    """A 429/503 response: the server did not accept the request, so retrying is safe."""
+
+
+def _is_connect_error(exc: BaseException) -> bool:
+    """True when `exc` failed before the request was sent (DNS, refused, connect timeout)."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    if isinstance(exc, requests.ConnectionError):
+        reason = exc.args[0] if exc.args else None
+        reason = getattr(reason, "reason", reason)  # urllib3 MaxRetryError wraps the cause
+        return isinstance(reason, NewConnectionError)
+    if httpx is not None:
+        return isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout))
+    return False
+
+
+class RunPodRetry(Retry):
+    """urllib3 Retry with the POST policy of :func:`post_with_retry`.
+
+    GETs are retried on connection errors, read errors and 429/5xx. POSTs
+    only on 429/503 or when the connection was never established.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method == "POST" and status_code not in TRANSIENT_STATUS_CODES:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        # A read timeout or dropped connection may come after RunPod queued the job
+        if method == "POST" and error is not None and not self._is_connection_error(error):
+            raise error
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def runpod_retry(total: int = 3, backoff_factor: float = 0.3) -> Retry:
+    return RunPodRetry(
+        total=total,
+        backoff_factor=backoff_factor,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST"}),
+        respect_retry_after_header=True,
+        # Hand the last response back so callers map it instead of catching RetryError.
+        raise_on_status=False,
+    )
+
+
+def make_client(
+    headers: dict[str, str] | None = None,
+    pool_size: int = 32,
+    timeout: float = 60,
+    http2: bool = True,
+):
+    """Return a pooled HTTP client for RunPod calls.
+
+    Uses an HTTP/2 ``httpx.Client`` when httpx and h2 are installed and
+    ``http2`` is true, so concurrent requests multiplex over one connection;
+    otherwise a ``requests.Session`` with a keep-alive pool and
+    :func:`runpod_retry`. Both expose get/post/patch, ``headers`` and
+    context-manager closing. Pass ``http2=False`` when the caller relies on
+    requests' exceptions or response API.
+    """
+    if http2 and httpx is not None:
+        return httpx.Client(
+            http2=True,
+            headers=headers,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=pool_size, max_retries=runpod_retry()))
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def encode_json(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def decode_json(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _post_json_body(session: Any, url: str, body: bytes, timeout: float, headers: dict[str, str] | None = None) -> Any:
+    headers = {**(headers or {}), "Content-Type": "application/json"}
+    if httpx is not None and isinstance(session, httpx.Client):
+        return session.post(url, content=body, headers=headers, timeout=timeout)
+    return session.post(url, data=body, headers=headers, timeout=timeout)
+
+
+class TokenBucket:
+    """Thread-safe rate limiter: ``acquire()`` blocks until a request may go out.
+
+    Allows bursts of up to ``capacity`` requests, then a steady ``rate`` per second.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def retry_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """Exponential backoff for `attempt` (0-based) with up to 50% jitter."""
+    return min(cap, base * 2 ** attempt) * (1 + random.random() * 0.5)
+
+
+def _retry_after_seconds(response: Any, cap: float) -> float | None:
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return min(cap, max(0.0, float(value)))
+    except ValueError:
+        # HTTP-date form is rare from RunPod; fall back to our own backoff.
+        return None
+
+
+def post_with_retry(
+    session: Any,
+    url: str,
+    *,
+    json: Any,
+    headers: dict[str, str] | None = None,
+    timeout: float = 60,
+    max_retries: int = 3,
+    base: float = 1.0,
+    cap: float = 30.0,
+) -> Any:
+    """POST with backoff on connect-phase errors and 429/503.
+
+    ``session`` is a ``requests.Session`` or a client from :func:`make_client`.
+    Read timeouts, dropped connections and other 5xx are not retried: the
+    server may already have acted on the POST (e.g. enqueued a paid job).
+    Other 4xx responses (bad key, bad payload) raise immediately. Retry-After
+    is honoured when the server sends it.
+    """
+    # Encoded once, reused verbatim by every retry.
+    body = encode_json(json)
+    attempt = 0
+    while True:
+        response = None
+        try:
+            response = _post_json_body(session, url, body, timeout, headers)
+            if response.status_code in TRANSIENT_STATUS_CODES:
+                raise TransientHTTPError(f"HTTP {response.status_code} from {url}", response=response)
+            response.raise_for_status()
+            return response
+        except Exception as exc:
+            if not isinstance(exc, TransientHTTPError) and not _is_connect_error(exc):
+                raise
+            if attempt >= max_retries:
+                raise
+            delay = _retry_after_seconds(response, cap)
+            time.sleep(delay if delay is not None else retry_delay(attempt, base, cap))
+            attempt += 1
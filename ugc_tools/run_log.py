@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+from typing import Any, TextIO
+
+
+class RunLog:
+    """Print a message and append it to a per-run log file.
+
+    The file is opened once and line-buffered, so a killed or crashed run
+    keeps every line already logged. Safe to call from worker threads.
+    Assign ``path`` to switch files; the next line opens the new one.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._fh: TextIO | None = None
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def __call__(self, message: Any) -> None:
+        text = str(message)
+        print(text)
+        with self._lock:
+            if self._fh is None or self._fh.name != self.path:
+                self._close_locked()
+                try:
+                    self._fh = open(self.path, "a", encoding="utf-8", buffering=1)
+                except OSError:
+                    return
+            self._fh.write(text + "\n")
+
+    def reset(self) -> None:
+        """Delete the previous run's log; the next line starts a fresh file."""
+        with self._lock:
+            self._close_locked()
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
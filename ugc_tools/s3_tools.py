@@ -4,11 +4,13 @@ import argparse
 import csv
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import quote
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 
 from .env import load_env_default
 from .paths import repo_root
@@ -18,6 +20,14 @@ DEFAULT_BUCKET = "meli-ai.filmmaker"
 DEFAULT_PREFIX = "MP-Users/Assets"
 DEFAULT_REGION = "us-east-2"
 
+# Large .mov/.mp4 files go up as parallel 8 MiB parts.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
 
 def register_cli(subparsers: argparse._SubParsersAction) -> None:
     s3_parser = subparsers.add_parser("s3", help="S3 utilities")
@@ -44,6 +54,7 @@ def register_cli(subparsers: argparse._SubParsersAction) -> None:
     upload.add_argument("--recursive", action="store_true", help="Recurse into subfolders")
     upload.add_argument("--overwrite", action="store_true", help="Overwrite existing objects")
     upload.add_argument("--dry-run", action="store_true", help="Print actions only")
+    upload.add_argument("--workers", type=int, default=4, help="Files uploaded in parallel")
     upload.set_defaults(func=cmd_upload_folder)
 
 
@@ -103,13 +114,20 @@ def cmd_upload_folder(args: argparse.Namespace) -> int:
         aws_secret_access_key=os.environ.get("AWS_SECRET_ACCESS_KEY"),
     )
 
-    for path in files:
-        key = f"{args.prefix}/{path.name}"
-        if not args.overwrite and s3_exists(s3, args.bucket, key):
-            print(f"Skip existing: {path.name}")
-            continue
-        upload_file(s3, args.bucket, key, path)
-        print(f"Uploaded: {path.name}")
+    # One paged listing instead of a HEAD request per file.
+    existing = set() if args.overwrite else list_existing_keys(s3, args.bucket, f"{args.prefix}/")
+    # The boto3 client is thread-safe; each file is also split into parts by TRANSFER_CONFIG.
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        future_map = {}
+        for path in files:
+            key = f"{args.prefix}/{path.name}"
+            if key in existing:
+                print(f"Skip existing: {path.name}")
+                continue
+            future_map[executor.submit(upload_file, s3, args.bucket, key, path)] = path
+        for future in as_completed(future_map):
+            future.result()
+            print(f"Uploaded: {future_map[future].name}")
 
     return 0
 
@@ -228,12 +246,13 @@ def iter_files(folder: Path, recursive: bool, extensions: set[str]):
                 yield path
 
 
-def s3_exists(s3, bucket: str, key: str) -> bool:
-    try:
-        s3.head_object(Bucket=bucket, Key=key)
-        return True
-    except Exception:
-        return False
+def list_existing_keys(s3, bucket: str, prefix: str) -> set[str]:
+    paginator = s3.get_paginator("list_objects_v2")
+    return {
+        obj["Key"]
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix)
+        for obj in page.get("Contents", [])
+    }
 
 
 def upload_file(s3, bucket: str, key: str, local_path: Path) -> None:
@@ -248,6 +267,7 @@ def upload_file(s3, bucket: str, key: str, local_path: Path) -> None:
         bucket,
         key,
         ExtraArgs={"ContentType": content_type},
+        Config=TRANSFER_CONFIG,
     )
 
 
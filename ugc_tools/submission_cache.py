@@ -0,0 +1,96 @@
+"""Remember which RunPod payloads were already submitted.
+
+Each submit script keeps a JSON file mapping payload digest -> run id. A rerun
+skips any payload whose digest is in the file, so an interrupted batch can be
+restarted without queueing the same render twice. Set RUNPOD_FORCE_RESUBMIT=1
+(or delete the file) to submit everything again.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+
+FORCE_RESUBMIT_ENV = "RUNPOD_FORCE_RESUBMIT"
+
+
+def payload_digest(payload: dict[str, Any]) -> str:
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_submitted(path: Path) -> dict[str, str]:
+    """Return digest -> RunPod run id for payloads submitted by earlier runs."""
+    if os.environ.get(FORCE_RESUBMIT_ENV, "").strip().lower() in {"1", "true", "yes"}:
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_submitted(path: Path, submitted: dict[str, str]) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(submitted, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def submit_jobs(
+    jobs: Iterable[tuple[str, dict[str, Any]]],
+    submit: Callable[[dict[str, Any]], str],
+    path: Path,
+    log: Callable[[str], None] = print,
+    workers: int | None = None,
+) -> int:
+    """Submit (name, payload) jobs concurrently and return how many were sent.
+
+    Jobs with the same name and clip URLs are sent once, and payloads already
+    recorded in ``path`` are skipped. ``submit`` posts one payload and returns
+    its run id; a failure is logged and does not stop the other jobs. The
+    file is rewritten when the batch ends, even if it is interrupted.
+    """
+    seen_rows = set()
+    duplicates = 0
+    submitted_by_digest = load_submitted(path)
+    pending: dict[str, tuple[str, dict[str, Any]]] = {}
+    for name, payload in jobs:
+        fingerprint = (name, *(clip["url"] for clip in payload["input"]["clips"]))
+        if fingerprint in seen_rows:
+            duplicates += 1
+            continue
+        seen_rows.add(fingerprint)
+        digest = payload_digest(payload)
+        if digest in submitted_by_digest:
+            log(f"{name}: submitted {submitted_by_digest[digest]} (cached)")
+        else:
+            pending[digest] = (name, payload)
+    if duplicates:
+        log(f"Skipped {duplicates} duplicate rows")
+
+    if workers is None:
+        workers = int(os.environ.get("RUNPOD_WORKERS", "16"))
+    submitted = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        future_map = {
+            executor.submit(submit, payload): (digest, name)
+            for digest, (name, payload) in pending.items()
+        }
+        try:
+            for future in as_completed(future_map):
+                digest, name = future_map[future]
+                try:
+                    run_id = future.result()
+                except Exception as e:
+                    log(f"{name}: ERROR submitting job: {e}")
+                    continue
+                log(f"{name}: submitted {run_id}")
+                submitted_by_digest[digest] = run_id
+                submitted += 1
+        finally:
+            save_submitted(path, submitted_by_digest)
+    return submitted